@@ -0,0 +1,38 @@
+"""add assessment report snapshots
+
+Revision ID: dd0b93776f28
+Revises: 001_add_frameworks
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dd0b93776f28'
+down_revision: Union[str, None] = '001_add_frameworks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'assessment_report_snapshots',
+        sa.Column('assessment_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('schema_version', sa.Integer(), nullable=False),
+        sa.Column('framework_version', sa.String(length=50), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('report', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('assessment_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('assessment_report_snapshots')
@@ -0,0 +1,76 @@
+"""add score rollups
+
+Revision ID: 7fa6d7076600
+Revises: dd0b93776f28
+Create Date: 2026-10-17 09:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7fa6d7076600'
+down_revision: Union[str, None] = 'dd0b93776f28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'score_rollups',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('assessor_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('granularity', sa.String(length=10), nullable=False),
+        sa.Column('bucket_start', sa.Date(), nullable=False),
+        sa.Column('domain_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('score_sum', sa.Float(), nullable=False),
+        sa.Column('maturity_sum', sa.Integer(), nullable=False),
+        sa.Column('assessment_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['assessor_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['domain_id'], ['framework_domains.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'assessor_id', 'granularity', 'bucket_start', 'domain_id',
+            name='uq_score_rollup_bucket',
+            postgresql_nulls_not_distinct=True,
+        )
+    )
+
+    # Backfill from existing completed assessments; submit keeps the rollups current from here
+    for granularity in ('week', 'month', 'quarter'):
+        op.execute(f"""
+            INSERT INTO score_rollups
+                (id, assessor_id, granularity, bucket_start, domain_id,
+                 score_sum, maturity_sum, assessment_count)
+            SELECT gen_random_uuid(), a.assessor_id, '{granularity}',
+                   date_trunc('{granularity}', a.completed_at)::date, NULL,
+                   sum(a.overall_score), sum(coalesce(a.maturity_level, 0)), count(*)
+            FROM assessments a
+            WHERE a.status = 'COMPLETED'
+              AND a.completed_at IS NOT NULL
+              AND a.overall_score IS NOT NULL
+            GROUP BY a.assessor_id, date_trunc('{granularity}', a.completed_at)
+        """)
+        op.execute(f"""
+            INSERT INTO score_rollups
+                (id, assessor_id, granularity, bucket_start, domain_id,
+                 score_sum, maturity_sum, assessment_count)
+            SELECT gen_random_uuid(), a.assessor_id, '{granularity}',
+                   date_trunc('{granularity}', a.completed_at)::date, ds.domain_id,
+                   sum(ds.score), sum(ds.maturity_level), count(*)
+            FROM domain_scores ds
+            JOIN assessments a ON a.id = ds.assessment_id
+            WHERE a.status = 'COMPLETED'
+              AND a.completed_at IS NOT NULL
+              AND a.overall_score IS NOT NULL
+            GROUP BY a.assessor_id, date_trunc('{granularity}', a.completed_at), ds.domain_id
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table('score_rollups')
@@ -0,0 +1,50 @@
+"""add hot path indexes
+
+Revision ID: 74b99be92d4e
+Revises: 7fa6d7076600
+Create Date: 2026-10-17 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '74b99be92d4e'
+down_revision: Union[str, None] = '7fa6d7076600'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns). gate_responses.assessment_id is already served by the
+# uq_assessment_question unique index, which leads with assessment_id.
+INDEXES = [
+    ('ix_domain_scores_assessment_id', 'domain_scores', ['assessment_id']),
+    ('ix_framework_domains_framework_id', 'framework_domains', ['framework_id']),
+    ('ix_framework_gates_domain_id', 'framework_gates', ['domain_id']),
+    ('ix_framework_questions_gate_id', 'framework_questions', ['gate_id']),
+    ('ix_assessments_assessor_id_status', 'assessments', ['assessor_id', 'status']),
+    ('ix_assessments_assessor_id_created_at', 'assessments', ['assessor_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY avoids locking writes on large tables but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
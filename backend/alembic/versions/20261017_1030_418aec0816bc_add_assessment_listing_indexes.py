@@ -0,0 +1,69 @@
+"""add assessment listing indexes
+
+Revision ID: 418aec0816bc
+Revises: 74b99be92d4e
+Create Date: 2026-10-17 10:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '418aec0816bc'
+down_revision: Union[str, None] = '74b99be92d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keyset pagination orders by (created_at, id) within each filter
+NEW_INDEXES = [
+    ('ix_assessments_assessor_id_created_at_id', ['assessor_id', 'created_at', 'id']),
+    ('ix_assessments_assessor_id_status_created_at_id',
+     ['assessor_id', 'status', 'created_at', 'id']),
+    ('ix_assessments_assessor_id_framework_id_created_at_id',
+     ['assessor_id', 'framework_id', 'created_at', 'id']),
+    ('ix_assessments_assessor_id_lower_team_name',
+     ['assessor_id', sa.text('lower(team_name) text_pattern_ops')]),
+    ('ix_assessments_organization_id', ['organization_id']),
+]
+
+# Superseded by the (…, created_at, id) indexes above
+OLD_INDEXES = [
+    ('ix_assessments_assessor_id_status', ['assessor_id', 'status']),
+    ('ix_assessments_assessor_id_created_at', ['assessor_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in NEW_INDEXES:
+            op.create_index(
+                name, 'assessments', columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _ in OLD_INDEXES:
+            op.drop_index(
+                name, table_name='assessments',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in OLD_INDEXES:
+            op.create_index(
+                name, 'assessments', columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _ in reversed(NEW_INDEXES):
+            op.drop_index(
+                name, table_name='assessments',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
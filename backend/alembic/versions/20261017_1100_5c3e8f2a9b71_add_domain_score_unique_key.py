@@ -0,0 +1,49 @@
+"""add domain score unique key
+
+Revision ID: 5c3e8f2a9b71
+Revises: 418aec0816bc
+Create Date: 2026-10-17 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c3e8f2a9b71'
+down_revision: Union[str, None] = '418aec0816bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Domain scores are rewritten per assessment, so (assessment_id, domain_id) is already
+    # unique; the constraint lets bulk rescoring upsert them
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_domain_score_assessment_domain', 'domain_scores', ['assessment_id', 'domain_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.execute(
+            'ALTER TABLE domain_scores ADD CONSTRAINT uq_domain_score_assessment_domain '
+            'UNIQUE USING INDEX uq_domain_score_assessment_domain'
+        )
+        # Superseded by the unique index, which leads with assessment_id
+        op.drop_index(
+            'ix_domain_scores_assessment_id', table_name='domain_scores',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_domain_scores_assessment_id', 'domain_scores', ['assessment_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_constraint('uq_domain_score_assessment_domain', 'domain_scores', type_='unique')
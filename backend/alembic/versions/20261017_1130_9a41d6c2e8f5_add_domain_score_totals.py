@@ -0,0 +1,60 @@
+"""add domain score totals
+
+Revision ID: 9a41d6c2e8f5
+Revises: 5c3e8f2a9b71
+Create Date: 2026-10-17 11:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a41d6c2e8f5'
+down_revision: Union[str, None] = '5c3e8f2a9b71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'domain_score_totals',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('assessment_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('domain_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('answered', sa.Integer(), nullable=False),
+        sa.Column('max_total', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['domain_id'], ['framework_domains.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('assessment_id', 'domain_id', name='uq_domain_score_total'),
+    )
+
+    # Backfill from existing responses; saving responses keeps the totals current from here
+    op.execute("""
+        INSERT INTO domain_score_totals
+            (id, assessment_id, domain_id, total, answered, max_total)
+        SELECT gen_random_uuid(), gr.assessment_id, fg.domain_id,
+               sum(gr.score), count(*), max(dq.questions) * 5
+        FROM gate_responses gr
+        JOIN assessments a ON a.id = gr.assessment_id
+        JOIN framework_questions fq ON fq.id = gr.question_id
+        JOIN framework_gates fg ON fg.id = fq.gate_id
+        JOIN framework_domains fd ON fd.id = fg.domain_id AND fd.framework_id = a.framework_id
+        JOIN (
+            SELECT g.domain_id, count(*) AS questions
+            FROM framework_questions q
+            JOIN framework_gates g ON g.id = q.gate_id
+            GROUP BY g.domain_id
+        ) dq ON dq.domain_id = fg.domain_id
+        GROUP BY gr.assessment_id, fg.domain_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('domain_score_totals')
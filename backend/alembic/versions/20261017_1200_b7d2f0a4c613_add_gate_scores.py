@@ -0,0 +1,57 @@
+"""add gate scores
+
+Revision ID: b7d2f0a4c613
+Revises: 9a41d6c2e8f5
+Create Date: 2026-10-17 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f0a4c613'
+down_revision: Union[str, None] = '9a41d6c2e8f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'gate_scores',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('assessment_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('gate_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('answered', sa.Integer(), nullable=False),
+        sa.Column('max_total', sa.Integer(), nullable=False),
+        sa.Column('percentage', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['gate_id'], ['framework_gates.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('assessment_id', 'gate_id', name='uq_gate_score_assessment_gate'),
+    )
+
+    # Backfill completed assessments; submit writes gate scores from here on
+    op.execute("""
+        INSERT INTO gate_scores
+            (id, assessment_id, gate_id, total, answered, max_total, percentage)
+        SELECT gen_random_uuid(), gr.assessment_id, fq.gate_id,
+               sum(gr.score), count(*), count(*) * 5,
+               round(sum(gr.score) * 100.0 / (count(*) * 5), 2)
+        FROM gate_responses gr
+        JOIN assessments a ON a.id = gr.assessment_id
+        JOIN framework_questions fq ON fq.id = gr.question_id
+        JOIN framework_gates fg ON fg.id = fq.gate_id
+        JOIN framework_domains fd ON fd.id = fg.domain_id AND fd.framework_id = a.framework_id
+        WHERE a.status = 'COMPLETED'
+        GROUP BY gr.assessment_id, fq.gate_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('gate_scores')
@@ -0,0 +1,100 @@
+"""add score findings
+
+Revision ID: c5e19b7d3a28
+Revises: b7d2f0a4c613
+Create Date: 2026-10-17 12:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e19b7d3a28'
+down_revision: Union[str, None] = 'b7d2f0a4c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'score_findings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('assessment_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('domain_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('question_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('kind', sa.String(length=10), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['domain_id'], ['framework_domains.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['question_id'], ['framework_questions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('assessment_id', 'question_id', name='uq_score_finding_question'),
+    )
+    op.create_index(
+        'ix_score_findings_org_kind_question', 'score_findings',
+        ['organization_id', 'kind', 'question_id'],
+    )
+
+    # Backfill completed assessments with the rules of scoring_core.score_domains: scores
+    # >= 4 are strengths, <= 2 gaps, the first 5 of each per domain in framework order
+    op.execute("""
+        INSERT INTO score_findings
+            (id, assessment_id, organization_id, domain_id, question_id, kind, score)
+        SELECT gen_random_uuid(), assessment_id, organization_id, domain_id, question_id,
+               kind, score
+        FROM (
+            SELECT gr.assessment_id, a.organization_id, fg.domain_id, gr.question_id, gr.score,
+                   CASE WHEN gr.score >= 4 THEN 'strength' ELSE 'gap' END AS kind,
+                   row_number() OVER (
+                       PARTITION BY gr.assessment_id, fg.domain_id, gr.score >= 4
+                       ORDER BY fg."order", fq."order"
+                   ) AS position
+            FROM gate_responses gr
+            JOIN assessments a ON a.id = gr.assessment_id
+            JOIN framework_questions fq ON fq.id = gr.question_id
+            JOIN framework_gates fg ON fg.id = fq.gate_id
+            JOIN framework_domains fd
+                ON fd.id = fg.domain_id AND fd.framework_id = a.framework_id
+            WHERE a.status = 'COMPLETED' AND (gr.score >= 4 OR gr.score <= 2)
+        ) findings
+        WHERE position <= 5
+    """)
+
+    op.drop_column('domain_scores', 'strengths')
+    op.drop_column('domain_scores', 'gaps')
+
+
+def downgrade() -> None:
+    for column in ('strengths', 'gaps'):
+        op.add_column(
+            'domain_scores', sa.Column(column, postgresql.ARRAY(sa.String()), nullable=True)
+        )
+
+    # Render the findings back into the old "Gate - question...: Score n/5" strings
+    op.execute("""
+        UPDATE domain_scores ds
+        SET strengths = f.strengths, gaps = f.gaps
+        FROM (
+            SELECT sf.assessment_id, sf.domain_id,
+                   array_agg(fg.name || ' - ' || left(fq.text, 50) || '...: Score '
+                             || sf.score || '/5' ORDER BY fg."order", fq."order")
+                       FILTER (WHERE sf.kind = 'strength') AS strengths,
+                   array_agg(fg.name || ' - ' || left(fq.text, 50) || '...: Score '
+                             || sf.score || '/5' ORDER BY fg."order", fq."order")
+                       FILTER (WHERE sf.kind = 'gap') AS gaps
+            FROM score_findings sf
+            JOIN framework_questions fq ON fq.id = sf.question_id
+            JOIN framework_gates fg ON fg.id = fq.gate_id
+            GROUP BY sf.assessment_id, sf.domain_id
+        ) f
+        WHERE ds.assessment_id = f.assessment_id AND ds.domain_id = f.domain_id
+    """)
+
+    op.drop_index('ix_score_findings_org_kind_question', table_name='score_findings')
+    op.drop_table('score_findings')
@@ -0,0 +1,31 @@
+"""add snapshot framework fingerprint
+
+Revision ID: e4a7c1d95b20
+Revises: c5e19b7d3a28
+Create Date: 2026-10-17 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c1d95b20'
+down_revision: Union[str, None] = 'c5e19b7d3a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing snapshots get an empty fingerprint, so they are rebuilt on their next request
+    op.add_column(
+        'assessment_report_snapshots',
+        sa.Column('framework_fingerprint', sa.String(length=32), nullable=False, server_default=''),
+    )
+    op.alter_column('assessment_report_snapshots', 'framework_fingerprint', server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column('assessment_report_snapshots', 'framework_fingerprint')
@@ -1,61 +1,166 @@
 """Analytics API endpoints"""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import Literal, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import JSON, Numeric, cast, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
 from app.api.auth import get_current_user
+from app.config import settings
+from app.core import trends
+from app.core.cache import TTLCache
+from app.core.framework_index import get_framework_index
 from app.database import get_db
-from app.models import Assessment, AssessmentStatus, User
+from app.models import (
+    Assessment,
+    AssessmentStatus,
+    DomainScore,
+    FrameworkDomain,
+    GateScore,
+    User,
+)
 
 router = APIRouter()
 
+# Per-user summary cache (user_id -> summary dict)
+summary_cache = TTLCache(
+    max_size=settings.ANALYTICS_CACHE_SIZE, ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_analytics_summary(user_id: UUID) -> None:
+    """Drop a user's cached summary after their assessments change"""
+    summary_cache.invalidate(user_id)
+
+
+def _summary_query(user_id: UUID):
+    """Single statement returning all summary aggregates plus the per-domain breakdown"""
+    completed = Assessment.status == AssessmentStatus.COMPLETED
+
+    # Completed domain scores grouped by domain name
+    by_domain = (
+        select(
+            FrameworkDomain.name.label("domain"),
+            func.count(DomainScore.id).label("assessments"),
+            func.round(cast(func.avg(DomainScore.score), Numeric), 2).label("average_score"),
+        )
+        .join(DomainScore, DomainScore.domain_id == FrameworkDomain.id)
+        .join(Assessment, Assessment.id == DomainScore.assessment_id)
+        .where(Assessment.assessor_id == user_id, completed)
+        .group_by(FrameworkDomain.name)
+        .subquery()
+    )
+    by_domain_json = select(
+        func.json_object_agg(
+            by_domain.c.domain,
+            func.json_build_object(
+                literal_column("'assessments'"), by_domain.c.assessments,
+                literal_column("'average_score'"), by_domain.c.average_score,
+            ),
+            type_=JSON,
+        )
+    ).scalar_subquery()
+
+    return select(
+        func.count(Assessment.id),
+        func.count(Assessment.id).filter(completed),
+        func.avg(Assessment.overall_score).filter(completed),
+        func.avg(Assessment.maturity_level).filter(completed),
+        by_domain_json,
+    ).where(Assessment.assessor_id == user_id)
+
 
 @router.get("/summary", response_model=schemas.AnalyticsSummary)
 async def get_analytics_summary(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
     """Get overall analytics summary"""
+    summary = summary_cache.get(current_user.id)
+    if summary is not None:
+        return summary
 
-    # Total assessments
-    total_assessments = (
-        db.query(func.count(Assessment.id))
-        .filter(Assessment.assessor_id == current_user.id)
-        .scalar()
-    )
+    # Totals, completed count, averages and domain breakdown in one round trip
+    row = (await db.execute(_summary_query(current_user.id))).one()
+    total_assessments, completed_assessments, avg_score, avg_maturity, by_domain = row
+
+    summary = {
+        "total_assessments": total_assessments or 0,
+        "completed_assessments": completed_assessments or 0,
+        "average_score": round(float(avg_score or 0.0), 2),
+        "average_maturity_level": round(float(avg_maturity or 0.0), 2),
+        "assessments_by_domain": by_domain or {},
+    }
+    summary_cache.set(current_user.id, summary)
+
+    return summary
 
-    # Completed assessments
-    completed_assessments = (
-        db.query(func.count(Assessment.id))
-        .filter(
-            Assessment.assessor_id == current_user.id, Assessment.status == AssessmentStatus.COMPLETED
-        )
-        .scalar()
-    )
 
-    # Average score
-    avg_score = (
-        db.query(func.avg(Assessment.overall_score))
-        .filter(
-            Assessment.assessor_id == current_user.id, Assessment.status == AssessmentStatus.COMPLETED
+@router.get("/trends", response_model=schemas.AssessmentTrends)
+async def get_assessment_trends(
+    granularity: Literal["week", "month", "quarter"] = "month",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get overall and per-domain score trends bucketed by week, month or quarter"""
+    return await trends.get_trends(db, current_user.id, granularity, start, end)
+
+
+@router.get("/gates", response_model=schemas.GateComparison)
+async def get_gate_comparison(
+    framework_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Compare gate scores across teams, using each team's latest completed assessment"""
+    index = await get_framework_index(db, framework_id)
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Framework not found")
+
+    latest = (
+        select(Assessment.id, Assessment.team_name)
+        .where(
+            Assessment.assessor_id == current_user.id,
+            Assessment.framework_id == framework_id,
+            Assessment.status == AssessmentStatus.COMPLETED,
         )
-        .scalar()
-    ) or 0.0
-
-    # Average maturity level
-    avg_maturity = (
-        db.query(func.avg(Assessment.maturity_level))
-        .filter(
-            Assessment.assessor_id == current_user.id, Assessment.status == AssessmentStatus.COMPLETED
+        .distinct(Assessment.team_name)
+        .order_by(Assessment.team_name, Assessment.completed_at.desc())
+        .subquery()
+    )
+    # Precomputed gate scores; no responses are read
+    rows = (
+        await db.execute(
+            select(latest.c.team_name, GateScore.gate_id, GateScore.percentage)
+            .join(GateScore, GateScore.assessment_id == latest.c.id)
         )
-        .scalar()
-    ) or 0.0
+    ).all()
 
-    return {
-        "total_assessments": total_assessments or 0,
-        "completed_assessments": completed_assessments or 0,
-        "average_score": round(float(avg_score), 2),
-        "average_maturity_level": round(float(avg_maturity), 2),
-        "assessments_by_domain": {},  # TODO: Implement domain breakdown
-    }
+    by_gate = {}
+    teams = set()
+    for team_name, gate_id, percentage in rows:
+        by_gate.setdefault(gate_id, {})[team_name] = percentage
+        teams.add(team_name)
+
+    gates = []
+    for gate_id, gate in index.gates.items():  # Framework order
+        scores = by_gate.get(gate_id)
+        if not scores:
+            continue
+        values = list(scores.values())
+        gates.append(schemas.GateComparisonEntry(
+            gate_id=gate_id,
+            gate_name=gate.name,
+            domain=index.domains_by_id[gate.domain_id].name,
+            average_percentage=round(sum(values) / len(values), 2),
+            min_percentage=min(values),
+            max_percentage=max(values),
+            teams=dict(sorted(scores.items())),
+        ))
+
+    return schemas.GateComparison(framework_id=framework_id, teams=sorted(teams), gates=gates)
@@ -1,46 +1,119 @@
 """Assessment API endpoints"""
 
+import os
 from datetime import datetime
-from typing import List
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from io import BytesIO
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import case, delete, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
+from app.api.analytics import invalidate_analytics_summary
 from app.api.auth import get_current_user
-from app.core import scoring
+from app.config import settings
+from app.core import live_scores, report_export, report_snapshots, scoring, simulation, trends
+from app.core.framework_index import get_framework_index
+from app.core.pagination import decode_cursor, encode_cursor
 from app.database import get_db
-from app.models import Assessment, GateResponse, DomainScore, User, AssessmentStatus
+from app.models import (
+    Assessment,
+    AssessmentStatus,
+    DomainScore,
+    GateResponse,
+    GateScore,
+    ScoreFinding,
+    User,
+    UserRole,
+)
+from app.utils.pdf_render_pool import pdf_render_pool, stream_file
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[schemas.AssessmentResponse])
 async def list_assessments(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    order: Literal["asc", "desc"] = "desc",
+    status_filter: Optional[AssessmentStatus] = Query(None, alias="status"),
+    framework_id: Optional[UUID] = None,
+    organization_id: Optional[UUID] = None,
+    team_name: Optional[str] = Query(None, description="Case-insensitive team name prefix"),
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    max_score: Optional[float] = Query(None, ge=0, le=100),
+    maturity_level: Optional[int] = Query(None, ge=1, le=5),
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List all assessments for current user"""
-    assessments = (
-        db.query(Assessment)
-        .filter(Assessment.assessor_id == current_user.id)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    """
+    List assessments for current user, ordered by (created_at, id).
+
+    Pages are keyset based: pass the X-Next-Cursor header of one page as `cursor` to get the
+    next one (the header is absent on the last page). With `include_total`, X-Total-Count
+    carries the number of matching assessments, capped at ASSESSMENT_COUNT_CAP (then
+    X-Total-Count-Capped is set).
+    """
+    filters = [Assessment.assessor_id == current_user.id]
+    if status_filter is not None:
+        filters.append(Assessment.status == status_filter)
+    if framework_id is not None:
+        filters.append(Assessment.framework_id == framework_id)
+    if organization_id is not None:
+        filters.append(Assessment.organization_id == organization_id)
+    if team_name:
+        # Literal prefix pattern so the lower(team_name) pattern index applies
+        escaped = team_name.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        filters.append(func.lower(Assessment.team_name).like(f"{escaped}%", escape="\\"))
+    if min_score is not None:
+        filters.append(Assessment.overall_score >= min_score)
+    if max_score is not None:
+        filters.append(Assessment.overall_score <= max_score)
+    if maturity_level is not None:
+        filters.append(Assessment.maturity_level == maturity_level)
+
+    if include_total:
+        cap = settings.ASSESSMENT_COUNT_CAP
+        # Counting stops after cap + 1 rows, so the cost stays bounded on huge result sets
+        capped = select(Assessment.id).where(*filters).limit(cap + 1).subquery()
+        total = await db.scalar(select(func.count()).select_from(capped))
+        response.headers["X-Total-Count"] = str(min(total, cap))
+        if total > cap:
+            response.headers["X-Total-Count-Capped"] = "true"
+
+    stmt = select(Assessment).where(*filters)
+    key = tuple_(Assessment.created_at, Assessment.id)
+    if cursor is not None:
+        try:
+            after = tuple_(*decode_cursor(cursor))
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        stmt = stmt.where(key < after if order == "desc" else key > after)
+
+    if order == "desc":
+        stmt = stmt.order_by(Assessment.created_at.desc(), Assessment.id.desc())
+    else:
+        stmt = stmt.order_by(Assessment.created_at, Assessment.id)
+
+    # One extra row tells whether another page exists
+    assessments = (await db.scalars(stmt.limit(limit + 1))).all()
+    if len(assessments) > limit:
+        assessments = assessments[:limit]
+        last = assessments[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
     return assessments
 
 
 @router.post("/", response_model=schemas.AssessmentResponse, status_code=status.HTTP_201_CREATED)
 async def create_assessment(
     assessment_in: schemas.AssessmentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Create new assessment"""
@@ -54,20 +127,111 @@ async def create_assessment(
     )
 
     db.add(db_assessment)
-    db.commit()
-    db.refresh(db_assessment)
+    await db.commit()
+    await db.refresh(db_assessment)
+    invalidate_analytics_summary(current_user.id)
 
     return db_assessment
 
 
+@router.post("/reports/export")
+async def export_reports(
+    export_in: schemas.ReportExportRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Export the PDF reports of many completed assessments as one streamed ZIP archive.
+
+    Assessments are selected by `assessment_ids`, or by organization, framework and completion
+    date range. PDFs are added to the archive as they finish rendering; the X-Export-Job-Id
+    header names the job whose progress is served at /reports/export/{job_id}. Admins can
+    export any assessment, other users their own.
+    """
+    filters = [Assessment.status == AssessmentStatus.COMPLETED]
+    if current_user.role != UserRole.ADMIN:
+        filters.append(Assessment.assessor_id == current_user.id)
+
+    requested_ids = set(export_in.assessment_ids or ())
+    if requested_ids:
+        filters.append(Assessment.id.in_(requested_ids))
+    elif not any((
+        export_in.organization_id, export_in.framework_id,
+        export_in.completed_from, export_in.completed_to,
+    )):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Select assessments by assessment_ids or by a filter",
+        )
+    if export_in.organization_id is not None:
+        filters.append(Assessment.organization_id == export_in.organization_id)
+    if export_in.framework_id is not None:
+        filters.append(Assessment.framework_id == export_in.framework_id)
+    if export_in.completed_from is not None:
+        filters.append(Assessment.completed_at >= export_in.completed_from)
+    if export_in.completed_to is not None:
+        filters.append(Assessment.completed_at <= export_in.completed_to)
+
+    limit = settings.REPORT_EXPORT_MAX_ASSESSMENTS
+    rows = (
+        await db.execute(
+            select(Assessment.id, Assessment.team_name)
+            .where(*filters)
+            .order_by(Assessment.completed_at, Assessment.id)
+            .limit(limit + 1)
+        )
+    ).all()
+
+    if len(rows) > limit:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Exports are limited to {limit} assessments",
+        )
+    missing = requested_ids - {row.id for row in rows}
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Completed assessments not found: {', '.join(sorted(map(str, missing)))}",
+        )
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No completed assessments match"
+        )
+
+    items = [report_export.ExportItem(*row) for row in rows]
+    job = report_export.start_job(current_user.id, len(items))
+    filename = f"assessment-reports-{job.created_at:%Y%m%d-%H%M%S}.zip"
+
+    return StreamingResponse(
+        report_export.stream_export(job, items),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Export-Job-Id": str(job.id),
+        },
+    )
+
+
+@router.get("/reports/export/{job_id}", response_model=schemas.ReportExportStatus)
+async def get_export_status(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+):
+    """Progress of a batch report export started by the current user"""
+    job = report_export.get_job(job_id, current_user.id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not found")
+    return job.to_schema()
+
+
 @router.get("/{assessment_id}", response_model=schemas.AssessmentResponse)
 async def get_assessment(
     assessment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get specific assessment"""
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = await db.get(Assessment, assessment_id)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -82,11 +246,11 @@ async def get_assessment(
 async def update_assessment(
     assessment_id: UUID,
     assessment_update: schemas.AssessmentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update assessment"""
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = await db.get(Assessment, assessment_id)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -94,6 +258,8 @@ async def update_assessment(
     if assessment.assessor_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
+    was_rolled_up = trends.is_rolled_up(assessment)
+
     # Update fields
     if assessment_update.team_name is not None:
         assessment.team_name = assessment_update.team_name
@@ -102,8 +268,16 @@ async def update_assessment(
 
     assessment.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(assessment)
+    # Status changes move a scored assessment in or out of the trend rollups
+    if trends.is_rolled_up(assessment) != was_rolled_up:
+        await trends.apply_rollup(db, assessment, sign=-1 if was_rolled_up else 1)
+
+    # Stored report embeds the assessment details
+    await report_snapshots.invalidate_report_snapshot(db, assessment_id)
+
+    await db.commit()
+    await db.refresh(assessment)
+    invalidate_analytics_summary(current_user.id)
 
     return assessment
 
@@ -111,11 +285,11 @@ async def update_assessment(
 @router.delete("/{assessment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_assessment(
     assessment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Delete assessment"""
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = await db.get(Assessment, assessment_id)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -123,8 +297,12 @@ async def delete_assessment(
     if assessment.assessor_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
-    db.delete(assessment)
-    db.commit()
+    if trends.is_rolled_up(assessment):
+        await trends.apply_rollup(db, assessment, sign=-1)
+
+    await db.delete(assessment)
+    await db.commit()
+    invalidate_analytics_summary(current_user.id)
 
     return None
 
@@ -133,11 +311,12 @@ async def delete_assessment(
 async def save_responses(
     assessment_id: UUID,
     responses_in: schemas.GateResponseBulkCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Save or update gate responses"""
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    # Row lock serializes saves of one assessment, keeping the running totals consistent
+    assessment = await db.get(Assessment, assessment_id, with_for_update=True)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -145,48 +324,76 @@ async def save_responses(
     if assessment.assessor_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
+    # Last write wins for duplicate question IDs within one request
+    response_rows = {}
+    now = datetime.utcnow()
+    for response_data in responses_in.responses:
+        response_rows[response_data.question_id] = {
+            # Python-side column defaults do not apply to an INSERT inside a CTE
+            "id": func.gen_random_uuid(),
+            "assessment_id": assessment_id,
+            "question_id": response_data.question_id,
+            "score": response_data.score,
+            "notes": response_data.notes,
+            "evidence": response_data.evidence,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     saved_responses = []
 
-    for response_data in responses_in.responses:
-        # Check if response already exists
-        existing_response = (
-            db.query(GateResponse)
-            .filter(
+    if response_rows:
+        # One statement: previous scores, INSERT ... ON CONFLICT DO UPDATE ... RETURNING for
+        # the whole batch, the running domain totals and the assessment's status. Every part
+        # reads the snapshot taken after the row lock above, so the previous scores are current.
+        previous = (
+            select(GateResponse.question_id, GateResponse.score)
+            .where(
                 GateResponse.assessment_id == assessment_id,
-                GateResponse.question_id == response_data.question_id,
+                GateResponse.question_id.in_(list(response_rows)),
             )
-            .first()
+            .cte("previous")
         )
-
-        if existing_response:
-            # Update existing response
-            existing_response.score = response_data.score
-            existing_response.notes = response_data.notes
-            existing_response.evidence = response_data.evidence
-            existing_response.updated_at = datetime.utcnow()
-            saved_responses.append(existing_response)
-        else:
-            # Create new response
-            db_response = GateResponse(
-                assessment_id=assessment_id,
-                question_id=response_data.question_id,
-                score=response_data.score,
-                notes=response_data.notes,
-                evidence=response_data.evidence,
+        stmt = pg_insert(GateResponse).values(list(response_rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_assessment_question",
+            set_={
+                "score": stmt.excluded.score,
+                "notes": stmt.excluded.notes,
+                "evidence": stmt.excluded.evidence,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        saved = stmt.returning(*GateResponse.__table__.columns).cte("saved")
+        totals = live_scores.response_changes_upsert(
+            assessment_id, assessment.framework_id, previous, saved, now
+        ).cte("totals")
+        # updated_at also versions the cached response vectors used by simulations
+        touched = (
+            update(Assessment)
+            .where(Assessment.id == assessment_id)
+            .values(
+                status=case(
+                    (
+                        Assessment.status == AssessmentStatus.DRAFT,
+                        literal(AssessmentStatus.IN_PROGRESS, Assessment.status.type),
+                    ),
+                    else_=Assessment.status,
+                ),
+                updated_at=now,
             )
-            db.add(db_response)
-            saved_responses.append(db_response)
-
-    # Update assessment status to in_progress if it was draft
-    if assessment.status == AssessmentStatus.DRAFT:
+            .cte("touched")
+        )
+        saved_responses = [
+            schemas.GateResponseData.model_validate(dict(row))
+            for row in (await db.execute(select(saved).add_cte(totals, touched))).mappings()
+        ]
+    elif assessment.status == AssessmentStatus.DRAFT:
+        # Update assessment status to in_progress if it was draft
         assessment.status = AssessmentStatus.IN_PROGRESS
-        assessment.updated_at = datetime.utcnow()
-
-    db.commit()
+        assessment.updated_at = now
 
-    # Refresh all responses
-    for response in saved_responses:
-        db.refresh(response)
+    await db.commit()
 
     return saved_responses
 
@@ -194,11 +401,11 @@ async def save_responses(
 @router.get("/{assessment_id}/responses", response_model=List[schemas.GateResponseData])
 async def get_responses(
     assessment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get all gate responses for an assessment"""
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = await db.get(Assessment, assessment_id)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -207,22 +414,79 @@ async def get_responses(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     responses = (
-        db.query(GateResponse)
-        .filter(GateResponse.assessment_id == assessment_id)
-        .all()
-    )
+        await db.scalars(select(GateResponse).where(GateResponse.assessment_id == assessment_id))
+    ).all()
 
     return responses
 
 
+@router.get("/{assessment_id}/score", response_model=schemas.LiveScore)
+async def get_live_score(
+    assessment_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Current scores of an assessment, updated as responses are saved"""
+    assessment = await db.get(Assessment, assessment_id)
+
+    if not assessment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
+
+    if assessment.assessor_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+    index = await get_framework_index(db, assessment.framework_id)
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Framework not found")
+
+    # Running totals plus the cached framework index; no responses are read
+    totals = await live_scores.load_domain_totals(db, assessment_id)
+
+    return live_scores.live_score(assessment_id, index, totals)
+
+
+@router.post("/{assessment_id}/simulate", response_model=schemas.SimulationResponse)
+async def simulate_scores(
+    assessment_id: UUID,
+    request: schemas.SimulationRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Scores under hypothetical response changes; nothing is written"""
+    if len(request.scenarios) > settings.SIMULATION_MAX_SCENARIOS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.SIMULATION_MAX_SCENARIOS} scenarios per request",
+        )
+
+    assessment = await db.get(Assessment, assessment_id)
+
+    if not assessment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
+
+    if assessment.assessor_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+    index = await get_framework_index(db, assessment.framework_id)
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Framework not found")
+
+    # Cached framework index and response vector; scenarios are scored in memory
+    responses = await simulation.get_response_vector(db, assessment)
+    try:
+        return simulation.simulate(assessment_id, index, responses, request.scenarios)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.post("/{assessment_id}/submit", response_model=schemas.AssessmentResponse)
 async def submit_assessment(
     assessment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Submit assessment for scoring"""
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = await db.get(Assessment, assessment_id)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -231,7 +495,9 @@ async def submit_assessment(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
     # Get all gate responses
-    gate_responses = db.query(GateResponse).filter(GateResponse.assessment_id == assessment_id).all()
+    gate_responses = (
+        await db.scalars(select(GateResponse).where(GateResponse.assessment_id == assessment_id))
+    ).all()
 
     if not gate_responses:
         raise HTTPException(
@@ -239,26 +505,46 @@ async def submit_assessment(
             detail="Assessment must have at least one gate response",
         )
 
-    # Calculate scores using the new dynamic scoring
-    domain_score_data = scoring.calculate_scores(db, assessment, gate_responses)
+    # Scored from the responses themselves; the running totals only serve live scores
+    domain_score_data = await scoring.calculate_scores(db, assessment, gate_responses)
 
     overall_score = scoring.calculate_overall_score(db, assessment, domain_score_data)
     maturity_level, _ = scoring.get_maturity_level(overall_score)
 
     # Delete existing domain scores
-    db.query(DomainScore).filter(DomainScore.assessment_id == assessment_id).delete()
+    old_domain_scores = (
+        await db.execute(
+            delete(DomainScore)
+            .where(DomainScore.assessment_id == assessment_id)
+            .returning(DomainScore.domain_id, DomainScore.score, DomainScore.maturity_level)
+        )
+    ).all()
+
+    # Remove the previous submission from the trend rollups
+    if trends.is_rolled_up(assessment):
+        await trends.apply_rollup(db, assessment, old_domain_scores, sign=-1)
+
+    # Replace the gate scores of the previous submission
+    await db.execute(delete(GateScore).where(GateScore.assessment_id == assessment_id))
+    gate_scores = await scoring.calculate_gate_scores(db, assessment, gate_responses)
+    db.add_all(gate_scores)
 
     # Create new domain score records
+    db_domain_scores = []
     for domain_id, score_info in domain_score_data.items():
         db_domain_score = DomainScore(
             assessment_id=assessment_id,
             domain_id=domain_id,
             score=score_info["score"],
             maturity_level=score_info["maturity_level"],
-            strengths=score_info.get("strengths", []),
-            gaps=score_info.get("gaps", []),
         )
         db.add(db_domain_score)
+        db_domain_scores.append(db_domain_score)
+
+    # Strengths and gaps as (question, score) references
+    await db.execute(delete(ScoreFinding).where(ScoreFinding.assessment_id == assessment_id))
+    findings = scoring.build_score_findings(assessment, domain_score_data)
+    db.add_all(findings)
 
     # Update assessment
     assessment.overall_score = overall_score
@@ -267,8 +553,23 @@ async def submit_assessment(
     assessment.completed_at = datetime.utcnow()
     assessment.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(assessment)
+    # Add this submission to the trend rollups
+    await trends.apply_rollup(
+        db,
+        assessment,
+        [(domain_id, info["score"], info["maturity_level"])
+         for domain_id, info in domain_score_data.items()],
+    )
+
+    # Build the full report once and persist it with the scores
+    report = await scoring.generate_report(
+        db, assessment, gate_scores, db_domain_scores, findings
+    )
+    await report_snapshots.store_report_snapshot(db, assessment, report)
+
+    await db.commit()
+    await db.refresh(assessment)
+    invalidate_analytics_summary(current_user.id)
 
     return assessment
 
@@ -276,11 +577,11 @@ async def submit_assessment(
 @router.get("/{assessment_id}/report", response_model=schemas.AssessmentReport)
 async def get_assessment_report(
     assessment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Generate assessment report"""
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = await db.get(Assessment, assessment_id)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -294,26 +595,20 @@ async def get_assessment_report(
             detail="Assessment must be completed to generate report",
         )
 
-    # Get gate responses and domain scores
-    gate_responses = db.query(GateResponse).filter(GateResponse.assessment_id == assessment_id).all()
-    domain_scores = db.query(DomainScore).filter(DomainScore.assessment_id == assessment_id).all()
+    # Serve the snapshot stored at submit time as-is
+    snapshot = await report_snapshots.get_report_snapshot(db, assessment)
 
-    # Generate report
-    report = scoring.generate_report(db, assessment, gate_responses, domain_scores)
-
-    return report
+    return Response(content=snapshot.report_json, media_type="application/json")
 
 
 @router.get("/{assessment_id}/report/pdf")
 async def download_pdf_report(
     assessment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Download assessment report as PDF"""
-    from app.utils.pdf_generator import PDFReportGenerator
-
-    assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    assessment = await db.get(Assessment, assessment_id)
 
     if not assessment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found")
@@ -327,29 +622,18 @@ async def download_pdf_report(
             detail="Assessment must be completed to generate PDF report",
         )
 
-    # Get gate responses and domain scores
-    gate_responses = db.query(GateResponse).filter(GateResponse.assessment_id == assessment_id).all()
-    domain_scores = db.query(DomainScore).filter(DomainScore.assessment_id == assessment_id).all()
-
-    # Generate report data
-    report = scoring.generate_report(db, assessment, gate_responses, domain_scores)
-
-    # Convert Pydantic model to dict for PDF generator
-    report_dict = report.model_dump()
-
-    # Generate PDF
-    pdf_generator = PDFReportGenerator()
-    pdf_bytes = pdf_generator.generate(report_dict)
+    # Render from the stored snapshot, or reuse the cached file for an unchanged report
+    snapshot = await report_snapshots.get_report_snapshot(db, assessment)
+    # Streamed from an open handle, which stays readable if the cache evicts the file
+    pdf = await pdf_render_pool.open(snapshot.report_json, key=snapshot.content_hash)
 
-    # Create safe filename
-    safe_team_name = "".join(c for c in assessment.team_name if c.isalnum() or c in (' ', '-', '_')).strip()
-    safe_team_name = safe_team_name.replace(' ', '-')
-    filename = f"assessment-{safe_team_name}-{assessment_id}.pdf"
+    filename = report_export.pdf_filename(assessment.team_name, assessment_id)
 
     return StreamingResponse(
-        BytesIO(pdf_bytes),
+        stream_file(pdf),
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f'attachment; filename="{filename}"'
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(os.fstat(pdf.fileno()).st_size),
         }
     )
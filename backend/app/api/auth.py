@@ -1,24 +1,45 @@
 """Authentication API endpoints"""
 
+import math
 from datetime import timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
 from app.config import settings
-from app.core import security
+from app.core import metrics, security, user_cache
+from app.core.rate_limit import TokenBucketLimiter
 from app.database import get_db
 from app.models import User, UserRole
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Login attempt limits, checked before any password work is done
+login_account_limiter = TokenBucketLimiter(
+    burst=settings.LOGIN_ACCOUNT_BURST, per_minute=settings.LOGIN_ACCOUNT_PER_MINUTE
+)
+login_ip_limiter = TokenBucketLimiter(
+    burst=settings.LOGIN_IP_BURST, per_minute=settings.LOGIN_IP_PER_MINUTE
+)
+
+
+def _too_many_requests(reason: str, retry_after: float) -> HTTPException:
+    """429 for a shed login/hashing request"""
+    metrics.login_rejections_total.inc(reason=reason)
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many login attempts, try again later",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
 
 async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)], db: Session = Depends(get_db)
+    token: Annotated[str, Depends(oauth2_scheme)], db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current authenticated user"""
     credentials_exception = HTTPException(
@@ -31,21 +52,46 @@ async def get_current_user(
     if email is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == email).first()
+    # Version is read before the lookup so a concurrent invalidation wins
+    version = user_cache.user_version(email)
+    user = user_cache.get_cached_user(email, version)
     if user is None:
-        raise credentials_exception
+        user = await db.scalar(select(User).where(User.email == email))
+        if user is None:
+            raise credentials_exception
+        user_cache.cache_user(user, version)
+
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
 
     return user
 
 
 @router.post("/login", response_model=schemas.Token)
 async def login(
-    form_data: Annotated[OAuth2PasswordRequestForm, Depends()], db: Session = Depends(get_db)
+    request: Request,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    db: AsyncSession = Depends(get_db),
 ):
     """Login endpoint - returns JWT token"""
-    user = db.query(User).filter(User.email == form_data.username).first()
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = login_ip_limiter.acquire(client_ip)
+    if retry_after:
+        raise _too_many_requests("ip", retry_after)
+    retry_after = login_account_limiter.acquire(form_data.username.lower())
+    if retry_after:
+        raise _too_many_requests("account", retry_after)
+
+    user = await db.scalar(select(User).where(User.email == form_data.username))
+
+    try:
+        password_ok = user is not None and await security.verify_password_async(
+            form_data.password, user.hashed_password
+        )
+    except security.PasswordHashingBusyError:
+        raise _too_many_requests("busy", 1)
 
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -66,7 +112,7 @@ async def login(
 @router.post("/register", response_model=schemas.UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_in: schemas.UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Register new user (admin only)"""
@@ -74,14 +120,17 @@ async def register(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_in.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_in.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
     # Create new user
-    hashed_password = security.get_password_hash(user_in.password)
+    try:
+        hashed_password = await security.get_password_hash_async(user_in.password)
+    except security.PasswordHashingBusyError:
+        raise _too_many_requests("busy", 1)
     db_user = User(
         email=user_in.email,
         full_name=user_in.full_name,
@@ -91,8 +140,8 @@ async def register(
     )
 
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
 
     return db_user
 
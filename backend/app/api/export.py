@@ -0,0 +1,162 @@
+"""Data export API endpoints - responses and scores streamed as CSV or NDJSON"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+
+from app.api.auth import get_current_user
+from app.core import data_export
+from app.core.data_export import ExportFormat
+from app.models import (
+    Assessment,
+    AssessmentStatus,
+    DomainScore,
+    FrameworkDomain,
+    FrameworkGate,
+    FrameworkQuestion,
+    GateResponse,
+    User,
+    UserRole,
+)
+
+router = APIRouter()
+
+
+def _assessment_filters(
+    current_user: User,
+    framework_id: Optional[UUID],
+    organization_id: Optional[UUID],
+    completed_from: Optional[datetime],
+    completed_to: Optional[datetime],
+) -> List:
+    """Assessment filters of an export; admins export every assessment, other users their own"""
+    filters = []
+    if current_user.role != UserRole.ADMIN:
+        filters.append(Assessment.assessor_id == current_user.id)
+    if framework_id is not None:
+        filters.append(Assessment.framework_id == framework_id)
+    if organization_id is not None:
+        filters.append(Assessment.organization_id == organization_id)
+    if completed_from is not None:
+        filters.append(Assessment.completed_at >= completed_from)
+    if completed_to is not None:
+        filters.append(Assessment.completed_at <= completed_to)
+    return filters
+
+
+def _export_response(
+    name: str, query: Select, export_format: ExportFormat, compress: bool
+) -> StreamingResponse:
+    filename = data_export.filename(name, export_format, compress)
+    return StreamingResponse(
+        data_export.stream_query(query, export_format, compress),
+        media_type=data_export.media_type(export_format, compress),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/responses")
+async def export_responses(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    gzip: bool = False,
+    framework_id: Optional[UUID] = None,
+    organization_id: Optional[UUID] = None,
+    status_filter: Optional[AssessmentStatus] = Query(None, alias="status"),
+    completed_from: Optional[datetime] = None,
+    completed_to: Optional[datetime] = None,
+    updated_since: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream every gate response with its question, gate and domain as CSV or NDJSON.
+
+    Rows come off a server-side cursor in (assessment, question) index order, so the first
+    rows are sent before the query finishes and memory stays flat for any export size.
+    `updated_since` selects responses changed since an earlier export.
+    """
+    filters = _assessment_filters(
+        current_user, framework_id, organization_id, completed_from, completed_to
+    )
+    if status_filter is not None:
+        filters.append(Assessment.status == status_filter)
+    if updated_since is not None:
+        filters.append(GateResponse.updated_at >= updated_since)
+
+    query = (
+        select(
+            GateResponse.assessment_id,
+            Assessment.team_name,
+            Assessment.organization_id,
+            Assessment.framework_id,
+            Assessment.status,
+            Assessment.completed_at,
+            FrameworkDomain.id.label("domain_id"),
+            FrameworkDomain.name.label("domain"),
+            FrameworkGate.id.label("gate_id"),
+            FrameworkGate.name.label("gate"),
+            GateResponse.question_id,
+            FrameworkQuestion.text.label("question"),
+            GateResponse.score,
+            GateResponse.notes,
+            GateResponse.evidence,
+            GateResponse.updated_at,
+        )
+        .join(Assessment, Assessment.id == GateResponse.assessment_id)
+        .join(FrameworkQuestion, FrameworkQuestion.id == GateResponse.question_id)
+        .join(FrameworkGate, FrameworkGate.id == FrameworkQuestion.gate_id)
+        .join(FrameworkDomain, FrameworkDomain.id == FrameworkGate.domain_id)
+        .where(*filters)
+        .order_by(GateResponse.assessment_id, GateResponse.question_id)
+    )
+    return _export_response("responses", query, export_format, gzip)
+
+
+@router.get("/scores")
+async def export_scores(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    gzip: bool = False,
+    framework_id: Optional[UUID] = None,
+    organization_id: Optional[UUID] = None,
+    completed_from: Optional[datetime] = None,
+    completed_to: Optional[datetime] = None,
+    updated_since: Optional[datetime] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream the stored domain scores of completed assessments as CSV or NDJSON.
+
+    One row per assessment and domain, with the assessment's overall score and level,
+    streamed from a server-side cursor like the responses export.
+    """
+    filters = _assessment_filters(
+        current_user, framework_id, organization_id, completed_from, completed_to
+    )
+    if updated_since is not None:
+        filters.append(DomainScore.updated_at >= updated_since)
+
+    query = (
+        select(
+            DomainScore.assessment_id,
+            Assessment.team_name,
+            Assessment.organization_id,
+            Assessment.framework_id,
+            Assessment.completed_at,
+            Assessment.overall_score,
+            Assessment.maturity_level.label("overall_maturity_level"),
+            DomainScore.domain_id,
+            FrameworkDomain.name.label("domain"),
+            FrameworkDomain.weight,
+            DomainScore.score,
+            DomainScore.maturity_level,
+            DomainScore.updated_at,
+        )
+        .join(Assessment, Assessment.id == DomainScore.assessment_id)
+        .join(FrameworkDomain, FrameworkDomain.id == DomainScore.domain_id)
+        .where(Assessment.status == AssessmentStatus.COMPLETED, *filters)
+        .order_by(DomainScore.assessment_id, DomainScore.domain_id)
+    )
+    return _export_response("scores", query, export_format, gzip)
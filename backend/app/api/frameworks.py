@@ -1,15 +1,20 @@
 """Framework API endpoints"""
 
-from typing import List, Any
+import asyncio
+from typing import List, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
+from app.api.analytics import summary_cache
 from app.api.auth import get_current_user
+from app.core import rescoring
+from app.core.framework_index import get_framework_structure_json
 from app.database import get_db
-from app.models import Framework, FrameworkDomain, FrameworkGate, FrameworkQuestion, User
+from app.models import Framework, User, UserRole
 
 router = APIRouter()
 
@@ -17,55 +22,70 @@ router = APIRouter()
 async def list_frameworks(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List all available frameworks"""
-    frameworks = db.query(Framework).offset(skip).limit(limit).all()
+    frameworks = (await db.scalars(select(Framework).offset(skip).limit(limit))).all()
     return frameworks
 
 @router.get("/{framework_id}", response_model=schemas.FrameworkResponse)
 async def get_framework(
     framework_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get specific framework details"""
-    framework = db.query(Framework).filter(Framework.id == framework_id).first()
+    framework = await db.get(Framework, framework_id)
     if not framework:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Framework not found")
     return framework
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for this header)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
 @router.get("/{framework_id}/structure", response_model=schemas.FrameworkStructure)
 async def get_framework_structure(
     framework_id: UUID,
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get complete framework structure (domains, gates, questions)"""
-    framework = db.query(Framework).filter(Framework.id == framework_id).first()
-    if not framework:
+    # Pre-serialized and ETagged; cache hits (and 304s) never touch the database
+    structure = await get_framework_structure_json(db, framework_id)
+    if structure is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Framework not found")
 
-    # Fetch domains with nested gates and questions
-    domains = (
-        db.query(FrameworkDomain)
-        .filter(FrameworkDomain.framework_id == framework_id)
-        .order_by(FrameworkDomain.order)
-        .options(
-            joinedload(FrameworkDomain.gates)
-            .joinedload(FrameworkGate.questions)
-        )
-        .all()
-    )
-
-    # Sort gates and questions manually if order_by in query isn't sufficient for nested rels
-    for domain in domains:
-        domain.gates.sort(key=lambda x: x.order)
-        for gate in domain.gates:
-            gate.questions.sort(key=lambda x: x.order)
-
-    return schemas.FrameworkStructure(
-        framework=framework,
-        domains=domains
-    )
+    headers = {"ETag": structure.etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, structure.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=structure.body, media_type="application/json", headers=headers)
+
+
+@router.post("/{framework_id}/rescore", response_model=schemas.RescoreSummary)
+async def rescore_framework(
+    framework_id: UUID,
+    dry_run: bool = Query(True, description="Only report score deltas"),
+    current_user: User = Depends(get_current_user),
+):
+    """Recompute stored scores of all completed assessments of a framework (admin only)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+
+    # Scoring is CPU-bound; a worker thread with its own session keeps the event loop free
+    summary = await asyncio.to_thread(rescoring.run_rescore, framework_id, dry_run)
+    if summary is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Framework not found")
+
+    if not dry_run:
+        # Any assessor's averages may have moved
+        summary_cache.clear()
+
+    return summary
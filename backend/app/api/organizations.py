@@ -1,15 +1,32 @@
 """Organization API endpoints"""
 
-from typing import List
+import os
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
 from app.api.auth import get_current_user
+from app.core import org_report
+from app.core.framework_index import get_framework_index
+from app.core.report_export import safe_filename_part
 from app.database import get_db
-from app.models import Organization, User, UserRole
+from app.models import (
+    Assessment,
+    AssessmentStatus,
+    FrameworkDomain,
+    FrameworkGate,
+    FrameworkQuestion,
+    Organization,
+    ScoreFinding,
+    User,
+    UserRole,
+)
+from app.utils.pdf_render_pool import pdf_render_pool, stream_file
 
 router = APIRouter()
 
@@ -18,21 +35,21 @@ router = APIRouter()
 async def list_organizations(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List all organizations (admin only)"""
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    organizations = db.query(Organization).offset(skip).limit(limit).all()
+    organizations = (await db.scalars(select(Organization).offset(skip).limit(limit))).all()
     return organizations
 
 
 @router.post("/", response_model=schemas.OrganizationResponse, status_code=status.HTTP_201_CREATED)
 async def create_organization(
     organization_in: schemas.OrganizationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Create new organization (admin only)"""
@@ -47,8 +64,8 @@ async def create_organization(
     )
 
     db.add(db_organization)
-    db.commit()
-    db.refresh(db_organization)
+    await db.commit()
+    await db.refresh(db_organization)
 
     return db_organization
 
@@ -56,11 +73,11 @@ async def create_organization(
 @router.get("/{organization_id}", response_model=schemas.OrganizationResponse)
 async def get_organization(
     organization_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get specific organization"""
-    organization = db.query(Organization).filter(Organization.id == organization_id).first()
+    organization = await db.get(Organization, organization_id)
 
     if not organization:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
@@ -76,14 +93,14 @@ async def get_organization(
 async def update_organization(
     organization_id: UUID,
     organization_update: schemas.OrganizationUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update organization (admin only)"""
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    organization = db.query(Organization).filter(Organization.id == organization_id).first()
+    organization = await db.get(Organization, organization_id)
 
     if not organization:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
@@ -96,8 +113,8 @@ async def update_organization(
     if organization_update.size is not None:
         organization.size = organization_update.size
 
-    db.commit()
-    db.refresh(organization)
+    await db.commit()
+    await db.refresh(organization)
 
     return organization
 
@@ -105,19 +122,148 @@ async def update_organization(
 @router.delete("/{organization_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_organization(
     organization_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Delete organization (admin only)"""
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    organization = db.query(Organization).filter(Organization.id == organization_id).first()
+    organization = await db.get(Organization, organization_id)
 
     if not organization:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
 
-    db.delete(organization)
-    db.commit()
+    await db.delete(organization)
+    await db.commit()
 
     return None
+
+
+@router.get("/{organization_id}/common-gaps", response_model=List[schemas.CommonGap])
+async def get_common_gaps(
+    organization_id: UUID,
+    framework_id: Optional[UUID] = None,
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Questions most often identified as gaps across the organization's completed assessments"""
+    if current_user.role != UserRole.ADMIN and current_user.organization_id != organization_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+    filters = [
+        ScoreFinding.organization_id == organization_id,
+        ScoreFinding.kind == "gap",
+        Assessment.status == AssessmentStatus.COMPLETED,
+    ]
+    if framework_id is not None:
+        filters.append(Assessment.framework_id == framework_id)
+
+    # Aggregate the (organization_id, kind, question_id) index range, then describe the top rows
+    count = func.count().label("assessments")
+    top = (
+        select(
+            ScoreFinding.question_id,
+            count,
+            func.avg(ScoreFinding.score).label("average_score"),
+        )
+        .join(Assessment, Assessment.id == ScoreFinding.assessment_id)
+        .where(*filters)
+        .group_by(ScoreFinding.question_id)
+        .order_by(count.desc(), ScoreFinding.question_id)
+        .limit(limit)
+        .subquery()
+    )
+    rows = (
+        await db.execute(
+            select(
+                top.c.question_id,
+                FrameworkQuestion.text,
+                FrameworkGate.name,
+                FrameworkDomain.name,
+                FrameworkDomain.framework_id,
+                top.c.assessments,
+                top.c.average_score,
+            )
+            .join(FrameworkQuestion, FrameworkQuestion.id == top.c.question_id)
+            .join(FrameworkGate, FrameworkGate.id == FrameworkQuestion.gate_id)
+            .join(FrameworkDomain, FrameworkDomain.id == FrameworkGate.domain_id)
+            .order_by(top.c.assessments.desc(), top.c.question_id)
+        )
+    ).all()
+
+    return [
+        schemas.CommonGap(
+            question_id=question_id,
+            question_text=text,
+            gate_name=gate_name,
+            domain=domain,
+            framework_id=gap_framework_id,
+            assessments=assessments,
+            average_score=round(float(average_score), 2),
+        )
+        for question_id, text, gate_name, domain, gap_framework_id, assessments, average_score
+        in rows
+    ]
+
+
+async def _organization_report(
+    db: AsyncSession, organization_id: UUID, framework_id: UUID, current_user: User
+) -> schemas.OrganizationReport:
+    if current_user.role != UserRole.ADMIN and current_user.organization_id != organization_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+
+    organization = await db.get(Organization, organization_id)
+    if not organization:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
+
+    index = await get_framework_index(db, framework_id)
+    if index is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Framework not found")
+
+    report = await org_report.build_organization_report(db, organization, index)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No completed assessments of this framework in the organization",
+        )
+    return report
+
+
+@router.get("/{organization_id}/report", response_model=schemas.OrganizationReport)
+async def get_organization_report(
+    organization_id: UUID,
+    framework_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Consolidated report of each team's latest completed assessment of a framework"""
+    return await _organization_report(db, organization_id, framework_id, current_user)
+
+
+@router.get("/{organization_id}/report/pdf")
+async def download_organization_pdf_report(
+    organization_id: UUID,
+    framework_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Download the consolidated organization report as PDF"""
+    report = await _organization_report(db, organization_id, framework_id, current_user)
+
+    # Cached by content, so an unchanged organization is rendered once
+    pdf = await pdf_render_pool.open(report.model_dump_json(), kind="organization")
+
+    filename = (
+        f"organization-{safe_filename_part(report.organization_name)}-"
+        f"{safe_filename_part(report.framework_name)}.pdf"
+    )
+    return StreamingResponse(
+        stream_file(pdf),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(os.fstat(pdf.fileno()).st_size),
+        }
+    )
@@ -0,0 +1,197 @@
+"""Command line tools
+
+Usage:
+    python -m app.cli score --framework ../src/spiraapp-mvp/calms-framework.json \\
+        responses/ more.ndjson --workers 8 --output scores.ndjson
+    python -m app.cli rescore --framework-id <uuid> [--apply]
+
+`score` reads response records from .json files (one record, or a list of records) and
+.ndjson/.jsonl files (one record per line). Directories are searched recursively. Each
+record looks like:
+
+    {"id": "team-a", "responses": {"Q1": 4, "Q2": 2}}
+
+`responses` may also be a list of {"question_id": ..., "score": ...} objects. One NDJSON
+result line is written per record; records that fail validation produce an {"error": ...}
+line instead.
+
+`rescore` recomputes the stored scores of a framework's completed assessments in the
+database (see app/core/rescoring.py). It is a dry run printing the score deltas unless
+--apply is given.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from app.core import scoring_core
+
+INPUT_SUFFIXES = (".json", ".ndjson", ".jsonl")
+
+# Framework compiled once per worker process by _init_worker
+_framework: Optional[scoring_core.ScoringFramework] = None
+
+
+def _init_worker(definition: Dict[str, Any]) -> None:
+    global _framework
+    _framework = scoring_core.framework_from_definition(definition)
+
+
+def _score_record(record: Any, source: str) -> Dict[str, Any]:
+    try:
+        if not isinstance(record, dict) or "responses" not in record:
+            raise ValueError('record must be an object with "responses"')
+        responses = scoring_core.parse_responses(record["responses"])
+        result = scoring_core.score_responses(_framework, responses)
+    except (KeyError, TypeError, ValueError) as e:
+        return {"source": source, "id": _record_id(record), "error": str(e)}
+
+    return {"source": source, **scoring_core.result_as_dict(result, _record_id(record))}
+
+
+def _record_id(record: Any) -> Any:
+    return record.get("id") if isinstance(record, dict) else None
+
+
+def score_file(path: str) -> List[Dict[str, Any]]:
+    """Score every record in one input file (runs in a worker process)"""
+    results = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".json"):
+                data = json.load(f)
+                records = data if isinstance(data, list) else [data]
+                for i, record in enumerate(records):
+                    source = path if len(records) == 1 else f"{path}[{i}]"
+                    results.append(_score_record(record, source))
+            else:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    source = f"{path}:{line_number}"
+                    try:
+                        record = json.loads(line)
+                    except ValueError as e:
+                        results.append({"source": source, "id": None, "error": str(e)})
+                        continue
+                    results.append(_score_record(record, source))
+    except (OSError, ValueError) as e:
+        results.append({"source": path, "id": None, "error": str(e)})
+
+    return results
+
+
+def iter_input_files(paths: List[str]) -> Iterator[str]:
+    """Input files in argument order; directories are walked in sorted order"""
+    for path in paths:
+        if os.path.isdir(path):
+            for child in sorted(Path(path).rglob("*")):
+                if child.is_file() and child.suffix in INPUT_SUFFIXES:
+                    yield str(child)
+        else:
+            yield path
+
+
+def score_command(args) -> int:
+    """Score response files against a framework definition"""
+    with open(args.framework, encoding="utf-8") as f:
+        definition = json.load(f)
+    # Fail fast on a bad framework file before starting workers
+    framework = scoring_core.framework_from_definition(definition)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    scored = errors = 0
+    started = time.perf_counter()
+
+    try:
+        files = iter_input_files(args.inputs)
+        if args.workers == 1:
+            _init_worker(definition)
+            batches = map(score_file, files)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(
+                processes=args.workers, initializer=_init_worker, initargs=(definition,)
+            )
+            # Workers read and parse the files; only paths and results cross processes
+            batches = pool.imap(score_file, files, chunksize=args.chunksize)
+
+        for batch in batches:
+            for result in batch:
+                if "error" in result:
+                    errors += 1
+                else:
+                    scored += 1
+                output.write(json.dumps(result) + "\n")
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"[score] {framework.name or args.framework}: {scored} records scored, "
+        f"{errors} errors in {elapsed:.2f}s",
+        file=sys.stderr,
+    )
+    return 1 if errors else 0
+
+
+def rescore_command(args) -> int:
+    """Rescore a framework's completed assessments in the database"""
+    # Database imports are deferred so `score` works without a configured database
+    from app.core.rescoring import run_rescore
+
+    started = time.perf_counter()
+    summary = run_rescore(args.framework_id, dry_run=not args.apply, batch_size=args.batch_size)
+    if summary is None:
+        print(f"[rescore] Framework {args.framework_id} not found", file=sys.stderr)
+        return 1
+
+    print(summary.model_dump_json(indent=2))
+    elapsed = time.perf_counter() - started
+    action = "updated" if args.apply else "would change (dry run)"
+    print(
+        f"[rescore] {summary.assessments} assessments, {summary.changed} {action} "
+        f"in {elapsed:.2f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    score = subparsers.add_parser("score", help="Score response files offline")
+    score.add_argument("--framework", required=True, help="Framework definition JSON file")
+    score.add_argument("inputs", nargs="+", help="Response files or directories")
+    score.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                       help="Worker processes (1 scores in-process)")
+    score.add_argument("--chunksize", type=int, default=16, help="Files handed to a worker at once")
+    score.add_argument("--output", help="Write NDJSON results here instead of stdout")
+    score.set_defaults(handler=score_command)
+
+    rescore = subparsers.add_parser("rescore", help="Rescore stored assessments of a framework")
+    rescore.add_argument("--framework-id", type=UUID, required=True, help="Framework to rescore")
+    rescore.add_argument("--apply", action="store_true",
+                         help="Write the new scores (default: dry run reporting deltas)")
+    rescore.add_argument("--batch-size", type=int, default=1000, help="Rows per write statement")
+    rescore.set_defaults(handler=rescore_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
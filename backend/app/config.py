@@ -29,6 +29,51 @@ class Settings(BaseSettings):
         "http://lnxvthfth002:8673",
     ]
 
+    # Caching
+    FRAMEWORK_INDEX_CACHE_SIZE: int = 32
+    FRAMEWORK_STRUCTURE_CACHE_TTL_SECONDS: int = 300
+    ANALYTICS_CACHE_SIZE: int = 1024
+    ANALYTICS_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: int = 60
+    TOKEN_CACHE_SIZE: int = 4096
+    RESPONSE_CACHE_SIZE: int = 1024  # Response vectors used by what-if simulation
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+
+    # Password hashing and login admission control
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 32  # Further hashing work is rejected with 429
+    LOGIN_ACCOUNT_BURST: int = 5
+    LOGIN_ACCOUNT_PER_MINUTE: float = 5
+    LOGIN_IP_BURST: int = 30  # Workshops often share one office IP
+    LOGIN_IP_PER_MINUTE: float = 120
+
+    # PDF rendering
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_MAX_PENDING: int = 8
+    PDF_CACHE_DIR: str = "/tmp/devops-maturity-pdf-cache"
+    PDF_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    PDF_CACHE_MAX_AGE_SECONDS: int = 7 * 24 * 3600
+
+    # Batch report export
+    REPORT_EXPORT_MAX_ASSESSMENTS: int = 500
+    REPORT_EXPORT_MAX_IN_FLIGHT: int = 4  # Renders one export keeps queued on the PDF pool
+    REPORT_EXPORT_BATCH_SIZE: int = 50  # Report snapshots loaded per query
+    REPORT_EXPORT_MAX_JOBS: int = 256  # Export status records kept per process
+    REPORT_EXPORT_JOB_TTL_SECONDS: int = 3600
+
+    # Data export (CSV/NDJSON)
+    DATA_EXPORT_BATCH_SIZE: int = 1000  # Rows per server-side cursor fetch
+
+    # What-if simulation
+    SIMULATION_MAX_SCENARIOS: int = 50
+
+    # Listings
+    ASSESSMENT_COUNT_CAP: int = 10000  # include_total counts at most this many rows
+
+    # SQL instrumentation
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 10  # Same statement this often in one request = N+1
+
     # Application
     PROJECT_NAME: str = "DevOps Maturity Assessment"
     VERSION: str = "1.2.1"
@@ -0,0 +1,123 @@
+"""Data export - query rows streamed as CSV or NDJSON, optionally gzipped, in constant memory"""
+
+import csv
+import enum
+import io
+import json
+import zlib
+from contextlib import aclosing
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Iterable, Literal, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# zlib window bits for a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+GZIP_LEVEL = 6
+
+
+def filename(name: str, export_format: ExportFormat, compress: bool) -> str:
+    """Download file name of an export"""
+    suffix = f"{export_format}.gz" if compress else export_format
+    return f"{name}-{datetime.utcnow():%Y%m%d-%H%M%S}.{suffix}"
+
+
+def media_type(export_format: ExportFormat, compress: bool) -> str:
+    """Content type of an export"""
+    return "application/gzip" if compress else MEDIA_TYPES[export_format]
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot export {type(value).__name__}")
+
+
+# One encoder for every row; json.dumps with a default builds a new one per call
+_encode_json = json.JSONEncoder(default=_json_value, ensure_ascii=False).encode
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, list):
+        return _encode_json(value)
+    return value
+
+
+def _csv_lines(rows: Iterable[Sequence[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+async def encode_rows(
+    columns: Sequence[str],
+    partitions: AsyncIterator[Sequence[Sequence[Any]]],
+    export_format: ExportFormat,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Yield the encoded rows one partition at a time.
+
+    CSV starts with a header row; NDJSON has one object per row keyed by column name.
+    Only the current partition and the gzip window are held, whatever the row count.
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, GZIP_WBITS) if compress else None
+
+    def output(text: str) -> bytes:
+        data = text.encode()
+        return compressor.compress(data) if compressor else data
+
+    async with aclosing(partitions):
+        if export_format == "csv":
+            yield output(_csv_lines([columns]))
+        async for rows in partitions:
+            if export_format == "csv":
+                text = _csv_lines([_csv_cell(value) for value in row] for row in rows)
+            else:
+                text = "".join(_encode_json(dict(zip(columns, row))) + "\n" for row in rows)
+            data = output(text)
+            if data:  # The compressor buffers until it has a block to emit
+                yield data
+
+    if compressor:
+        yield compressor.flush()
+
+
+async def _fetch(query: Select) -> AsyncIterator[Sequence[Any]]:
+    """Rows of a query, DATA_EXPORT_BATCH_SIZE at a time from a server-side cursor"""
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            query.execution_options(yield_per=settings.DATA_EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+
+def stream_query(
+    query: Select, export_format: ExportFormat, compress: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Encoded rows of a query, for a StreamingResponse.
+
+    The query runs on its own session: the request's session is closed before the
+    response body streams.
+    """
+    columns = list(query.selected_columns.keys())
+    return encode_rows(columns, _fetch(query), export_format, compress)
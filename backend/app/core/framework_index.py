@@ -0,0 +1,377 @@
+"""Compiled, cached framework index used by the scoring engine and framework API"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.scoring_core import DomainDef, QuestionDef, ScoringFramework
+from app.models import Framework, FrameworkDomain, FrameworkGate, FrameworkQuestion
+
+
+@dataclass(frozen=True)
+class QuestionEntry:
+    """Question definition with its position in the framework"""
+
+    id: UUID
+    text: str
+    guidance: Optional[str]
+    order: int
+    gate_id: UUID
+    domain_id: UUID
+    weight: float  # Weight of the owning domain
+    ordinal: int  # Position of the question across the whole framework
+
+
+@dataclass(frozen=True)
+class GateEntry:
+    """Gate definition with its ordered questions"""
+
+    id: UUID
+    name: str
+    description: Optional[str]
+    order: int
+    domain_id: UUID
+    questions: Tuple[QuestionEntry, ...]
+
+
+@dataclass(frozen=True)
+class DomainEntry:
+    """Domain definition with its ordered gates"""
+
+    id: UUID
+    name: str
+    description: Optional[str]
+    weight: float
+    order: int
+    gates: Tuple[GateEntry, ...]
+    question_count: int
+
+
+@dataclass(frozen=True)
+class FrameworkEntry:
+    """Framework header row"""
+
+    id: UUID
+    name: str
+    description: Optional[str]
+    version: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class FrameworkIndex:
+    """
+    Immutable, pre-sorted view of a framework's domains, gates and questions.
+
+    Attribute names mirror the ORM models so the entries can be validated directly by the
+    `FrameworkStructure` schemas.
+    """
+
+    __slots__ = ("framework", "domains", "domains_by_id", "gates", "questions", "scoring")
+
+    def __init__(self, framework: FrameworkEntry, domains: Tuple[DomainEntry, ...]):
+        self.framework = framework
+        self.domains = domains
+        self.domains_by_id: Mapping[UUID, DomainEntry] = MappingProxyType(
+            {d.id: d for d in domains}
+        )
+        self.gates: Mapping[UUID, GateEntry] = MappingProxyType(
+            {g.id: g for d in domains for g in d.gates}
+        )
+        self.questions: Mapping[UUID, QuestionEntry] = MappingProxyType(
+            {q.id: q for d in domains for g in d.gates for q in g.questions}
+        )
+        # Same structure in the DB-free shape used by the scoring core
+        self.scoring = ScoringFramework(
+            (
+                DomainDef(
+                    id=d.id,
+                    name=d.name,
+                    weight=d.weight,
+                    questions=tuple(
+                        QuestionDef(id=q.id, text=q.text, gate_id=g.id, gate_name=g.name)
+                        for g in d.gates for q in g.questions
+                    ),
+                )
+                for d in domains
+            ),
+            name=framework.name,
+            version=framework.version,
+        )
+
+    def gate_for(self, question_id: UUID) -> Optional[GateEntry]:
+        """Get the gate a question belongs to"""
+        question = self.questions.get(question_id)
+        return self.gates[question.gate_id] if question else None
+
+    def domain_for(self, question_id: UUID) -> Optional[DomainEntry]:
+        """Get the domain a question belongs to"""
+        question = self.questions.get(question_id)
+        return self.domains_by_id[question.domain_id] if question else None
+
+
+def framework_structure_query(framework_id: UUID):
+    """Select (framework, domain, gate, question) rows for a framework in display order"""
+    return (
+        select(Framework, FrameworkDomain, FrameworkGate, FrameworkQuestion)
+        .select_from(Framework)
+        .outerjoin(FrameworkDomain, FrameworkDomain.framework_id == Framework.id)
+        .outerjoin(FrameworkGate, FrameworkGate.domain_id == FrameworkDomain.id)
+        .outerjoin(FrameworkQuestion, FrameworkQuestion.gate_id == FrameworkGate.id)
+        .where(Framework.id == framework_id)
+        .order_by(FrameworkDomain.order, FrameworkGate.order, FrameworkQuestion.order)
+    )
+
+
+def framework_fingerprints():
+    """
+    Select (framework_id, version, fingerprint) rows; the fingerprint is the md5 of a
+    framework's version, the number of its framework, domain, gate and question rows and
+    their latest updated_at.
+
+    Adding, deleting or editing any of those rows changes the fingerprint, whichever process
+    wrote it.
+    """
+    rows = union_all(
+        select(Framework.id.label("framework_id"), Framework.updated_at),
+        select(FrameworkDomain.framework_id, FrameworkDomain.updated_at),
+        select(FrameworkDomain.framework_id, FrameworkGate.updated_at)
+        .select_from(FrameworkGate)
+        .join(FrameworkDomain, FrameworkDomain.id == FrameworkGate.domain_id),
+        select(FrameworkDomain.framework_id, FrameworkQuestion.updated_at)
+        .select_from(FrameworkQuestion)
+        .join(FrameworkGate, FrameworkGate.id == FrameworkQuestion.gate_id)
+        .join(FrameworkDomain, FrameworkDomain.id == FrameworkGate.domain_id),
+    ).subquery()
+    return (
+        select(
+            Framework.id.label("framework_id"),
+            Framework.version,
+            func.md5(
+                func.concat_ws(":", Framework.version, func.count(), func.max(rows.c.updated_at))
+            ).label("fingerprint"),
+        )
+        .join(rows, rows.c.framework_id == Framework.id)
+        .group_by(Framework.id)
+    )
+
+
+def framework_fingerprint_query(framework_id: UUID):
+    """Select the fingerprint of one framework"""
+    fingerprints = framework_fingerprints().where(Framework.id == framework_id).subquery()
+    return select(fingerprints.c.fingerprint)
+
+
+def build_framework_index(db: Session, framework_id: UUID) -> Optional[FrameworkIndex]:
+    """
+    Load a framework's full structure with a single query and compile it into an index.
+
+    Returns None if the framework does not exist.
+    """
+    rows = db.execute(framework_structure_query(framework_id)).all()
+    if not rows:
+        return None
+
+    return compile_framework_index(rows)
+
+
+def compile_framework_index(rows: List[tuple]) -> FrameworkIndex:
+    """
+    Compile (framework, domain, gate, question) rows into a FrameworkIndex.
+
+    Rows must be ordered by domain, gate and question order. Domain, gate and question may
+    be None for empty outer-joined children.
+    """
+    framework = rows[0][0]
+
+    # Group rows into domain -> gate -> questions while preserving order
+    domain_rows: Dict[UUID, FrameworkDomain] = {}
+    gate_rows: Dict[UUID, Dict[UUID, FrameworkGate]] = {}
+    question_rows: Dict[UUID, List[FrameworkQuestion]] = {}
+
+    for _, domain, gate, question in rows:
+        if domain is None:
+            continue
+        domain_rows.setdefault(domain.id, domain)
+        gates = gate_rows.setdefault(domain.id, {})
+        if gate is None:
+            continue
+        gates.setdefault(gate.id, gate)
+        questions = question_rows.setdefault(gate.id, [])
+        if question is not None:
+            questions.append(question)
+
+    ordinal = 0
+    domains = []
+    for domain_id, domain in domain_rows.items():
+        gates = []
+        for gate_id, gate in gate_rows.get(domain_id, {}).items():
+            questions = []
+            for question in question_rows.get(gate_id, []):
+                questions.append(
+                    QuestionEntry(
+                        id=question.id,
+                        text=question.text,
+                        guidance=question.guidance,
+                        order=question.order,
+                        gate_id=gate_id,
+                        domain_id=domain_id,
+                        weight=domain.weight,
+                        ordinal=ordinal,
+                    )
+                )
+                ordinal += 1
+            gates.append(
+                GateEntry(
+                    id=gate_id,
+                    name=gate.name,
+                    description=gate.description,
+                    order=gate.order,
+                    domain_id=domain_id,
+                    questions=tuple(questions),
+                )
+            )
+        domains.append(
+            DomainEntry(
+                id=domain_id,
+                name=domain.name,
+                description=domain.description,
+                weight=domain.weight,
+                order=domain.order,
+                gates=tuple(gates),
+                question_count=sum(len(g.questions) for g in gates),
+            )
+        )
+
+    return FrameworkIndex(
+        framework=FrameworkEntry(
+            id=framework.id,
+            name=framework.name,
+            description=framework.description,
+            version=framework.version,
+            created_at=framework.created_at,
+            updated_at=framework.updated_at,
+        ),
+        domains=tuple(domains),
+    )
+
+
+class FrameworkIndexCache:
+    """Process-wide LRU cache of compiled framework indexes keyed by (framework_id, fingerprint)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[UUID, str], FrameworkIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[UUID, str]) -> Optional[FrameworkIndex]:
+        with self._lock:
+            index = self._entries.get(key)
+            if index is not None:
+                self._entries.move_to_end(key)
+            return index
+
+    def put(self, key: Tuple[UUID, str], index: FrameworkIndex) -> None:
+        with self._lock:
+            self._entries[key] = index
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+framework_index_cache = FrameworkIndexCache(settings.FRAMEWORK_INDEX_CACHE_SIZE)
+
+
+async def get_framework_index(db: AsyncSession, framework_id: UUID) -> Optional[FrameworkIndex]:
+    """
+    Get the compiled index for a framework, building it on a cache miss.
+
+    A cache hit costs one indexed fingerprint query, so framework changes written by other
+    processes (seed scripts, other workers) are picked up by the next lookup.
+    """
+    fingerprint = await db.scalar(framework_fingerprint_query(framework_id))
+    if fingerprint is None:
+        return None
+
+    key = (framework_id, fingerprint)
+    index = framework_index_cache.get(key)
+    if index is None:
+        index = await db.run_sync(build_framework_index, framework_id)
+        if index is not None:
+            framework_index_cache.put(key, index)
+
+    return index
+
+
+@dataclass(frozen=True)
+class SerializedStructure:
+    """FrameworkStructure response body and its strong ETag"""
+
+    etag: str
+    body: bytes
+
+
+# Serialized structure responses keyed by framework_id. Served without any DB access, so
+# changes made by other processes (seed scripts, other workers) show up within the TTL: an
+# expired entry is rebuilt through get_framework_index, which checks the framework's
+# content fingerprint.
+framework_structure_cache = TTLCache(
+    max_size=settings.FRAMEWORK_INDEX_CACHE_SIZE,
+    ttl_seconds=settings.FRAMEWORK_STRUCTURE_CACHE_TTL_SECONDS,
+)
+
+
+async def get_framework_structure_json(
+    db: AsyncSession, framework_id: UUID
+) -> Optional[SerializedStructure]:
+    """Get the serialized structure of a framework, building it from the index on a miss"""
+    structure = framework_structure_cache.get(framework_id)
+    if structure is not None:
+        return structure
+
+    index = await get_framework_index(db, framework_id)
+    if index is None:
+        return None
+
+    body = schemas.FrameworkStructure(
+        framework=index.framework, domains=index.domains
+    ).model_dump_json().encode("utf-8")
+    structure = SerializedStructure(etag=f'"{hashlib.sha256(body).hexdigest()}"', body=body)
+    framework_structure_cache.set(framework_id, structure)
+
+    return structure
+
+
+_FRAMEWORK_MODELS = (Framework, FrameworkDomain, FrameworkGate, FrameworkQuestion)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_framework_change(session, flush_context):
+    """
+    Drop cached indexes and structures as soon as framework content is written in this
+    process; writes from other processes are caught by the fingerprint check.
+    """
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _FRAMEWORK_MODELS):
+            framework_index_cache.clear()
+            framework_structure_cache.clear()
+            return
@@ -0,0 +1,180 @@
+"""Live scores - running per-domain response totals maintained as responses are saved"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import CTE, Delete, Insert, delete, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core.framework_index import FrameworkIndex
+from app.core.scoring_core import (
+    MAX_QUESTION_SCORE,
+    domain_score,
+    get_maturity_level,
+    overall_score,
+)
+from app.models import (
+    Assessment,
+    DomainScoreTotal,
+    FrameworkDomain,
+    FrameworkGate,
+    FrameworkQuestion,
+    GateResponse,
+)
+
+# Columns written by the totals INSERT ... SELECT statements
+TOTAL_COLUMNS = ["id", "assessment_id", "domain_id", "total", "answered", "max_total", "updated_at"]
+
+
+@dataclass(frozen=True)
+class DomainTotal:
+    """Running totals of one assessment domain"""
+
+    total: int
+    answered: int
+    max_total: int
+
+
+async def load_domain_totals(db: AsyncSession, assessment_id: UUID) -> Dict[UUID, DomainTotal]:
+    """Running totals of an assessment by domain id (one indexed lookup)"""
+    rows = await db.execute(
+        select(
+            DomainScoreTotal.domain_id,
+            DomainScoreTotal.total,
+            DomainScoreTotal.answered,
+            DomainScoreTotal.max_total,
+        ).where(DomainScoreTotal.assessment_id == assessment_id)
+    )
+    return {domain_id: DomainTotal(*values) for domain_id, *values in rows.all()}
+
+
+def _question_counts(framework_id: UUID):
+    """(domain_id, questions) of a framework's domains with questions"""
+    return (
+        select(FrameworkGate.domain_id, func.count().label("questions"))
+        .select_from(FrameworkQuestion)
+        .join(FrameworkGate, FrameworkGate.id == FrameworkQuestion.gate_id)
+        .join(FrameworkDomain, FrameworkDomain.id == FrameworkGate.domain_id)
+        .where(FrameworkDomain.framework_id == framework_id)
+        .group_by(FrameworkGate.domain_id)
+        .subquery()
+    )
+
+
+def response_changes_upsert(
+    assessment_id: UUID, framework_id: UUID, previous: CTE, saved: CTE, now: datetime
+) -> Insert:
+    """
+    Upsert folding saved responses into the running totals, for a CTE of the save statement.
+
+    `previous` holds (question_id, score) of the saved questions' responses before the save
+    and `saved` the (question_id, score) rows written by it. Both read the statement's
+    snapshot, so the caller must serialize saves of one assessment (e.g. by locking its row
+    in an earlier statement) for concurrent deltas not to be lost. Responses to questions
+    outside the framework are ignored, as scoring ignores them.
+    """
+    question_counts = _question_counts(framework_id)
+    deltas = (
+        select(
+            func.gen_random_uuid(),
+            literal(assessment_id, DomainScoreTotal.assessment_id.type),
+            FrameworkGate.domain_id,
+            func.sum(saved.c.score - func.coalesce(previous.c.score, 0)),
+            func.count().filter(previous.c.question_id.is_(None)),
+            func.max(question_counts.c.questions) * MAX_QUESTION_SCORE,
+            literal(now),
+        )
+        .select_from(saved)
+        .outerjoin(previous, previous.c.question_id == saved.c.question_id)
+        .join(FrameworkQuestion, FrameworkQuestion.id == saved.c.question_id)
+        .join(FrameworkGate, FrameworkGate.id == FrameworkQuestion.gate_id)
+        .join(question_counts, question_counts.c.domain_id == FrameworkGate.domain_id)
+        .group_by(FrameworkGate.domain_id)
+    )
+    stmt = pg_insert(DomainScoreTotal).from_select(TOTAL_COLUMNS, deltas)
+    return stmt.on_conflict_do_update(
+        constraint="uq_domain_score_total",
+        set_={
+            "total": DomainScoreTotal.total + stmt.excluded.total,
+            "answered": DomainScoreTotal.answered + stmt.excluded.answered,
+            "max_total": stmt.excluded.max_total,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+def rebuild_domain_totals(framework_id: UUID) -> Tuple[Delete, Insert]:
+    """
+    Statements recomputing the running totals of every assessment of a framework from its
+    responses, for when the totals may have drifted from them: question deletes cascade to
+    responses without adjusting the totals, and question counts change with the structure.
+    """
+    framework_assessments = select(Assessment.id).where(Assessment.framework_id == framework_id)
+    question_counts = _question_counts(framework_id)
+    totals = (
+        select(
+            func.gen_random_uuid(),
+            GateResponse.assessment_id,
+            FrameworkGate.domain_id,
+            func.sum(GateResponse.score),
+            func.count(),
+            func.max(question_counts.c.questions) * MAX_QUESTION_SCORE,
+            literal(datetime.utcnow()),
+        )
+        .join(FrameworkQuestion, FrameworkQuestion.id == GateResponse.question_id)
+        .join(FrameworkGate, FrameworkGate.id == FrameworkQuestion.gate_id)
+        .join(question_counts, question_counts.c.domain_id == FrameworkGate.domain_id)
+        .where(GateResponse.assessment_id.in_(framework_assessments))
+        .group_by(GateResponse.assessment_id, FrameworkGate.domain_id)
+    )
+    return (
+        delete(DomainScoreTotal)
+        .where(DomainScoreTotal.assessment_id.in_(framework_assessments)),
+        insert(DomainScoreTotal).from_select(TOTAL_COLUMNS, totals),
+    )
+
+
+def live_score(
+    assessment_id: UUID, index: FrameworkIndex, totals: Mapping[UUID, DomainTotal]
+) -> schemas.LiveScore:
+    """
+    Current domain and overall scores from the running totals, scored as on submit.
+
+    The domain maximum comes from the framework index, so questions added since the totals
+    were written count towards it.
+    """
+    domains = []
+    for domain in index.scoring.domains:
+        question_count = len(domain.questions)
+        max_total = question_count * MAX_QUESTION_SCORE
+        current: Optional[DomainTotal] = totals.get(domain.id)
+        if current is None:
+            current = DomainTotal(0, 0, max_total)
+        score, maturity_level = domain_score(current.total, max_total)
+        domains.append(schemas.LiveDomainScore(
+            domain_id=domain.id,
+            domain=domain.name,
+            weight=domain.weight,
+            score=score,
+            maturity_level=maturity_level,
+            total=current.total,
+            max_total=max_total,
+            answered=current.answered,
+            question_count=question_count,
+        ))
+
+    overall = overall_score((d.score, d.weight) for d in domains)
+    maturity_level, _ = get_maturity_level(overall)
+
+    return schemas.LiveScore(
+        assessment_id=assessment_id,
+        overall_score=overall,
+        maturity_level=maturity_level,
+        answered=sum(d.answered for d in domains),
+        question_count=len(index.scoring.question_ids),
+        domains=domains,
+    )
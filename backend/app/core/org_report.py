@@ -0,0 +1,211 @@
+"""Organization report - every team's latest completed assessment, aggregated in SQL"""
+
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core import scoring_core
+from app.core.framework_index import FrameworkIndex
+from app.core.scoring import get_maturity_level_description
+from app.models import (
+    Assessment,
+    AssessmentStatus,
+    DomainScore,
+    FrameworkDomain,
+    FrameworkGate,
+    FrameworkQuestion,
+    GateScore,
+    Organization,
+    ScoreFinding,
+)
+
+# Strengths and gaps listed per team
+TEAM_FINDINGS = 3
+
+
+def _latest_assessments(organization_id: UUID, framework_id: UUID):
+    """Each team's latest completed assessment of a framework in an organization"""
+    return (
+        select(
+            Assessment.id,
+            Assessment.team_name,
+            Assessment.overall_score,
+            Assessment.maturity_level,
+            Assessment.completed_at,
+        )
+        .where(
+            Assessment.organization_id == organization_id,
+            Assessment.framework_id == framework_id,
+            Assessment.status == AssessmentStatus.COMPLETED,
+            # Scored submissions only, as trends.is_rolled_up; a status set through the
+            # update endpoint leaves the score and completion time empty
+            Assessment.overall_score.isnot(None),
+            Assessment.completed_at.isnot(None),
+        )
+        .distinct(Assessment.team_name)
+        .order_by(Assessment.team_name, Assessment.completed_at.desc())
+        .subquery()
+    )
+
+
+async def _team_findings(
+    db: AsyncSession, latest, index: FrameworkIndex
+) -> Dict[Tuple[UUID, str], List[str]]:
+    """First TEAM_FINDINGS strengths and gaps of every team in framework order, ranked in SQL"""
+    rank = func.row_number().over(
+        partition_by=(ScoreFinding.assessment_id, ScoreFinding.kind),
+        order_by=(FrameworkDomain.order, FrameworkGate.order, FrameworkQuestion.order),
+    ).label("rank")
+    ranked = (
+        select(
+            ScoreFinding.assessment_id,
+            ScoreFinding.kind,
+            ScoreFinding.question_id,
+            ScoreFinding.score,
+            rank,
+        )
+        .join(latest, latest.c.id == ScoreFinding.assessment_id)
+        .join(FrameworkQuestion, FrameworkQuestion.id == ScoreFinding.question_id)
+        .join(FrameworkGate, FrameworkGate.id == FrameworkQuestion.gate_id)
+        .join(FrameworkDomain, FrameworkDomain.id == FrameworkGate.domain_id)
+        .subquery()
+    )
+    rows = await db.execute(
+        select(ranked.c.assessment_id, ranked.c.kind, ranked.c.question_id, ranked.c.score)
+        .where(ranked.c.rank <= TEAM_FINDINGS)
+        .order_by(ranked.c.assessment_id, ranked.c.kind, ranked.c.rank)
+    )
+
+    findings: Dict[Tuple[UUID, str], List[str]] = {}
+    for assessment_id, kind, question_id, score in rows.all():
+        question = index.questions.get(question_id)
+        if question is None:
+            continue
+        text = scoring_core.finding_text(index.gates[question.gate_id].name, question.text, score)
+        findings.setdefault((assessment_id, kind), []).append(text)
+    return findings
+
+
+async def build_organization_report(
+    db: AsyncSession, organization: Organization, index: FrameworkIndex
+) -> Optional[schemas.OrganizationReport]:
+    """
+    Consolidated report of each team's latest completed assessment of the index's framework.
+
+    Built from stored domain scores, gate scores and findings with four set-based queries,
+    whatever the number of teams; returns None when no team has a completed assessment.
+    """
+    latest = _latest_assessments(organization.id, index.framework.id)
+
+    teams = (await db.execute(select(latest).order_by(latest.c.team_name))).all()
+    if not teams:
+        return None
+
+    # Domain heat table: one stored score per team and domain
+    cells = (
+        await db.execute(
+            select(
+                DomainScore.assessment_id,
+                DomainScore.domain_id,
+                DomainScore.score,
+                DomainScore.maturity_level,
+            ).join(latest, latest.c.id == DomainScore.assessment_id)
+        )
+    ).all()
+    domain_cells: Dict[Tuple[UUID, UUID], Tuple[float, int]] = {
+        (assessment_id, domain_id): (score, level)
+        for assessment_id, domain_id, score, level in cells
+    }
+
+    # Gate comparison aggregated per gate, without reading per-team gate rows
+    gate_rows = (
+        await db.execute(
+            select(
+                GateScore.gate_id,
+                func.count(),
+                func.avg(GateScore.percentage),
+                func.min(GateScore.percentage),
+                func.max(GateScore.percentage),
+                func.count().filter(GateScore.percentage < 50),
+            )
+            .join(latest, latest.c.id == GateScore.assessment_id)
+            .group_by(GateScore.gate_id)
+        )
+    ).all()
+    gate_stats = {row[0]: row[1:] for row in gate_rows}
+
+    findings = await _team_findings(db, latest, index)
+
+    domains = []
+    for domain in index.domains:  # Framework order
+        scores = [
+            domain_cells[(team.id, domain.id)][0]
+            for team in teams
+            if (team.id, domain.id) in domain_cells
+        ]
+        if not scores:
+            continue
+        domains.append(schemas.OrganizationDomainSummary(
+            domain_id=domain.id,
+            domain=domain.name,
+            average_score=round(sum(scores) / len(scores), 2),
+            min_score=min(scores),
+            max_score=max(scores),
+        ))
+
+    gates = []
+    for gate_id, gate in index.gates.items():  # Framework order
+        stats = gate_stats.get(gate_id)
+        if stats is None:
+            continue
+        count, average, minimum, maximum, below_half = stats
+        gates.append(schemas.OrganizationGateSummary(
+            gate_id=gate_id,
+            gate_name=gate.name,
+            domain=index.domains_by_id[gate.domain_id].name,
+            teams=count,
+            average_percentage=round(float(average), 2),
+            min_percentage=minimum,
+            max_percentage=maximum,
+            teams_below_half=below_half,
+        ))
+
+    team_summaries = []
+    distribution = [0] * 5
+    for team in teams:
+        distribution[team.maturity_level - 1] += 1
+        team_cells = [domain_cells.get((team.id, d.domain_id)) for d in domains]
+        team_summaries.append(schemas.OrganizationTeamSummary(
+            assessment_id=team.id,
+            team_name=team.team_name,
+            completed_at=team.completed_at,
+            overall_score=team.overall_score,
+            maturity_level=team.maturity_level,
+            domain_scores=[cell[0] if cell else None for cell in team_cells],
+            domain_levels=[cell[1] if cell else None for cell in team_cells],
+            strengths=findings.get((team.id, "strength"), []),
+            gaps=findings.get((team.id, "gap"), []),
+        ))
+
+    average_score = round(sum(t.overall_score for t in teams) / len(teams), 2)
+    level, level_name = scoring_core.get_maturity_level(average_score)
+
+    return schemas.OrganizationReport(
+        organization_id=organization.id,
+        organization_name=organization.name,
+        framework_id=index.framework.id,
+        framework_name=index.framework.name,
+        framework_version=index.framework.version,
+        team_count=len(teams),
+        average_score=average_score,
+        maturity_level=schemas.MaturityLevel(
+            level=level, name=level_name, description=get_maturity_level_description(level)
+        ),
+        maturity_distribution=distribution,
+        domains=domains,
+        gates=gates,
+        teams=team_summaries,
+    )
@@ -0,0 +1,67 @@
+"""In-process rate limiting and admission control"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+
+class TokenBucketLimiter:
+    """
+    Per-key token buckets holding up to `burst` tokens, refilled at `per_minute` tokens/minute.
+
+    At most `max_keys` buckets are tracked; the least recently used are dropped first (a
+    dropped key starts again with a full bucket). Limits apply per worker process.
+    """
+
+    def __init__(self, burst: int, per_minute: float, max_keys: int = 10000):
+        self.burst = burst
+        self.rate = per_minute / 60.0
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable) -> float:
+        """Take one token; returns 0 on success, else the seconds until a token is available"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now]
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+
+            tokens, updated = bucket
+            tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+            if tokens >= 1.0:
+                bucket[0], bucket[1] = tokens - 1.0, now
+                return 0.0
+
+            bucket[0], bucket[1] = tokens, now
+            return (1.0 - tokens) / self.rate if self.rate > 0 else float("inf")
+
+
+class AdmissionLimit:
+    """Non-blocking cap on concurrent units of work; excess work is rejected, not queued"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._active >= self.limit:
+                return False
+            self._active += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    @property
+    def active(self) -> int:
+        return self._active
@@ -0,0 +1,242 @@
+"""Batch report export - PDFs rendered on the render pool and streamed as one ZIP archive"""
+
+import asyncio
+import logging
+import shutil
+import uuid
+import zipfile
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator, BinaryIO, Deque, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from app import schemas
+from app.config import settings
+from app.core import report_snapshots
+from app.core.cache import TTLCache
+from app.core.report_snapshots import ReportSnapshot
+from app.database import AsyncSessionLocal
+from app.models import Assessment
+from app.utils.pdf_render_pool import pdf_render_pool
+
+logger = logging.getLogger(__name__)
+
+# Copy size when adding a rendered PDF to the archive
+CHUNK_SIZE = 64 * 1024
+
+
+def safe_filename_part(text: str) -> str:
+    """Text reduced to letters, digits, '-' and '_' for use in a download file name"""
+    safe = "".join(c for c in text if c.isalnum() or c in (" ", "-", "_")).strip()
+    return safe.replace(" ", "-")
+
+
+def pdf_filename(team_name: str, assessment_id: UUID) -> str:
+    """Download file name of an assessment's PDF report"""
+    return f"assessment-{safe_filename_part(team_name)}-{assessment_id}.pdf"
+
+
+@dataclass(frozen=True)
+class ExportItem:
+    """One assessment of an export"""
+
+    assessment_id: UUID
+    team_name: str
+
+
+@dataclass
+class ExportJob:
+    """Progress of one export, readable while its archive streams"""
+
+    id: UUID
+    user_id: UUID
+    total: int
+    status: str = "running"
+    completed: int = 0
+    bytes_sent: int = 0
+    failures: List[schemas.ReportExportFailure] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def fail(self, item: ExportItem, error: str) -> None:
+        self.failures.append(schemas.ReportExportFailure(
+            assessment_id=item.assessment_id, team_name=item.team_name, error=error
+        ))
+
+    def finish(self, status: str) -> None:
+        self.status = status
+        self.finished_at = datetime.utcnow()
+        export_jobs.set(self.id, self)  # Keep finished jobs readable for a full TTL
+
+    def to_schema(self) -> schemas.ReportExportStatus:
+        return schemas.ReportExportStatus(
+            job_id=self.id,
+            status=self.status,
+            total=self.total,
+            completed=self.completed,
+            failed=len(self.failures),
+            bytes_sent=self.bytes_sent,
+            failures=self.failures,
+            created_at=self.created_at,
+            finished_at=self.finished_at,
+        )
+
+
+# Export status records by job id. Per process: a job's status is served by the worker
+# streaming its archive
+export_jobs = TTLCache(
+    max_size=settings.REPORT_EXPORT_MAX_JOBS, ttl_seconds=settings.REPORT_EXPORT_JOB_TTL_SECONDS
+)
+
+
+def start_job(user_id: UUID, total: int) -> ExportJob:
+    """Register a new export"""
+    job = ExportJob(id=uuid.uuid4(), user_id=user_id, total=total)
+    export_jobs.set(job.id, job)
+    return job
+
+
+def get_job(job_id: UUID, user_id: UUID) -> Optional[ExportJob]:
+    """An export started by the given user, or None"""
+    job = export_jobs.get(job_id)
+    if job is None or job.user_id != user_id:
+        return None
+    return job
+
+
+class _ZipStream:
+    """
+    Write-only, non-seekable file object for zipfile, drained after each archive entry.
+
+    Without seek() zipfile writes entries with data descriptors, so the archive can be
+    streamed front to back while only the current entry is buffered.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _add_file(archive: zipfile.ZipFile, name: str, pdf: BinaryIO) -> None:
+    """Compress an open PDF into the archive (blocking)"""
+    with archive.open(name, "w") as entry:
+        shutil.copyfileobj(pdf, entry, CHUNK_SIZE)
+
+
+async def _load_snapshots(
+    job: ExportJob, items: Sequence[ExportItem]
+) -> List[Tuple[ExportItem, ReportSnapshot]]:
+    """Report snapshots of a batch in one query, rebuilding missing or stale ones"""
+    async with AsyncSessionLocal() as db:
+        snapshots = await report_snapshots.load_report_snapshots(
+            db, [item.assessment_id for item in items]
+        )
+        loaded = []
+        for item in items:
+            snapshot = snapshots.get(item.assessment_id)
+            if snapshot is None:
+                try:
+                    assessment = await db.get(Assessment, item.assessment_id)
+                    snapshot = await report_snapshots.get_report_snapshot(db, assessment)
+                except Exception:
+                    logger.exception("Report snapshot rebuild failed for %s", item.assessment_id)
+                    await db.rollback()
+                    job.fail(item, "Report could not be built")
+                    continue
+            loaded.append((item, snapshot))
+        return loaded
+
+
+async def stream_export(job: ExportJob, items: Sequence[ExportItem]) -> AsyncIterator[bytes]:
+    """
+    Yield a ZIP archive of the items' PDF reports, adding each PDF as soon as it is rendered.
+
+    At most REPORT_EXPORT_MAX_IN_FLIGHT renders are queued on the shared PDF pool and
+    REPORT_EXPORT_BATCH_SIZE snapshots are held, so memory stays bounded for any export size.
+    Reports that fail are listed in export-errors.txt at the end of the archive.
+    """
+    stream = _ZipStream()
+    archive = zipfile.ZipFile(stream, mode="w", compression=zipfile.ZIP_DEFLATED)
+    batch_size = settings.REPORT_EXPORT_BATCH_SIZE
+    batches = (items[i:i + batch_size] for i in range(0, len(items), batch_size))
+    queued: Deque[Tuple[ExportItem, ReportSnapshot]] = deque()
+    pending: Dict[asyncio.Task, ExportItem] = {}
+
+    try:
+        while True:
+            while len(pending) < settings.REPORT_EXPORT_MAX_IN_FLIGHT:
+                if not queued:
+                    batch = next(batches, None)
+                    if batch is None:
+                        break
+                    queued.extend(await _load_snapshots(job, batch))
+                    continue
+                item, snapshot = queued.popleft()
+                task = asyncio.create_task(
+                    pdf_render_pool.open(snapshot.report_json, key=snapshot.content_hash)
+                )
+                pending[task] = item
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                try:
+                    pdf = task.result()
+                except Exception:
+                    logger.exception("PDF render failed for %s", item.assessment_id)
+                    job.fail(item, "Report could not be rendered")
+                    continue
+                try:
+                    name = pdf_filename(item.team_name, item.assessment_id)
+                    await asyncio.to_thread(_add_file, archive, name, pdf)
+                finally:
+                    pdf.close()
+                job.completed += 1
+
+                data = stream.drain()
+                job.bytes_sent += len(data)
+                yield data
+
+        if job.failures:
+            archive.writestr("export-errors.txt", "".join(
+                f"{failure.assessment_id}\t{failure.team_name}\t{failure.error}\n"
+                for failure in job.failures
+            ))
+        archive.close()
+
+        data = stream.drain()
+        job.bytes_sent += len(data)
+        yield data
+        job.finish("completed")
+    except (asyncio.CancelledError, GeneratorExit):
+        job.finish("cancelled")  # Client went away
+        raise
+    except Exception:
+        job.finish("failed")
+        raise
+    finally:
+        for task in pending:
+            if task.done() and not task.cancelled() and task.exception() is None:
+                task.result().close()
+            else:
+                task.cancel()
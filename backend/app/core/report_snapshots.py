@@ -0,0 +1,159 @@
+"""Persisted assessment report snapshots"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Text, cast, delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core import scoring
+from app.core.framework_index import framework_fingerprints
+from app.models import (
+    Assessment,
+    AssessmentReportSnapshot,
+    DomainScore,
+    Framework,
+    GateScore,
+    ScoreFinding,
+)
+from app.utils.pdf_render_pool import report_content_hash
+
+# Bump when the AssessmentReport shape changes so stale snapshots are rebuilt
+REPORT_SNAPSHOT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    """Serialized report and its content hash"""
+
+    report_json: str
+    content_hash: str
+
+
+async def store_report_snapshot(
+    db: AsyncSession, assessment: Assessment, report: schemas.AssessmentReport
+) -> ReportSnapshot:
+    """Upsert the snapshot for an assessment (flushed with the caller's transaction)"""
+    fingerprints = (
+        framework_fingerprints().where(Framework.id == assessment.framework_id).subquery()
+    )
+    framework_version, framework_fingerprint = (
+        await db.execute(select(fingerprints.c.version, fingerprints.c.fingerprint))
+    ).one()
+    content_hash = report_content_hash(report)
+    now = datetime.utcnow()
+
+    stmt = pg_insert(AssessmentReportSnapshot).values(
+        assessment_id=assessment.id,
+        schema_version=REPORT_SNAPSHOT_VERSION,
+        framework_version=framework_version,
+        framework_fingerprint=framework_fingerprint,
+        content_hash=content_hash,
+        report=report.model_dump(mode="json"),
+        created_at=now,
+        updated_at=now,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AssessmentReportSnapshot.assessment_id],
+        set_={
+            "schema_version": stmt.excluded.schema_version,
+            "framework_version": stmt.excluded.framework_version,
+            "framework_fingerprint": stmt.excluded.framework_fingerprint,
+            "content_hash": stmt.excluded.content_hash,
+            "report": stmt.excluded.report,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+
+    return ReportSnapshot(report_json=report.model_dump_json(), content_hash=content_hash)
+
+
+def _valid_snapshots_query():
+    """
+    Snapshots built by the current snapshot format from the framework's current content.
+
+    Compared by content fingerprint, so framework edits without a version bump (e.g. a reseed
+    from another process) invalidate the snapshots too.
+    """
+    fingerprints = framework_fingerprints().subquery()
+    return (
+        select(
+            AssessmentReportSnapshot.assessment_id,
+            cast(AssessmentReportSnapshot.report, Text),
+            AssessmentReportSnapshot.content_hash,
+        )
+        .join(Assessment, Assessment.id == AssessmentReportSnapshot.assessment_id)
+        .join(fingerprints, fingerprints.c.framework_id == Assessment.framework_id)
+        .where(
+            AssessmentReportSnapshot.schema_version == REPORT_SNAPSHOT_VERSION,
+            AssessmentReportSnapshot.framework_fingerprint == fingerprints.c.fingerprint,
+        )
+    )
+
+
+async def load_report_snapshot(db: AsyncSession, assessment_id: UUID) -> Optional[ReportSnapshot]:
+    """
+    Load a valid snapshot as pre-serialized JSON text.
+
+    Snapshots built by an older snapshot format or from changed framework content are ignored.
+    """
+    row = (
+        await db.execute(
+            _valid_snapshots_query().where(AssessmentReportSnapshot.assessment_id == assessment_id)
+        )
+    ).first()
+
+    if row is None:
+        return None
+
+    return ReportSnapshot(report_json=row[1], content_hash=row[2])
+
+
+async def load_report_snapshots(
+    db: AsyncSession, assessment_ids: Sequence[UUID]
+) -> Dict[UUID, ReportSnapshot]:
+    """Valid snapshots of several assessments in one query; missing or stale ones are absent"""
+    rows = await db.execute(
+        _valid_snapshots_query().where(AssessmentReportSnapshot.assessment_id.in_(assessment_ids))
+    )
+    return {
+        assessment_id: ReportSnapshot(report_json=report_json, content_hash=content_hash)
+        for assessment_id, report_json, content_hash in rows.all()
+    }
+
+
+async def invalidate_report_snapshot(db: AsyncSession, assessment_id: UUID) -> None:
+    """Drop an assessment's snapshot (flushed with the caller's transaction)"""
+    await db.execute(
+        delete(AssessmentReportSnapshot).where(
+            AssessmentReportSnapshot.assessment_id == assessment_id
+        )
+    )
+
+
+async def get_report_snapshot(db: AsyncSession, assessment: Assessment) -> ReportSnapshot:
+    """Get the report snapshot for a completed assessment, rebuilding it if missing or stale"""
+    snapshot = await load_report_snapshot(db, assessment.id)
+    if snapshot is not None:
+        return snapshot
+
+    gate_scores = (
+        await db.scalars(select(GateScore).where(GateScore.assessment_id == assessment.id))
+    ).all()
+    domain_scores = (
+        await db.scalars(select(DomainScore).where(DomainScore.assessment_id == assessment.id))
+    ).all()
+    findings = (
+        await db.scalars(select(ScoreFinding).where(ScoreFinding.assessment_id == assessment.id))
+    ).all()
+
+    report = await scoring.generate_report(db, assessment, gate_scores, domain_scores, findings)
+    snapshot = await store_report_snapshot(db, assessment, report)
+    await db.commit()
+
+    return snapshot
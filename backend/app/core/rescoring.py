@@ -0,0 +1,579 @@
+"""Bulk rescoring - recompute the stored scores of every completed assessment of a framework
+
+All assessments are scored at once from a dense assessment x question response matrix.
+Results are identical to the scalar scoring core, so an unchanged framework reports no deltas.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.core import live_scores, trends
+from app.core.framework_index import build_framework_index
+from app.core.scoring_core import (
+    GAP_MAX_SCORE,
+    MAX_DOMAIN_FINDINGS,
+    MAX_QUESTION_SCORE,
+    STRENGTH_MIN_SCORE,
+    ScoringFramework,
+)
+from app.database import SessionLocal
+from app.models import (
+    Assessment,
+    AssessmentReportSnapshot,
+    AssessmentStatus,
+    DomainScore,
+    GateResponse,
+    GateScore,
+    ScoreFinding,
+)
+
+UNANSWERED = -1  # Response matrix value of a question without a response
+MATURITY_BOUNDS = (20, 40, 60, 80)  # Inclusive upper bounds of levels 1-4 (get_maturity_level)
+LARGEST_CHANGES = 20  # Assessments listed in the summary
+
+# (domain_id, kind, question_id, score) of one strength or gap
+FindingRef = Tuple[UUID, str, UUID, int]
+
+# (gate_id, total, answered, percentage) of one scored gate
+GateRef = Tuple[UUID, int, int, float]
+
+
+@dataclass(frozen=True)
+class MatrixScores:
+    """Scores of a response matrix; rows are assessments, columns domains in framework order"""
+
+    domain_scores: np.ndarray  # (assessments, domains), rounded to 2 places
+    domain_levels: np.ndarray  # (assessments, domains)
+    overall_scores: np.ndarray  # (assessments,), rounded to 2 places
+    overall_levels: np.ndarray  # (assessments,)
+
+
+def maturity_levels(scores: np.ndarray) -> np.ndarray:
+    """Maturity level numbers of an array of scores"""
+    return np.searchsorted(MATURITY_BOUNDS, scores, side="left") + 1
+
+
+def round_scores(values: np.ndarray) -> np.ndarray:
+    """Round to 2 places exactly like the builtin round() used by the scoring core"""
+    # np.round scales, rounds and unscales, which can differ in the last place
+    rounded = [round(value, 2) for value in values.ravel().tolist()]
+    return np.array(rounded, dtype=float).reshape(values.shape)
+
+
+def membership_matrix(framework: ScoringFramework) -> np.ndarray:
+    """(questions, domains) 0/1 matrix; rows follow `framework.question_ids`"""
+    matrix = np.zeros((len(framework.question_ids), len(framework.domains)), dtype=np.int64)
+    start = 0
+    for column, domain in enumerate(framework.domains):
+        matrix[start:start + len(domain.questions), column] = 1
+        start += len(domain.questions)
+    return matrix
+
+
+def score_matrix(framework: ScoringFramework, responses: np.ndarray) -> MatrixScores:
+    """
+    Score an (assessments, questions) response matrix with the rules of
+    `scoring_core.score_responses`. Columns follow `framework.question_ids`.
+    """
+    values = np.where(responses == UNANSWERED, 0, responses).astype(np.int64)
+    totals = values @ membership_matrix(framework)
+
+    max_possible = np.array(
+        [len(d.questions) * MAX_QUESTION_SCORE for d in framework.domains], dtype=float
+    )
+    # Domains without questions score 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(max_possible > 0, totals / max_possible * 100, 0.0)
+
+    domain_scores = round_scores(percent)
+
+    # Accumulate domain by domain, in the same order as the scalar weighted average
+    total_weight = 0.0
+    weighted_sum = np.zeros(len(responses))
+    for column, domain in enumerate(framework.domains):
+        total_weight += domain.weight
+        weighted_sum += domain_scores[:, column] * domain.weight
+
+    if total_weight == 0:
+        overall_scores = np.zeros(len(responses))
+    else:
+        overall_scores = round_scores(weighted_sum / total_weight)
+
+    return MatrixScores(
+        domain_scores=domain_scores,
+        domain_levels=maturity_levels(percent),
+        overall_scores=overall_scores,
+        overall_levels=maturity_levels(overall_scores),
+    )
+
+
+def gate_membership(framework: ScoringFramework) -> Tuple[List[Hashable], np.ndarray]:
+    """Gate ids in framework order and the (questions, gates) 0/1 matrix"""
+    gate_ids: List[Hashable] = list(
+        dict.fromkeys(q.gate_id for d in framework.domains for q in d.questions)
+    )
+    columns = {gate_id: i for i, gate_id in enumerate(gate_ids)}
+    matrix = np.zeros((len(framework.question_ids), len(gate_ids)), dtype=np.int64)
+    questions = (q for d in framework.domains for q in d.questions)
+    for row, question in enumerate(questions):
+        matrix[row, columns[question.gate_id]] = 1
+    return gate_ids, matrix
+
+
+def gate_scores(framework: ScoringFramework, responses: np.ndarray) -> List[List[GateRef]]:
+    """
+    Scored gates of each assessment with the rules of `scoring_core.score_gates`: over
+    answered questions only, and only gates with at least one response.
+    """
+    gate_ids, membership = gate_membership(framework)
+    answered_mask = responses != UNANSWERED
+    totals = np.where(answered_mask, responses, 0).astype(np.int64) @ membership
+    answered = answered_mask.astype(np.int64) @ membership
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentages = round_scores(totals / (answered * MAX_QUESTION_SCORE) * 100)
+
+    gates: List[List[GateRef]] = [[] for _ in range(len(responses))]
+    rows, columns = np.nonzero(answered)
+    for row, column in zip(rows.tolist(), columns.tolist()):
+        gates[row].append((
+            gate_ids[column],
+            int(totals[row, column]),
+            int(answered[row, column]),
+            float(percentages[row, column]),
+        ))
+    return gates
+
+
+def domain_findings(framework: ScoringFramework, responses: np.ndarray) -> List[List[FindingRef]]:
+    """Strengths and gaps of each assessment, domain by domain in framework question order"""
+    findings: List[List[FindingRef]] = [[] for _ in range(len(responses))]
+    strong = responses >= STRENGTH_MIN_SCORE
+    weak = (responses != UNANSWERED) & (responses <= GAP_MAX_SCORE)
+
+    start = 0
+    for domain in framework.domains:
+        end = start + len(domain.questions)
+        question_ids = [q.id for q in domain.questions]
+        for kind, mask in (("strength", strong), ("gap", weak)):
+            hits = mask[:, start:end]
+            # Keep the first MAX_DOMAIN_FINDINGS hits of each assessment
+            hits = hits & (np.cumsum(hits, axis=1) <= MAX_DOMAIN_FINDINGS)
+            rows, offsets = np.nonzero(hits)  # Row-major: question order within each row
+            scores = responses[rows, start + offsets].tolist()
+            for row, offset, score in zip(rows.tolist(), offsets.tolist(), scores):
+                findings[row].append((domain.id, kind, question_ids[offset], score))
+        start = end
+
+    return findings
+
+
+def _completed(framework_id: UUID):
+    return (
+        Assessment.framework_id == framework_id,
+        Assessment.status == AssessmentStatus.COMPLETED,
+    )
+
+
+def load_response_matrix(
+    db: Session,
+    framework_id: UUID,
+    framework: ScoringFramework,
+    assessment_ids: Sequence[UUID],
+    batch_size: int,
+) -> np.ndarray:
+    """Dense (assessments, questions) matrix of response scores, UNANSWERED where missing"""
+    rows = {assessment_id: i for i, assessment_id in enumerate(assessment_ids)}
+    columns = {question_id: i for i, question_id in enumerate(framework.question_ids)}
+    matrix = np.full((len(rows), len(columns)), UNANSWERED, dtype=np.int8)
+
+    result = db.execute(
+        select(GateResponse.assessment_id, GateResponse.question_id, GateResponse.score)
+        .join(Assessment, Assessment.id == GateResponse.assessment_id)
+        .where(*_completed(framework_id))
+        .execution_options(yield_per=batch_size)
+    )
+    for partition in result.partitions():
+        # Skip responses to removed questions and assessments completed since loading
+        cells = [
+            (rows[assessment_id], columns[question_id], score)
+            for assessment_id, question_id, score in partition
+            if assessment_id in rows and question_id in columns
+        ]
+        if cells:
+            row_index, column_index, scores = zip(*cells)
+            matrix[list(row_index), list(column_index)] = scores
+
+    return matrix
+
+
+def rescore_framework(
+    db: Session, framework_id: UUID, dry_run: bool = True, batch_size: int = 1000
+) -> Optional[schemas.RescoreSummary]:
+    """
+    Recompute domain scores, overall scores and maturity levels of every completed assessment
+    of a framework against its current structure, e.g. after a domain weight changed or a
+    question was added.
+
+    Unless `dry_run`, changed assessments are written with batched upserts, their gate
+    scores replaced, their trend rollups adjusted and their report snapshots dropped, and the
+    running domain totals of the framework's assessments are rebuilt, all in the caller's
+    transaction. Returns None if the framework does not exist.
+
+    This is CPU-bound; the API runs it through `run_rescore` in a worker thread.
+    """
+    index = build_framework_index(db, framework_id)
+    if index is None:
+        return None
+    framework = index.scoring
+    domain_ids = [d.id for d in framework.domains]
+    domain_columns = {domain_id: i for i, domain_id in enumerate(domain_ids)}
+
+    assessments = db.execute(
+        select(
+            Assessment.id,
+            Assessment.assessor_id,
+            Assessment.organization_id,
+            Assessment.team_name,
+            Assessment.completed_at,
+            Assessment.overall_score,
+            Assessment.maturity_level,
+        )
+        .where(*_completed(framework_id))
+        .order_by(Assessment.id)
+    ).all()
+    rows = {a.id: i for i, a in enumerate(assessments)}
+
+    responses = load_response_matrix(db, framework_id, framework, list(rows), batch_size)
+    scores = score_matrix(framework, responses)
+    findings = domain_findings(framework, responses)
+    gates = gate_scores(framework, responses)
+
+    # Currently stored values; NaN marks a missing score
+    old_overall = np.array(
+        [np.nan if a.overall_score is None else a.overall_score for a in assessments], dtype=float
+    )
+    old_levels = np.array([a.maturity_level or 0 for a in assessments], dtype=np.int64)
+    old_domain_scores = np.full(scores.domain_scores.shape, np.nan)
+    old_domain_levels = np.zeros(scores.domain_levels.shape, dtype=np.int64)
+    has_domain_row = np.zeros(scores.domain_scores.shape, dtype=bool)
+
+    stored = db.execute(
+        select(
+            DomainScore.assessment_id,
+            DomainScore.domain_id,
+            DomainScore.score,
+            DomainScore.maturity_level,
+        )
+        .join(Assessment, Assessment.id == DomainScore.assessment_id)
+        .where(*_completed(framework_id))
+        .execution_options(yield_per=batch_size)
+    )
+    for assessment_id, domain_id, score, level in stored:
+        row, column = rows.get(assessment_id), domain_columns.get(domain_id)
+        if row is None or column is None:
+            continue
+        has_domain_row[row, column] = True
+        old_domain_scores[row, column] = score
+        old_domain_levels[row, column] = level
+
+    stored_findings: List[set] = [set() for _ in assessments]
+    for assessment_id, *finding in db.execute(
+        select(
+            ScoreFinding.assessment_id,
+            ScoreFinding.domain_id,
+            ScoreFinding.kind,
+            ScoreFinding.question_id,
+            ScoreFinding.score,
+        )
+        .join(Assessment, Assessment.id == ScoreFinding.assessment_id)
+        .where(*_completed(framework_id))
+        .execution_options(yield_per=batch_size)
+    ):
+        row = rows.get(assessment_id)
+        if row is not None:
+            stored_findings[row].add(tuple(finding))
+    findings_changed = np.array(
+        [set(new) != old for new, old in zip(findings, stored_findings)], dtype=bool
+    )
+
+    stored_gates: List[set] = [set() for _ in assessments]
+    for assessment_id, *gate in db.execute(
+        select(
+            GateScore.assessment_id,
+            GateScore.gate_id,
+            GateScore.total,
+            GateScore.answered,
+            GateScore.percentage,
+        )
+        .join(Assessment, Assessment.id == GateScore.assessment_id)
+        .where(*_completed(framework_id))
+        .execution_options(yield_per=batch_size)
+    ):
+        row = rows.get(assessment_id)
+        if row is not None:
+            stored_gates[row].add(tuple(gate))
+    gates_changed = np.array(
+        [set(new) != old for new, old in zip(gates, stored_gates)], dtype=bool
+    )
+
+    # NaN compares unequal, so assessments or domains without stored scores count as changed
+    changed = (
+        (old_overall != scores.overall_scores)
+        | (old_levels != scores.overall_levels)
+        | (old_domain_scores != scores.domain_scores).any(axis=1)
+        | (old_domain_levels != scores.domain_levels).any(axis=1)
+        | findings_changed
+        | gates_changed
+    )
+
+    summary = _summary(
+        framework_id, index.framework.version, dry_run, assessments, framework,
+        scores, old_overall, old_levels, old_domain_scores, changed,
+    )
+
+    if dry_run:
+        return summary
+
+    # Question deletes cascade to responses without touching the totals; rebuild them all
+    for stmt in live_scores.rebuild_domain_totals(framework_id):
+        db.execute(stmt)
+
+    changed_rows = np.flatnonzero(changed).tolist()
+    if not changed_rows:
+        return summary
+
+    now = datetime.utcnow()
+    for start in range(0, len(changed_rows), batch_size):
+        batch = changed_rows[start:start + batch_size]
+        batch_ids = [assessments[row].id for row in batch]
+
+        db.execute(update(Assessment), [
+            {
+                "id": assessments[row].id,
+                "overall_score": float(scores.overall_scores[row]),
+                "maturity_level": int(scores.overall_levels[row]),
+                "updated_at": now,
+            }
+            for row in batch
+        ])
+
+        if domain_ids:
+            stmt = pg_insert(DomainScore).values([
+                {
+                    "assessment_id": assessments[row].id,
+                    "domain_id": domain_id,
+                    "score": float(scores.domain_scores[row, column]),
+                    "maturity_level": int(scores.domain_levels[row, column]),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for row in batch
+                for column, domain_id in enumerate(domain_ids)
+            ])
+            db.execute(stmt.on_conflict_do_update(
+                constraint="uq_domain_score_assessment_domain",
+                set_={
+                    "score": stmt.excluded.score,
+                    "maturity_level": stmt.excluded.maturity_level,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ))
+
+        db.execute(delete(ScoreFinding).where(ScoreFinding.assessment_id.in_(batch_ids)))
+        finding_rows = [
+            {
+                "assessment_id": assessments[row].id,
+                "organization_id": assessments[row].organization_id,
+                "domain_id": domain_id,
+                "question_id": question_id,
+                "kind": kind,
+                "score": score,
+            }
+            for row in batch
+            for domain_id, kind, question_id, score in findings[row]
+        ]
+        if finding_rows:
+            db.execute(insert(ScoreFinding), finding_rows)
+
+        db.execute(delete(GateScore).where(GateScore.assessment_id.in_(batch_ids)))
+        gate_rows = [
+            {
+                "assessment_id": assessments[row].id,
+                "gate_id": gate_id,
+                "total": total,
+                "answered": answered,
+                "max_total": answered * MAX_QUESTION_SCORE,
+                "percentage": percentage,
+                "created_at": now,
+            }
+            for row in batch
+            for gate_id, total, answered, percentage in gates[row]
+        ]
+        if gate_rows:
+            db.execute(insert(GateScore), gate_rows)
+
+        # Snapshots are rebuilt from the new scores on the next report request
+        db.execute(
+            delete(AssessmentReportSnapshot)
+            .where(AssessmentReportSnapshot.assessment_id.in_(batch_ids))
+        )
+
+    rollup_rows = _rollup_deltas(
+        assessments, domain_ids, changed_rows, scores,
+        old_overall, old_levels, old_domain_scores, old_domain_levels, has_domain_row, now,
+    )
+    for start in range(0, len(rollup_rows), batch_size):
+        db.execute(trends.rollup_upsert(rollup_rows[start:start + batch_size]))
+
+    return summary
+
+
+def run_rescore(
+    framework_id: UUID, dry_run: bool = True, batch_size: int = 1000
+) -> Optional[schemas.RescoreSummary]:
+    """
+    `rescore_framework` on its own session, committed unless `dry_run`.
+
+    Blocking; async callers run it with `asyncio.to_thread` so the event loop keeps serving
+    requests while the matrices are scored.
+    """
+    with SessionLocal() as db:
+        summary = rescore_framework(db, framework_id, dry_run=dry_run, batch_size=batch_size)
+        if summary is not None and not dry_run:
+            db.commit()
+        return summary
+
+
+def _summary(
+    framework_id: UUID,
+    framework_version: str,
+    dry_run: bool,
+    assessments: Sequence,
+    framework: ScoringFramework,
+    scores: MatrixScores,
+    old_overall: np.ndarray,
+    old_levels: np.ndarray,
+    old_domain_scores: np.ndarray,
+    changed: np.ndarray,
+) -> schemas.RescoreSummary:
+    deltas = scores.overall_scores - old_overall
+    known = ~np.isnan(deltas)
+
+    domain_mean_deltas: Dict[str, float] = {}
+    domain_deltas = scores.domain_scores - old_domain_scores
+    for column, domain in enumerate(framework.domains):
+        values = domain_deltas[:, column]
+        values = values[~np.isnan(values)]
+        domain_mean_deltas[domain.name] = round(float(values.mean()), 2) if len(values) else 0.0
+
+    # Largest absolute change first; assessments without a previous score lead
+    magnitude = np.where(known, np.abs(np.nan_to_num(deltas)), np.inf)
+    candidates = np.flatnonzero(changed)
+    largest = candidates[np.argsort(-magnitude[candidates], kind="stable")][:LARGEST_CHANGES]
+
+    return schemas.RescoreSummary(
+        framework_id=framework_id,
+        framework_version=framework_version,
+        dry_run=dry_run,
+        assessments=len(assessments),
+        changed=int(changed.sum()),
+        maturity_changes=int((old_levels != scores.overall_levels).sum()),
+        max_abs_delta=round(float(np.abs(deltas[known]).max()), 2) if known.any() else 0.0,
+        mean_delta=round(float(deltas[known].mean()), 2) if known.any() else 0.0,
+        domain_mean_deltas=domain_mean_deltas,
+        largest_changes=[
+            schemas.RescoreChange(
+                assessment_id=assessments[row].id,
+                team_name=assessments[row].team_name,
+                old_score=None if np.isnan(old_overall[row]) else float(old_overall[row]),
+                new_score=float(scores.overall_scores[row]),
+                delta=round(float(deltas[row]), 2) if known[row] else None,
+                old_maturity_level=assessments[row].maturity_level,
+                new_maturity_level=int(scores.overall_levels[row]),
+            )
+            for row in largest.tolist()
+        ],
+    )
+
+
+def _rollup_deltas(
+    assessments: Sequence,
+    domain_ids: List[UUID],
+    changed_rows: List[int],
+    scores: MatrixScores,
+    old_overall: np.ndarray,
+    old_levels: np.ndarray,
+    old_domain_scores: np.ndarray,
+    old_domain_levels: np.ndarray,
+    has_domain_row: np.ndarray,
+    now: datetime,
+) -> List[dict]:
+    """Rollup upsert rows moving changed assessments from their old to their new scores"""
+    totals: Dict[tuple, List[float]] = defaultdict(lambda: [0.0, 0, 0])
+
+    for row in changed_rows:
+        assessment = assessments[row]
+        if assessment.completed_at is None:
+            continue
+        # Same condition as trends.is_rolled_up for the stored values
+        was_rolled_up = not np.isnan(old_overall[row])
+
+        entries = []
+        if was_rolled_up:
+            entries.append((
+                None,
+                scores.overall_scores[row] - old_overall[row],
+                scores.overall_levels[row] - old_levels[row],
+                0,
+            ))
+        else:
+            entries.append((None, scores.overall_scores[row], scores.overall_levels[row], 1))
+
+        for column, domain_id in enumerate(domain_ids):
+            if was_rolled_up and has_domain_row[row, column]:
+                entries.append((
+                    domain_id,
+                    scores.domain_scores[row, column] - old_domain_scores[row, column],
+                    scores.domain_levels[row, column] - old_domain_levels[row, column],
+                    0,
+                ))
+            else:
+                entries.append((
+                    domain_id,
+                    scores.domain_scores[row, column],
+                    scores.domain_levels[row, column],
+                    1,
+                ))
+
+        for granularity in trends.GRANULARITIES:
+            start = trends.bucket_start(assessment.completed_at, granularity)
+            for domain_id, score, level, count in entries:
+                total = totals[(assessment.assessor_id, granularity, start, domain_id)]
+                total[0] += float(score)
+                total[1] += int(level)
+                total[2] += count
+
+    return [
+        {
+            "assessor_id": assessor_id,
+            "granularity": granularity,
+            "bucket_start": start,
+            "domain_id": domain_id,
+            "score_sum": score_sum,
+            "maturity_sum": maturity_sum,
+            "assessment_count": count,
+            "updated_at": now,
+        }
+        for (assessor_id, granularity, start, domain_id), (score_sum, maturity_sum, count)
+        in totals.items()
+        if score_sum or maturity_sum or count
+    ]
@@ -1,105 +1,110 @@
 """Scoring engine for assessments - Dynamic Spec"""
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import schemas
-from app.models import Assessment, GateResponse, DomainScore, FrameworkDomain, FrameworkQuestion, FrameworkGate
-
-def calculate_scores(db: Session, assessment: Assessment, gate_responses: List[GateResponse]) -> Dict[UUID, Dict]:
+from app.core import metrics, scoring_core
+from app.core.framework_index import FrameworkIndex, get_framework_index
+from app.core.scoring_core import get_maturity_level
+from app.models import Assessment, DomainScore, GateResponse, GateScore, ScoreFinding
+
+@metrics.timed(metrics.scoring_duration_seconds, operation="calculate_scores")
+async def calculate_scores(
+    db: AsyncSession,
+    assessment: Assessment,
+    gate_responses: List[GateResponse],
+) -> Dict[UUID, Dict]:
     """
     Calculate scores for each domain from gate responses based on Framework definitions.
     """
 
-    # 1. Fetch Framework Structure
-    framework_id = assessment.framework_id
-    domains = db.query(FrameworkDomain).filter(FrameworkDomain.framework_id == framework_id).all()
-
-    domain_scores = {}
-
-    # Pre-fetch questions to map question_id -> gate -> domain
-    # Or rely on joined loading in GateResponse if configured, but here we iterate domains
-
-    # Optimization: Load all responses into a map
-    response_map = {r.question_id: r for r in gate_responses}
-
-    for domain in domains:
-        # Get all gates for this domain
-        gates = db.query(FrameworkGate).filter(FrameworkGate.domain_id == domain.id).all()
-        gate_ids = [g.id for g in gates]
-
-        # Get all questions for these gates
-        questions = db.query(FrameworkQuestion).filter(FrameworkQuestion.gate_id.in_(gate_ids)).all()
-        question_ids = [q.id for q in questions]
-
-        # Calculate score
-        total_score = 0
-        max_possible = len(questions) * 5
+    # 1. Fetch compiled framework structure (cached per framework version)
+    index = await get_framework_index(db, assessment.framework_id)
+    if index is None:
+        return {}
 
-        strengths = []
-        gaps = []
+    # 2. Score the response vector with the pure scoring core
+    responses = {r.question_id: r.score for r in gate_responses}
 
-        for q in questions:
-            resp = response_map.get(q.id)
-            if resp:
-                total_score += resp.score
-
-                # Identify strengths/gaps
-                # Need gate name for context
-                gate = next((g for g in gates if g.id == q.gate_id), None)
-                gate_name = gate.name if gate else "Unknown Gate"
-
-                if resp.score >= 4:
-                    strengths.append(f"{gate_name} - {q.text[:50]}...: Score {resp.score}/5")
-                elif resp.score <= 2:
-                    gaps.append(f"{gate_name} - {q.text[:50]}...: Score {resp.score}/5")
-
-        score_percent = (total_score / max_possible) * 100 if max_possible > 0 else 0.0
-        maturity_level, _ = get_maturity_level(score_percent)
-
-        domain_scores[domain.id] = {
+    return {
+        domain.id: {
             "domain_name": domain.name,
-            "score": round(score_percent, 2),
-            "maturity_level": maturity_level,
-            "strengths": strengths[:5],
-            "gaps": gaps[:5],
+            "score": domain.score,
+            "maturity_level": domain.maturity_level,
+            "strengths": list(domain.strengths),
+            "gaps": list(domain.gaps),
             "weight": domain.weight
         }
+        for domain in scoring_core.score_domains(index.scoring, responses)
+    }
 
-    return domain_scores
-
-
-def calculate_overall_score(db: Session, assessment: Assessment, domain_scores: Dict[UUID, Dict]) -> float:
-    """
-    Calculate weighted average of domain scores.
-    """
-    # Normalize weights if they don't sum to 1?
-    # Assuming weights are relative (e.g. 0.15, 0.25...)
-
-    total_weight = sum(d["weight"] for d in domain_scores.values())
-    weighted_sum = sum(d["score"] * d["weight"] for d in domain_scores.values())
-
-    if total_weight == 0:
-        return 0.0
 
-    return round(weighted_sum / total_weight, 2)
+def build_score_findings(
+    assessment: Assessment, domain_scores: Dict[UUID, Dict]
+) -> List[ScoreFinding]:
+    """Finding records (not yet added to the session) for the strengths and gaps of each domain"""
+    return [
+        ScoreFinding(
+            assessment_id=assessment.id,
+            organization_id=assessment.organization_id,
+            domain_id=domain_id,
+            question_id=finding.question.id,
+            kind=kind,
+            score=finding.score,
+        )
+        for domain_id, info in domain_scores.items()
+        for kind, findings in (("strength", info["strengths"]), ("gap", info["gaps"]))
+        for finding in findings
+    ]
+
+
+def render_findings(
+    index: Optional[FrameworkIndex], findings: List[ScoreFinding]
+) -> Dict[tuple, List[str]]:
+    """Finding texts by (domain_id, kind), in framework question order"""
+    rendered: Dict[tuple, List[str]] = {}
+    if index is None:
+        return rendered
+
+    known = (f for f in findings if f.question_id in index.questions)
+    for finding in sorted(known, key=lambda f: index.questions[f.question_id].ordinal):
+        question = index.questions[finding.question_id]
+        gate_name = index.gates[question.gate_id].name
+        text = scoring_core.finding_text(gate_name, question.text, finding.score)
+        rendered.setdefault((finding.domain_id, finding.kind), []).append(text)
+    return rendered
+
+
+async def calculate_gate_scores(
+    db: AsyncSession, assessment: Assessment, gate_responses: List[GateResponse]
+) -> List[GateScore]:
+    """Gate score records (not yet added to the session) for gates with responses"""
+    index = await get_framework_index(db, assessment.framework_id)
+    if index is None:
+        return []
+
+    responses = {r.question_id: r.score for r in gate_responses}
+
+    return [
+        GateScore(
+            assessment_id=assessment.id,
+            gate_id=gate.id,
+            total=gate.total,
+            answered=gate.answered,
+            max_total=gate.answered * scoring_core.MAX_QUESTION_SCORE,
+            percentage=gate.percentage,
+        )
+        for gate in scoring_core.score_gates(index.scoring, responses)
+    ]
 
 
-def get_maturity_level(score: float) -> Tuple[int, str]:
+def calculate_overall_score(db: AsyncSession, assessment: Assessment, domain_scores: Dict[UUID, Dict]) -> float:
     """
-    Map overall score to maturity level.
+    Calculate weighted average of domain scores.
     """
-    if score <= 20:
-        return (1, "Initial")
-    elif score <= 40:
-        return (2, "Developing")
-    elif score <= 60:
-        return (3, "Defined")
-    elif score <= 80:
-        return (4, "Managed")
-    else:
-        return (5, "Optimizing")
+    return scoring_core.overall_score((d["score"], d["weight"]) for d in domain_scores.values())
 
 
 def get_maturity_level_description(level: int) -> str:
@@ -114,8 +119,13 @@ def get_maturity_level_description(level: int) -> str:
     return descriptions.get(level, "Unknown")
 
 
-def generate_report(
-    db: Session, assessment: Assessment, gate_responses: List[GateResponse], domain_scores: List[DomainScore]
+@metrics.timed(metrics.scoring_duration_seconds, operation="generate_report")
+async def generate_report(
+    db: AsyncSession,
+    assessment: Assessment,
+    stored_gate_scores: List[GateScore],
+    domain_scores: List[DomainScore],
+    findings: List[ScoreFinding],
 ) -> schemas.AssessmentReport:
     """Generate complete assessment report"""
 
@@ -127,16 +137,14 @@ def generate_report(
     )
 
     # Domain breakdown
-    # Need to fetch domain names since they are not stored in DomainScore directly (only ID)
-    # Actually, we can fetch the FrameworkDomain objects
+    # Domain and gate names come from the compiled framework index
+    index = await get_framework_index(db, assessment.framework_id)
+    domain_name_map = {d.id: d.name for d in index.domains} if index else {}
 
-    domain_breakdown = []
+    # Strengths and gaps are stored as (question, score) references; render them now
+    finding_texts = render_findings(index, findings)
 
-    # Pre-fetch domain definitions
-    framework_domains = db.query(FrameworkDomain).filter(
-        FrameworkDomain.id.in_([ds.domain_id for ds in domain_scores])
-    ).all()
-    domain_name_map = {d.id: d.name for d in framework_domains}
+    domain_breakdown = []
 
     for ds in domain_scores:
         domain_breakdown.append(
@@ -144,55 +152,33 @@ def generate_report(
                 domain=domain_name_map.get(ds.domain_id, "Unknown Domain"),
                 score=ds.score,
                 maturity_level=ds.maturity_level,
-                strengths=ds.strengths or [],
-                gaps=ds.gaps or [],
+                strengths=finding_texts.get((ds.domain_id, "strength"), []),
+                gaps=finding_texts.get((ds.domain_id, "gap"), []),
             )
         )
 
-    # Gate scores
-    # Need to map question_id -> gate -> name
-    # Fetch all questions involved
-    question_ids = [r.question_id for r in gate_responses]
-    questions = db.query(FrameworkQuestion).filter(FrameworkQuestion.id.in_(question_ids)).options(joinedload(FrameworkQuestion.gate)).all()
-
-    question_gate_map = {q.id: q.gate for q in questions}
-
-    gate_scores_data = {} # gate_id -> {total, count, name}
-
-    for response in gate_responses:
-        gate = question_gate_map.get(response.question_id)
-        if not gate:
-            continue
-
-        gate_id = str(gate.id)
-        if gate_id not in gate_scores_data:
-            gate_scores_data[gate_id] = {"total": 0, "count": 0, "name": gate.name}
-
-        gate_scores_data[gate_id]["total"] += response.score
-        gate_scores_data[gate_id]["count"] += 1
-
-    gate_scores = []
-    for gate_id, data in gate_scores_data.items():
-        max_score = data["count"] * 5
-        score = data["total"]
-        percentage = (score / max_score * 100) if max_score > 0 else 0
-
-        gate_scores.append(
-            schemas.GateScore(
-                gate_id=gate_id,
-                gate_name=data["name"],
-                score=float(score),
-                max_score=float(max_score),
-                percentage=round(percentage, 2),
-            )
+    # Gate scores stored at submit time, in framework order
+    gate_order = {gate_id: i for i, gate_id in enumerate(index.gates)} if index else {}
+    gate_scores = [
+        schemas.GateScore(
+            gate_id=str(gs.gate_id),
+            gate_name=index.gates[gs.gate_id].name,
+            score=float(gs.total),
+            max_score=float(gs.max_total),
+            percentage=gs.percentage,
+        )
+        for gs in sorted(
+            (gs for gs in stored_gate_scores if gs.gate_id in gate_order),
+            key=lambda gs: gate_order[gs.gate_id],
         )
+    ]
 
     # Aggregate top strengths and gaps from all domains
     all_strengths = []
     all_gaps = []
-    for ds in domain_scores:
-        all_strengths.extend(ds.strengths or [])
-        all_gaps.extend(ds.gaps or [])
+    for breakdown in domain_breakdown:
+        all_strengths.extend(breakdown.strengths)
+        all_gaps.extend(breakdown.gaps)
 
     # Generate recommendations based on gaps
     recommendations = []
@@ -0,0 +1,309 @@
+"""Pure scoring core - a framework definition and a response vector in, scores out
+
+No database, ORM or web imports: used by the API (through the compiled framework index)
+and by offline tooling such as `python -m app.cli score`.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+MAX_QUESTION_SCORE = 5
+STRENGTH_MIN_SCORE = 4  # Responses at or above this are strengths
+GAP_MAX_SCORE = 2  # Responses at or below this are gaps
+MAX_DOMAIN_FINDINGS = 5  # Strengths/gaps kept per domain
+
+
+@dataclass(frozen=True)
+class QuestionDef:
+    """Question as seen by the scoring core"""
+
+    id: Hashable
+    text: str
+    gate_id: Hashable
+    gate_name: str
+
+
+@dataclass(frozen=True)
+class DomainDef:
+    """Domain with its questions in framework order"""
+
+    id: Hashable
+    name: str
+    weight: float
+    questions: Tuple[QuestionDef, ...]
+
+
+class ScoringFramework:
+    """Ordered domains and questions of one framework"""
+
+    __slots__ = ("name", "version", "domains", "question_ids")
+
+    def __init__(self, domains: Iterable[DomainDef], name: str = "", version: str = ""):
+        self.name = name
+        self.version = version
+        self.domains: Tuple[DomainDef, ...] = tuple(domains)
+        # All question ids in framework order
+        self.question_ids: Tuple[Hashable, ...] = tuple(
+            q.id for d in self.domains for q in d.questions
+        )
+
+
+@dataclass(frozen=True)
+class Finding:
+    """A strength or gap: a response score and the question it answers"""
+
+    question: QuestionDef
+    score: int
+
+    @property
+    def text(self) -> str:
+        return finding_text(self.question.gate_name, self.question.text, self.score)
+
+
+@dataclass(frozen=True)
+class DomainResult:
+    """Score of one domain"""
+
+    id: Hashable
+    name: str
+    weight: float
+    score: float  # 0-100, rounded to 2 places
+    maturity_level: int  # 1-5
+    strengths: Tuple[Finding, ...]
+    gaps: Tuple[Finding, ...]
+
+
+@dataclass(frozen=True)
+class GateResult:
+    """Score of one gate over its answered questions"""
+
+    id: Hashable
+    name: str
+    total: int  # Sum of response scores
+    answered: int
+    percentage: float  # Of answered * 5, rounded to 2 places
+
+
+@dataclass(frozen=True)
+class ScoreResult:
+    """Domain scores plus the weighted overall score"""
+
+    domains: Tuple[DomainResult, ...]
+    overall_score: float
+    maturity_level: int
+
+
+def get_maturity_level(score: float) -> Tuple[int, str]:
+    """
+    Map overall score to maturity level.
+    """
+    if score <= 20:
+        return (1, "Initial")
+    elif score <= 40:
+        return (2, "Developing")
+    elif score <= 60:
+        return (3, "Defined")
+    elif score <= 80:
+        return (4, "Managed")
+    else:
+        return (5, "Optimizing")
+
+
+def finding_text(gate_name: str, question_text: str, score: int) -> str:
+    """Strength/gap description for one response"""
+    return f"{gate_name} - {question_text[:50]}...: Score {score}/{MAX_QUESTION_SCORE}"
+
+
+def domain_score(total: int, max_possible: int) -> Tuple[float, int]:
+    """Score (0-100, rounded to 2 places) and maturity level of a domain's response total"""
+    score_percent = (total / max_possible) * 100 if max_possible > 0 else 0.0
+    maturity_level, _ = get_maturity_level(score_percent)
+    return round(score_percent, 2), maturity_level
+
+
+def score_domains(
+    framework: ScoringFramework, responses: Mapping[Hashable, int]
+) -> Tuple[DomainResult, ...]:
+    """
+    Score every domain from a response vector (question id -> 0-5 score).
+
+    Unanswered questions count as 0 towards the domain maximum; responses to questions
+    outside the framework are ignored.
+    """
+    results = []
+    for domain in framework.domains:
+        total = 0
+        strengths: List[Finding] = []
+        gaps: List[Finding] = []
+
+        for question in domain.questions:
+            score = responses.get(question.id)
+            if score is None:
+                continue
+            total += score
+            if score >= STRENGTH_MIN_SCORE:
+                strengths.append(Finding(question, score))
+            elif score <= GAP_MAX_SCORE:
+                gaps.append(Finding(question, score))
+
+        score, maturity_level = domain_score(total, len(domain.questions) * MAX_QUESTION_SCORE)
+
+        results.append(DomainResult(
+            id=domain.id,
+            name=domain.name,
+            weight=domain.weight,
+            score=score,
+            maturity_level=maturity_level,
+            strengths=tuple(strengths[:MAX_DOMAIN_FINDINGS]),
+            gaps=tuple(gaps[:MAX_DOMAIN_FINDINGS]),
+        ))
+
+    return tuple(results)
+
+
+def score_gates(
+    framework: ScoringFramework, responses: Mapping[Hashable, int]
+) -> Tuple[GateResult, ...]:
+    """
+    Score every gate with at least one response, in framework order.
+
+    Unlike domains, gates are scored over answered questions only.
+    """
+    gates: Dict[Hashable, List] = {}  # gate id -> [name, total, answered]
+    for domain in framework.domains:
+        for question in domain.questions:
+            score = responses.get(question.id)
+            if score is None:
+                continue
+            gate = gates.setdefault(question.gate_id, [question.gate_name, 0, 0])
+            gate[1] += score
+            gate[2] += 1
+
+    return tuple(
+        GateResult(
+            id=gate_id,
+            name=name,
+            total=total,
+            answered=answered,
+            percentage=round(total / (answered * MAX_QUESTION_SCORE) * 100, 2),
+        )
+        for gate_id, (name, total, answered) in gates.items()
+    )
+
+
+def overall_score(scored: Iterable[Tuple[float, float]]) -> float:
+    """Weighted average of (score, weight) pairs, rounded to 2 places"""
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for score, weight in scored:
+        total_weight += weight
+        weighted_sum += score * weight
+
+    if total_weight == 0:
+        return 0.0
+
+    return round(weighted_sum / total_weight, 2)
+
+
+def score_responses(framework: ScoringFramework, responses: Mapping[Hashable, int]) -> ScoreResult:
+    """Domain scores, overall score and overall maturity level for one response vector"""
+    domains = score_domains(framework, responses)
+    overall = overall_score((d.score, d.weight) for d in domains)
+    maturity_level, _ = get_maturity_level(overall)
+    return ScoreResult(domains=domains, overall_score=overall, maturity_level=maturity_level)
+
+
+def _ordered(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Definition files may omit "order"; keep file order then
+    return sorted(items, key=lambda item: item.get("order", 0))
+
+
+def framework_from_definition(data: Mapping[str, Any]) -> ScoringFramework:
+    """
+    Build a ScoringFramework from a framework definition file.
+
+    Accepts the SpiraApp shape (`src/spiraapp-mvp/calms-framework.json`): `meta` plus
+    `domains[]` with `questions[]`. Domains may instead list `gates[]`, each with its own
+    `questions[]`; gateless domains get one implicit "<Domain> Assessment" gate, as when
+    seeding the database.
+    """
+    meta = data.get("meta", {})
+    domains = []
+    seen = set()
+
+    for domain in _ordered(list(data.get("domains", []))):
+        gates = domain.get("gates")
+        if gates is None:
+            gates = [{
+                "name": f"{domain['name']} Assessment",
+                "questions": domain.get("questions", []),
+            }]
+
+        questions = []
+        for gate in _ordered(list(gates)):
+            for question in _ordered(list(gate.get("questions", []))):
+                if question["id"] in seen:
+                    raise ValueError(f"Duplicate question id: {question['id']}")
+                seen.add(question["id"])
+                questions.append(QuestionDef(
+                    id=question["id"],
+                    text=question.get("text", ""),
+                    gate_id=gate.get("id", gate["name"]),
+                    gate_name=gate["name"],
+                ))
+
+        domains.append(DomainDef(
+            id=domain.get("id", domain["name"]),
+            name=domain["name"],
+            weight=float(domain.get("weight", 1.0)),
+            questions=tuple(questions),
+        ))
+
+    return ScoringFramework(
+        domains, name=meta.get("name", ""), version=str(meta.get("version", ""))
+    )
+
+
+def parse_responses(value: Any) -> Dict[Hashable, int]:
+    """
+    Normalize a response vector: a {question_id: score} mapping or a list of
+    {"question_id": ..., "score": ...} objects. Scores must be integers 0-5.
+    """
+    if isinstance(value, Mapping):
+        pairs = value.items()
+    elif isinstance(value, list):
+        pairs = ((item["question_id"], item["score"]) for item in value)
+    else:
+        raise ValueError("responses must be an object or a list")
+
+    responses: Dict[Hashable, int] = {}
+    for question_id, score in pairs:
+        if isinstance(score, bool) or not isinstance(score, int):
+            raise ValueError(f"Score for {question_id} must be an integer")
+        if not 0 <= score <= MAX_QUESTION_SCORE:
+            raise ValueError(f"Score for {question_id} must be between 0 and {MAX_QUESTION_SCORE}")
+        responses[question_id] = score
+    return responses
+
+
+def result_as_dict(result: ScoreResult, record_id: Optional[Any] = None) -> Dict[str, Any]:
+    """JSON-ready representation of a ScoreResult"""
+    _, level_name = get_maturity_level(result.overall_score)
+    return {
+        "id": record_id,
+        "overall_score": result.overall_score,
+        "maturity_level": result.maturity_level,
+        "maturity_name": level_name,
+        "domains": [
+            {
+                "id": str(d.id),
+                "name": d.name,
+                "weight": d.weight,
+                "score": d.score,
+                "maturity_level": d.maturity_level,
+                "strengths": [f.text for f in d.strengths],
+                "gaps": [f.text for f in d.gaps],
+            }
+            for d in result.domains
+        ],
+    }
@@ -1,5 +1,8 @@
 """Security utilities for authentication and authorization"""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -7,9 +10,16 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import settings
+from app.core.cache import TTLCache
+from app.core.rate_limit import AdmissionLimit
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Decoded token subjects, each kept until its token expires (token -> email)
+token_cache = TTLCache(
+    max_size=settings.TOKEN_CACHE_SIZE, ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
@@ -21,6 +31,51 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHashingBusyError(Exception):
+    """Raised when the password hashing pool already has its maximum pending work"""
+
+
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event loop
+_hash_executor: Optional[ThreadPoolExecutor] = None
+password_hash_admission = AdmissionLimit(settings.PASSWORD_HASH_MAX_PENDING)
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+        )
+    return _hash_executor
+
+
+async def _run_hashing(func, *args):
+    """Run a hashing call on the pool, rejecting it when too much work is already pending"""
+    if not password_hash_admission.try_acquire():
+        raise PasswordHashingBusyError()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        password_hash_admission.release()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the hashing pool (raises PasswordHashingBusyError when saturated)"""
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the hashing pool (raises PasswordHashingBusyError when saturated)"""
+    return await _run_hashing(get_password_hash, password)
+
+
+def shutdown_password_pool() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -37,12 +92,20 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def verify_token(token: str) -> Optional[str]:
-    """Verify a JWT token and return the email"""
+    """Verify a JWT token and return the email (memoized until the token expires)"""
+    email = token_cache.get(token)
+    if email is not None:
+        return email
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
             return None
-        return email
     except JWTError:
         return None
+
+    expires_in = payload.get("exp", 0) - time.time()
+    if expires_in > 0:
+        token_cache.set(token, email, ttl_seconds=expires_in)
+    return email
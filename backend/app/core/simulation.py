@@ -0,0 +1,95 @@
+"""What-if scoring of hypothetical response changes, computed in memory"""
+
+from types import MappingProxyType
+from typing import List, Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.config import settings
+from app.core.cache import TTLCache
+from app.core.framework_index import FrameworkIndex
+from app.core.scoring_core import ScoreResult, get_maturity_level, score_responses
+from app.models import Assessment, GateResponse
+
+# Response vectors (question_id -> score) keyed by (assessment_id, updated_at); saving
+# responses bumps updated_at, so a changed assessment never hits a stale entry
+response_cache = TTLCache(
+    max_size=settings.RESPONSE_CACHE_SIZE, ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+
+
+async def get_response_vector(db: AsyncSession, assessment: Assessment) -> Mapping[UUID, int]:
+    """Current responses of an assessment, loaded once per assessment version"""
+    key = (assessment.id, assessment.updated_at)
+    responses = response_cache.get(key)
+    if responses is None:
+        rows = await db.execute(
+            select(GateResponse.question_id, GateResponse.score)
+            .where(GateResponse.assessment_id == assessment.id)
+        )
+        responses = MappingProxyType(dict(rows.all()))
+        response_cache.set(key, responses)
+    return responses
+
+
+def _result(
+    name: Optional[str], result: ScoreResult, baseline: Optional[ScoreResult]
+) -> schemas.SimulationResult:
+    _, maturity_name = get_maturity_level(result.overall_score)
+    base = baseline or result
+    return schemas.SimulationResult(
+        name=name,
+        overall_score=result.overall_score,
+        maturity_level=result.maturity_level,
+        maturity_name=maturity_name,
+        delta=round(result.overall_score - base.overall_score, 2),
+        domains=[
+            schemas.SimulatedDomainScore(
+                domain_id=domain.id,
+                domain=domain.name,
+                score=domain.score,
+                maturity_level=domain.maturity_level,
+                delta=round(domain.score - base_domain.score, 2),
+            )
+            for domain, base_domain in zip(result.domains, base.domains)
+        ],
+    )
+
+
+def simulate(
+    assessment_id: UUID,
+    index: FrameworkIndex,
+    responses: Mapping[UUID, int],
+    scenarios: List[schemas.SimulationScenario],
+) -> schemas.SimulationResponse:
+    """
+    Score each scenario's overrides applied on top of the current responses.
+
+    Raises ValueError for overrides of questions outside the assessment's framework.
+    """
+    unknown = sorted(
+        str(question_id)
+        for scenario in scenarios
+        for question_id in scenario.overrides
+        if question_id not in index.questions
+    )
+    if unknown:
+        raise ValueError(f"Unknown question ids: {', '.join(unknown)}")
+
+    baseline = score_responses(index.scoring, responses)
+
+    return schemas.SimulationResponse(
+        assessment_id=assessment_id,
+        baseline=_result(None, baseline, None),
+        scenarios=[
+            _result(
+                scenario.name,
+                score_responses(index.scoring, {**responses, **scenario.overrides}),
+                baseline,
+            )
+            for scenario in scenarios
+        ],
+    )
@@ -0,0 +1,197 @@
+"""Per-request SQL instrumentation - statement counts, DB time and repeated-query detection"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Longest statement text kept for the slowest query of a request/route
+MAX_STATEMENT_LENGTH = 500
+
+
+@dataclass
+class QueryStats:
+    """SQL statements issued within one tracked block (usually one request)"""
+
+    statement_count: int = 0
+    total_time: float = 0.0  # Seconds spent in cursor execute
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statement_count += 1
+        self.total_time += duration
+        self.statements[statement] += 1
+        if duration >= self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement[:MAX_STATEMENT_LENGTH]
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times - the usual sign of an N+1 loop"""
+        return [(sql, count) for sql, count in self.statements.most_common() if count >= threshold]
+
+
+# Stats for the block currently being tracked (None when nothing is tracking)
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record every statement executed in this context (including AsyncSession greenlets)"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = conn.info.get("query_start_time")
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+@dataclass
+class RouteStats:
+    """Aggregated SQL stats for one route"""
+
+    requests: int = 0
+    statements: int = 0
+    max_statements: int = 0
+    db_time: float = 0.0
+    max_db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "avg_statements": round(self.statements / self.requests, 2) if self.requests else 0.0,
+            "max_statements": self.max_statements,
+            "avg_db_time_ms": round(self.db_time * 1000 / self.requests, 2) if self.requests else 0.0,
+            "max_db_time_ms": round(self.max_db_time * 1000, 2),
+            "slowest_statement_ms": round(self.slowest_time * 1000, 2),
+            "slowest_statement": self.slowest_statement,
+        }
+
+
+class RouteQueryStats:
+    """Thread-safe per-route aggregation of request QueryStats"""
+
+    def __init__(self):
+        self._routes: Dict[str, RouteStats] = {}
+        self._observers: List[Callable[[str, QueryStats], None]] = []
+        self._lock = threading.Lock()
+
+    def record(self, route: str, stats: QueryStats) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(route, RouteStats())
+            entry.requests += 1
+            entry.statements += stats.statement_count
+            entry.max_statements = max(entry.max_statements, stats.statement_count)
+            entry.db_time += stats.total_time
+            entry.max_db_time = max(entry.max_db_time, stats.total_time)
+            if stats.slowest_time >= entry.slowest_time:
+                entry.slowest_time = stats.slowest_time
+                entry.slowest_statement = stats.slowest_statement
+            observers = list(self._observers)
+
+        for observer in observers:
+            observer(route, stats)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Current aggregates keyed by "METHOD /route/{template}" """
+        with self._lock:
+            return {route: entry.as_dict() for route, entry in sorted(self._routes.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def subscribe(self, observer: Callable[[str, QueryStats], None]) -> None:
+        """Call `observer(route, stats)` after every recorded request"""
+        with self._lock:
+            self._observers.append(observer)
+
+    def unsubscribe(self, observer: Callable[[str, QueryStats], None]) -> None:
+        with self._lock:
+            self._observers.remove(observer)
+
+
+route_query_stats = RouteQueryStats()
+
+
+def route_label(scope: dict) -> str:
+    """"METHOD /path/{template}" for a handled ASGI request ("METHOD unmatched" otherwise)"""
+    # Route templates keep the number of entries bounded; unmatched paths share one entry
+    path = getattr(scope.get("route"), "path", None) or "unmatched"
+    return f"{scope.get('method', '')} {path}"
+
+
+class SQLInstrumentationMiddleware:
+    """
+    ASGI middleware tracking the SQL issued by each HTTP request.
+
+    Every request is aggregated into `route_query_stats`. In debug mode the counts are also
+    returned as X-DB-Query-Count / X-DB-Time-Ms / X-DB-Slowest-Ms response headers (as of
+    the start of the response), and statements repeated `SQL_REPEATED_STATEMENT_THRESHOLD`
+    or more times in one request are logged as likely N+1 queries.
+    """
+
+    def __init__(self, app, debug: Optional[bool] = None):
+        self.app = app
+        self.debug = settings.DEBUG if debug is None else debug
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_headers(message):
+                if self.debug and message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.extend([
+                        (b"x-db-query-count", str(stats.statement_count).encode()),
+                        (b"x-db-time-ms", f"{stats.total_time * 1000:.2f}".encode()),
+                        (b"x-db-slowest-ms", f"{stats.slowest_time * 1000:.2f}".encode()),
+                    ])
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                route = route_label(scope)
+                route_query_stats.record(route, stats)
+                if self.debug:
+                    for statement, count in stats.repeated_statements(
+                        settings.SQL_REPEATED_STATEMENT_THRESHOLD
+                    ):
+                        logger.warning(
+                            "Possible N+1 on %s: statement executed %d times: %s",
+                            route, count, statement[:MAX_STATEMENT_LENGTH],
+                        )
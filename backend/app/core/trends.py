@@ -0,0 +1,155 @@
+"""Score trend rollups - incrementally maintained time-bucketed score totals"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.models import Assessment, AssessmentStatus, DomainScore, FrameworkDomain, ScoreRollup
+
+GRANULARITIES = ("week", "month", "quarter")
+
+# (domain_id, score, maturity_level) as stored in DomainScore
+DomainScoreRow = Tuple[UUID, float, int]
+
+
+def bucket_start(value: datetime, granularity: str) -> date:
+    """Start of the week (Monday), month or quarter containing `value`"""
+    day = value.date()
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "quarter":
+        return day.replace(month=3 * ((day.month - 1) // 3) + 1, day=1)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+def is_rolled_up(assessment: Assessment) -> bool:
+    """Whether an assessment currently contributes to the rollups"""
+    return (
+        assessment.status == AssessmentStatus.COMPLETED
+        and assessment.completed_at is not None
+        and assessment.overall_score is not None
+    )
+
+
+async def apply_rollup(
+    db: AsyncSession,
+    assessment: Assessment,
+    domain_scores: Optional[Iterable[DomainScoreRow]] = None,
+    sign: int = 1,
+) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) one completed assessment's scores from the rollups.
+
+    Pass the assessment's values as they were when added; `domain_scores` is loaded from the
+    database when omitted. Runs as a single upsert in the caller's transaction.
+    """
+    if domain_scores is None:
+        domain_scores = (
+            await db.execute(
+                select(DomainScore.domain_id, DomainScore.score, DomainScore.maturity_level)
+                .where(DomainScore.assessment_id == assessment.id)
+            )
+        ).all()
+
+    entries = [(None, assessment.overall_score, assessment.maturity_level or 0)]
+    entries.extend(domain_scores)
+
+    now = datetime.utcnow()
+    rows = []
+    for granularity in GRANULARITIES:
+        start = bucket_start(assessment.completed_at, granularity)
+        for domain_id, score, maturity_level in entries:
+            rows.append({
+                "assessor_id": assessment.assessor_id,
+                "granularity": granularity,
+                "bucket_start": start,
+                "domain_id": domain_id,
+                "score_sum": sign * score,
+                "maturity_sum": sign * maturity_level,
+                "assessment_count": sign,
+                "updated_at": now,
+            })
+
+    await db.execute(rollup_upsert(rows))
+
+
+def rollup_upsert(rows: List[dict]):
+    """Upsert adding each row's sums and count to its rollup bucket"""
+    stmt = pg_insert(ScoreRollup).values(rows)
+    return stmt.on_conflict_do_update(
+        constraint="uq_score_rollup_bucket",
+        set_={
+            "score_sum": ScoreRollup.score_sum + stmt.excluded.score_sum,
+            "maturity_sum": ScoreRollup.maturity_sum + stmt.excluded.maturity_sum,
+            "assessment_count": ScoreRollup.assessment_count + stmt.excluded.assessment_count,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+def _trend_point(bucket: date, score_sum: float, maturity_sum: int, count: int) -> schemas.TrendData:
+    return schemas.TrendData(
+        date=datetime.combine(bucket, datetime.min.time()),
+        score=round(score_sum / count, 2),
+        maturity_level=round(maturity_sum / count),
+    )
+
+
+async def get_trends(
+    db: AsyncSession,
+    assessor_id: UUID,
+    granularity: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> schemas.AssessmentTrends:
+    """Read overall and per-domain trends from the rollups (one indexed range scan)"""
+    stmt = (
+        select(
+            ScoreRollup.bucket_start,
+            FrameworkDomain.name,
+            ScoreRollup.score_sum,
+            ScoreRollup.maturity_sum,
+            ScoreRollup.assessment_count,
+        )
+        .outerjoin(FrameworkDomain, FrameworkDomain.id == ScoreRollup.domain_id)
+        .where(
+            ScoreRollup.assessor_id == assessor_id,
+            ScoreRollup.granularity == granularity,
+            ScoreRollup.assessment_count > 0,
+        )
+        .order_by(ScoreRollup.bucket_start)
+    )
+    if start is not None:
+        stmt = stmt.where(ScoreRollup.bucket_start >= bucket_start(
+            datetime.combine(start, datetime.min.time()), granularity
+        ))
+    if end is not None:
+        stmt = stmt.where(ScoreRollup.bucket_start <= end)
+
+    overall_trends: List[schemas.TrendData] = []
+    # Domains from different frameworks can share a name; merge them per bucket
+    domain_totals: Dict[str, Dict[date, List[float]]] = defaultdict(dict)
+
+    for bucket, domain_name, score_sum, maturity_sum, count in (await db.execute(stmt)).all():
+        if domain_name is None:
+            overall_trends.append(_trend_point(bucket, score_sum, maturity_sum, count))
+            continue
+        totals = domain_totals[domain_name].setdefault(bucket, [0.0, 0, 0])
+        totals[0] += score_sum
+        totals[1] += maturity_sum
+        totals[2] += count
+
+    domain_trends = {
+        name: [_trend_point(bucket, *totals) for bucket, totals in buckets.items()]
+        for name, buckets in domain_totals.items()
+    }
+
+    return schemas.AssessmentTrends(overall_trends=overall_trends, domain_trends=domain_trends)
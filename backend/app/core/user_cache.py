@@ -0,0 +1,66 @@
+"""Cache of authenticated users resolved from token subjects"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.models import User
+
+# (email, version) -> column values of the user
+user_cache = TTLCache(max_size=settings.USER_CACHE_SIZE, ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
+
+# Bumped per email on every invalidation. A lookup that raced an update stores its result
+# under the old version, which is never read again.
+_versions: Dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+_USER_COLUMNS = tuple(column.key for column in inspect(User).column_attrs)
+
+
+def user_version(email: str) -> int:
+    """Current cache version for a token subject"""
+    return _versions.get(email, 0)
+
+
+def invalidate_cached_user(email: str) -> None:
+    """Drop a user's cached entry (and any in-flight lookup) after it changes"""
+    with _versions_lock:
+        version = _versions.get(email, 0)
+        _versions[email] = version + 1
+    user_cache.invalidate((email, version))
+
+
+def get_cached_user(email: str, version: int) -> Optional[User]:
+    """Detached copy of a cached user, or None on a miss"""
+    values = user_cache.get((email, version))
+    if values is None:
+        return None
+
+    # Fresh detached instance per request so sessions never share one object
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+def cache_user(user: User, version: int) -> None:
+    """Store a loaded user's column values under the version read before loading it"""
+    values: Dict[str, Any] = {key: getattr(user, key) for key in _USER_COLUMNS}
+    user_cache.set((user.email, version), values)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_user_change(session, flush_context):
+    """Drop cached users whose row is updated or deleted in this process"""
+    for obj in (*session.dirty, *session.deleted):
+        if not isinstance(obj, User):
+            continue
+        state = inspect(obj)
+        # Old email too, in case it was changed
+        emails = {obj.email, *state.attrs.email.history.deleted}
+        for email in emails:
+            if email is not None:
+                invalidate_cached_user(email)
@@ -1,25 +1,56 @@
 """Database connection and session management"""
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+from app.core import metrics
 
-# Create database engine
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waits for a connection"""
+
+    def _do_get(self):
+        with metrics.db_pool_checkout_wait_seconds.time():
+            return super()._do_get()
+
+
+# Create database engine (sync - used by Alembic and app/scripts tooling)
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async database engine (asyncpg - used by the API routers)
+async_engine = create_async_engine(
+    make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_pre_ping=True,
+    poolclass=InstrumentedAsyncQueuePool,
+)
+
+# Pool occupancy, read at scrape time
+metrics.db_pool_connections.set_function(lambda: {
+    ("size",): async_engine.pool.size(),
+    ("checked_out",): async_engine.pool.checkedout(),
+    ("checked_in",): async_engine.pool.checkedin(),
+    ("overflow",): max(async_engine.pool.overflow(), 0),
+})
+
+# Create async session factory
+# Objects stay loaded after commit so response serialization never triggers lazy IO
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 # Create base class for models
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency for getting database session"""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Dependency for getting async database session"""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
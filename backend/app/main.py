@@ -1,15 +1,36 @@
 """FastAPI application entry point"""
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.api import auth, assessments, analytics, organizations, gates, frameworks
+from app.api import auth, assessments, analytics, export, organizations, gates, frameworks
+from app.core import metrics, security
+from app.core.sql_stats import SQLInstrumentationMiddleware, route_query_stats
+from app.database import get_db
+from app.utils.pdf_render_pool import pdf_render_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown"""
+    yield
+    pdf_render_pool.shutdown()
+    security.shutdown_password_pool()
+
 
 app = FastAPI(
     title="DevOps Maturity Assessment API",
     description="Internal tool for assessing team DevOps maturity and readiness",
     version="1.2.1",
+    lifespan=lifespan,
 )
 
 # CORS configuration for local development
@@ -19,14 +40,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor", "X-Total-Count", "X-Total-Count-Capped",
+        "X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Slowest-Ms", "X-Export-Job-Id",
+    ],
 )
 
+# Per-request SQL statement counts and timings
+app.add_middleware(SQLInstrumentationMiddleware)
+
+# Request count/latency/in-flight metrics (outermost, so it times the whole stack)
+app.add_middleware(metrics.MetricsMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(organizations.router, prefix="/api/organizations", tags=["Organizations"])
 app.include_router(frameworks.router, prefix="/api/frameworks", tags=["Frameworks"])
 app.include_router(assessments.router, prefix="/api/assessments", tags=["Assessments"])
 app.include_router(analytics.router, prefix="/api/analytics", tags=["Analytics"])
+app.include_router(export.router, prefix="/api/export", tags=["Export"])
 # Gates router is deprecated/empty but kept for safety if needed, though we should likely remove it.
 # app.include_router(gates.router, prefix="/api/gates", tags=["Gates"])
 
@@ -42,6 +74,26 @@ async def root():
 
 
 @app.get("/health")
-async def health_check():
-    """Detailed health check"""
+async def health_check(db: AsyncSession = Depends(get_db)):
+    """Detailed health check - verifies the database answers a query"""
+    try:
+        await asyncio.wait_for(db.execute(text("SELECT 1")), timeout=5)
+    except (SQLAlchemyError, OSError, asyncio.TimeoutError):
+        return JSONResponse(
+            status_code=503, content={"status": "unhealthy", "database": "unreachable"}
+        )
     return {"status": "healthy", "database": "connected"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Metrics in the Prometheus text exposition format"""
+    return Response(content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
+if settings.DEBUG:
+
+    @app.get("/debug/sql-stats")
+    async def sql_stats():
+        """Per-route SQL statement counts and DB time since startup"""
+        return route_query_stats.snapshot()
@@ -3,8 +3,8 @@
 import uuid
 from datetime import datetime
 import sqlalchemy as sa
-from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum, Float, ForeignKey, Integer, String, Text, ARRAY
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 import enum
 
@@ -97,7 +97,9 @@ class FrameworkDomain(Base):
     __tablename__ = "framework_domains"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    framework_id = Column(UUID(as_uuid=True), ForeignKey("frameworks.id", ondelete="CASCADE"), nullable=False)
+    framework_id = Column(
+        UUID(as_uuid=True), ForeignKey("frameworks.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     weight = Column(Float, nullable=False, default=1.0)
@@ -117,7 +119,9 @@ class FrameworkGate(Base):
     __tablename__ = "framework_gates"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    domain_id = Column(UUID(as_uuid=True), ForeignKey("framework_domains.id", ondelete="CASCADE"), nullable=False)
+    domain_id = Column(
+        UUID(as_uuid=True), ForeignKey("framework_domains.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     order = Column(Integer, nullable=False, default=0)
@@ -135,7 +139,9 @@ class FrameworkQuestion(Base):
     __tablename__ = "framework_questions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    gate_id = Column(UUID(as_uuid=True), ForeignKey("framework_gates.id", ondelete="CASCADE"), nullable=False)
+    gate_id = Column(
+        UUID(as_uuid=True), ForeignKey("framework_gates.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     text = Column(Text, nullable=False)
     guidance = Column(Text, nullable=True)
     order = Column(Integer, nullable=False, default=0)
@@ -175,6 +181,32 @@ class Assessment(Base):
     framework = relationship("Framework", back_populates="assessments")
     domain_scores = relationship("DomainScore", back_populates="assessment", cascade="all, delete-orphan")
     gate_responses = relationship("GateResponse", back_populates="assessment", cascade="all, delete-orphan")
+    report_snapshot = relationship(
+        "AssessmentReportSnapshot",
+        back_populates="assessment",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    # Table constraints
+    # Listing indexes end in (created_at, id) to serve keyset pagination directly
+    __table_args__ = (
+        sa.Index('ix_assessments_assessor_id_created_at_id', 'assessor_id', 'created_at', 'id'),
+        sa.Index(
+            'ix_assessments_assessor_id_status_created_at_id',
+            'assessor_id', 'status', 'created_at', 'id',
+        ),
+        sa.Index(
+            'ix_assessments_assessor_id_framework_id_created_at_id',
+            'assessor_id', 'framework_id', 'created_at', 'id',
+        ),
+        sa.Index(
+            'ix_assessments_assessor_id_lower_team_name',
+            'assessor_id', sa.text('lower(team_name) text_pattern_ops'),
+        ),
+        sa.Index('ix_assessments_organization_id', 'organization_id'),
+    )
 
 
 class DomainScore(Base):
@@ -189,8 +221,6 @@ class DomainScore(Base):
     domain_id = Column(UUID(as_uuid=True), ForeignKey("framework_domains.id"), nullable=False)
     score = Column(Float, nullable=False)  # 0-100
     maturity_level = Column(Integer, nullable=False)  # 1-5
-    strengths = Column(ARRAY(String), nullable=True)  # Array of strength descriptions
-    gaps = Column(ARRAY(String), nullable=True)  # Array of gap descriptions
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -198,6 +228,65 @@ class DomainScore(Base):
     assessment = relationship("Assessment", back_populates="domain_scores")
     domain_def = relationship("FrameworkDomain", back_populates="domain_scores")
 
+    # Table constraints
+    __table_args__ = (
+        sa.UniqueConstraint(
+            'assessment_id', 'domain_id', name='uq_domain_score_assessment_domain'
+        ),
+    )
+
+
+class ScoreFinding(Base):
+    """Score finding - a strength or gap of a submitted assessment, rendered when reporting"""
+
+    __tablename__ = "score_findings"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    assessment_id = Column(
+        UUID(as_uuid=True), ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False
+    )
+    organization_id = Column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=True
+    )  # Copied from the assessment for organization-wide aggregation
+    domain_id = Column(
+        UUID(as_uuid=True), ForeignKey("framework_domains.id", ondelete="CASCADE"), nullable=False
+    )
+    question_id = Column(
+        UUID(as_uuid=True), ForeignKey("framework_questions.id", ondelete="CASCADE"), nullable=False
+    )
+    kind = Column(String(10), nullable=False)  # strength, gap
+    score = Column(Integer, nullable=False)  # 0-5
+
+    # Table constraints
+    __table_args__ = (
+        sa.UniqueConstraint('assessment_id', 'question_id', name='uq_score_finding_question'),
+        sa.Index('ix_score_findings_org_kind_question', 'organization_id', 'kind', 'question_id'),
+    )
+
+
+class GateScore(Base):
+    """Gate score model - stores per-gate scores calculated at submit time"""
+
+    __tablename__ = "gate_scores"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    assessment_id = Column(
+        UUID(as_uuid=True), ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False
+    )
+    gate_id = Column(
+        UUID(as_uuid=True), ForeignKey("framework_gates.id", ondelete="CASCADE"), nullable=False
+    )
+    total = Column(Integer, nullable=False)  # Sum of response scores
+    answered = Column(Integer, nullable=False)  # Questions answered
+    max_total = Column(Integer, nullable=False)  # answered * 5
+    percentage = Column(Float, nullable=False)  # 0-100
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Table constraints
+    __table_args__ = (
+        sa.UniqueConstraint('assessment_id', 'gate_id', name='uq_gate_score_assessment_gate'),
+    )
+
 
 class GateResponse(Base):
     """Gate response model"""
@@ -223,3 +312,73 @@ class GateResponse(Base):
     __table_args__ = (
         sa.UniqueConstraint('assessment_id', 'question_id', name='uq_assessment_question'),
     )
+
+
+class AssessmentReportSnapshot(Base):
+    """Assessment report snapshot - the full AssessmentReport stored at submit time"""
+
+    __tablename__ = "assessment_report_snapshots"
+
+    assessment_id = Column(
+        UUID(as_uuid=True), ForeignKey("assessments.id", ondelete="CASCADE"), primary_key=True
+    )
+    schema_version = Column(Integer, nullable=False)  # Snapshot format version
+    framework_version = Column(String(50), nullable=False)  # Framework version it was built from
+    framework_fingerprint = Column(String(32), nullable=False)  # framework_fingerprints() md5
+    content_hash = Column(String(64), nullable=False)  # SHA-256 of the serialized report
+    report = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    assessment = relationship("Assessment", back_populates="report_snapshot")
+
+
+class ScoreRollup(Base):
+    """Score rollup - running score totals per assessor and time bucket, maintained on submit"""
+
+    __tablename__ = "score_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    assessor_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    granularity = Column(String(10), nullable=False)  # week, month, quarter
+    bucket_start = Column(Date, nullable=False)
+    domain_id = Column(
+        UUID(as_uuid=True), ForeignKey("framework_domains.id", ondelete="CASCADE"), nullable=True
+    )  # NULL = overall assessment score
+    score_sum = Column(Float, nullable=False, default=0.0)
+    maturity_sum = Column(Integer, nullable=False, default=0)
+    assessment_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Table constraints
+    __table_args__ = (
+        sa.UniqueConstraint(
+            'assessor_id', 'granularity', 'bucket_start', 'domain_id',
+            name='uq_score_rollup_bucket',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+
+class DomainScoreTotal(Base):
+    """Domain score total - running response totals per assessment and domain, maintained on save"""
+
+    __tablename__ = "domain_score_totals"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    assessment_id = Column(
+        UUID(as_uuid=True), ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False
+    )
+    domain_id = Column(
+        UUID(as_uuid=True), ForeignKey("framework_domains.id", ondelete="CASCADE"), nullable=False
+    )
+    total = Column(Integer, nullable=False, default=0)  # Sum of response scores
+    answered = Column(Integer, nullable=False, default=0)  # Questions answered
+    max_total = Column(Integer, nullable=False)  # Questions in the domain * 5
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Table constraints
+    __table_args__ = (
+        sa.UniqueConstraint('assessment_id', 'domain_id', name='uq_domain_score_total'),
+    )
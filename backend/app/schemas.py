@@ -1,7 +1,7 @@
 """Pydantic schemas for request/response validation - Complete Spec"""
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Literal, Optional, Dict, Any
 from uuid import UUID
 from pydantic import BaseModel, EmailStr, Field
 
@@ -190,21 +190,71 @@ class AssessmentResponse(AssessmentBase):
 
 
 # Domain Score schemas
-class DomainScoreResponse(BaseModel):
-    """Schema for domain score response"""
+class LiveDomainScore(BaseModel):
+    """Current score of one domain of an in-progress assessment"""
+
+    domain_id: UUID
+    domain: str
+    weight: float
+    score: float
+    maturity_level: int
+    total: int  # Sum of response scores
+    max_total: int
+    answered: int
+    question_count: int
+
+
+class LiveScore(BaseModel):
+    """Current scores of an assessment, computed from its running domain totals"""
 
-    id: UUID
     assessment_id: UUID
+    overall_score: float
+    maturity_level: int
+    answered: int
+    question_count: int
+    domains: List[LiveDomainScore]
+
+
+class SimulationScenario(BaseModel):
+    """Hypothetical score overrides for some questions"""
+
+    name: Optional[str] = None
+    overrides: Dict[UUID, Annotated[int, Field(ge=0, le=5)]]  # question_id -> score
+
+
+class SimulationRequest(BaseModel):
+    """What-if scenarios evaluated against an assessment's current responses"""
+
+    scenarios: List[SimulationScenario] = Field(..., min_length=1)
+
+
+class SimulatedDomainScore(BaseModel):
+    """Domain score under a scenario"""
+
     domain_id: UUID
-    domain_name: Optional[str] = None # Enriched field
+    domain: str
     score: float
     maturity_level: int
-    strengths: Optional[List[str]] = []
-    gaps: Optional[List[str]] = []
-    created_at: datetime
+    delta: float  # Against the current responses
 
-    class Config:
-        from_attributes = True
+
+class SimulationResult(BaseModel):
+    """Scores under one scenario (or the current responses for the baseline)"""
+
+    name: Optional[str] = None
+    overall_score: float
+    maturity_level: int
+    maturity_name: str
+    delta: float  # Against the current responses
+    domains: List[SimulatedDomainScore]
+
+
+class SimulationResponse(BaseModel):
+    """Baseline scores plus one result per scenario, in request order"""
+
+    assessment_id: UUID
+    baseline: SimulationResult
+    scenarios: List[SimulationResult]
 
 
 # Gate Response schemas
@@ -290,6 +340,94 @@ class AssessmentReport(BaseModel):
     recommendations: List[str]
 
 
+# Organization report schemas
+class OrganizationDomainSummary(BaseModel):
+    """One domain's scores across an organization's teams"""
+
+    domain_id: UUID
+    domain: str
+    average_score: float
+    min_score: float
+    max_score: float
+
+
+class OrganizationGateSummary(BaseModel):
+    """One gate's scores across an organization's teams"""
+
+    gate_id: UUID
+    gate_name: str
+    domain: str
+    teams: int
+    average_percentage: float
+    min_percentage: float
+    max_percentage: float
+    teams_below_half: int  # Teams scoring under 50%
+
+
+class OrganizationTeamSummary(BaseModel):
+    """A team's latest completed assessment"""
+
+    assessment_id: UUID
+    team_name: str
+    completed_at: Optional[datetime] = None
+    overall_score: float
+    maturity_level: int
+    domain_scores: List[Optional[float]]  # In OrganizationReport.domains order
+    domain_levels: List[Optional[int]]
+    strengths: List[str]
+    gaps: List[str]
+
+
+class OrganizationReport(BaseModel):
+    """Consolidated report of each team's latest completed assessment of a framework"""
+
+    organization_id: UUID
+    organization_name: str
+    framework_id: UUID
+    framework_name: str
+    framework_version: str
+    team_count: int
+    average_score: float
+    maturity_level: MaturityLevel
+    maturity_distribution: List[int]  # Teams at levels 1-5
+    domains: List[OrganizationDomainSummary]
+    gates: List[OrganizationGateSummary]
+    teams: List[OrganizationTeamSummary]
+
+
+# Report export schemas
+class ReportExportRequest(BaseModel):
+    """Completed assessments to export, by id or by filter"""
+
+    assessment_ids: Optional[List[UUID]] = Field(None, min_length=1)
+    organization_id: Optional[UUID] = None
+    framework_id: Optional[UUID] = None
+    completed_from: Optional[datetime] = None
+    completed_to: Optional[datetime] = None
+
+
+class ReportExportFailure(BaseModel):
+    """An assessment whose report could not be exported"""
+
+    assessment_id: UUID
+    team_name: str
+    error: str
+
+
+class ReportExportStatus(BaseModel):
+    """Progress of a batch report export"""
+
+    job_id: UUID
+    status: Literal["running", "completed", "cancelled", "failed"]
+    total: int
+    completed: int
+    failed: int
+    bytes_sent: int
+    failures: List[ReportExportFailure]
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
 # Analytics schemas
 class AnalyticsSummary(BaseModel):
     """Analytics summary"""
@@ -314,3 +452,63 @@ class AssessmentTrends(BaseModel):
 
     overall_trends: List[TrendData]
     domain_trends: dict  # domain_name -> List[TrendData]
+
+
+class GateComparisonEntry(BaseModel):
+    """One gate's scores across teams"""
+
+    gate_id: UUID
+    gate_name: str
+    domain: str
+    average_percentage: float
+    min_percentage: float
+    max_percentage: float
+    teams: Dict[str, float]  # team_name -> percentage
+
+
+class CommonGap(BaseModel):
+    """A question frequently identified as a gap"""
+
+    question_id: UUID
+    question_text: str
+    gate_name: str
+    domain: str
+    framework_id: UUID
+    assessments: int  # Completed assessments with this gap
+    average_score: float
+
+
+class GateComparison(BaseModel):
+    """Gate scores of each team's latest completed assessment of a framework"""
+
+    framework_id: UUID
+    teams: List[str]
+    gates: List[GateComparisonEntry]
+
+
+# Rescoring schemas
+class RescoreChange(BaseModel):
+    """Overall score change of one assessment"""
+
+    assessment_id: UUID
+    team_name: str
+    old_score: Optional[float] = None
+    new_score: float
+    delta: Optional[float] = None
+    old_maturity_level: Optional[int] = None
+    new_maturity_level: int
+
+
+class RescoreSummary(BaseModel):
+    """Result of rescoring a framework's completed assessments"""
+
+    framework_id: UUID
+    framework_version: str
+    dry_run: bool
+    assessments: int
+    changed: int  # Assessments with any changed score, level, strength or gap
+    maturity_changes: int
+    max_abs_delta: float
+    mean_delta: float
+    domain_mean_deltas: Dict[str, float]  # domain_name -> mean score change
+    largest_changes: List[RescoreChange]
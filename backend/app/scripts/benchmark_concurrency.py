@@ -0,0 +1,149 @@
+"""Concurrent throughput benchmark - sync Session vs AsyncSession inside async handlers
+
+Simulates N concurrent `async def` handlers on one event loop, each issuing a DB query.
+
+- sync:  the pre-async pattern. A blocking `Session` query runs on the event loop, so
+         handlers execute one at a time regardless of concurrency.
+- async: the current pattern. `AsyncSession` (asyncpg) yields to the loop while waiting
+         on the database, so handlers overlap up to the connection pool size.
+
+Usage:
+    python -m app.scripts.benchmark_concurrency --requests 200 --concurrency 20 --query-ms 20
+
+With --url the same load is sent over HTTP to a running API instead, which measures the
+whole stack (run it against the old and new build to compare):
+    python -m app.scripts.benchmark_concurrency --url http://localhost:8000 \\
+        --email admin@example.com --password admin123 --path /api/analytics/summary
+"""
+
+import asyncio
+import statistics
+import sys
+import os
+import time
+
+# Add parent directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
+
+
+async def _sync_handler(query_seconds: float) -> None:
+    """Handler using the blocking Session (blocks the event loop for the whole query)"""
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT pg_sleep(:s)"), {"s": query_seconds})
+    finally:
+        db.close()
+
+
+async def _async_handler(query_seconds: float) -> None:
+    """Handler using AsyncSession (yields to the event loop while waiting)"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("SELECT pg_sleep(:s)"), {"s": query_seconds})
+
+
+async def _run_load(handler, total: int, concurrency: int) -> dict:
+    """Run `total` handler calls with at most `concurrency` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await handler()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "elapsed_s": elapsed,
+        "throughput_rps": total / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def _print_result(label: str, result: dict) -> None:
+    print(
+        f"  {label:<6} {result['requests']:>6} req in {result['elapsed_s']:.2f}s | "
+        f"{result['throughput_rps']:8.1f} req/s | "
+        f"p50 {result['p50_ms']:7.1f} ms | p95 {result['p95_ms']:7.1f} ms"
+    )
+
+
+async def benchmark_db(total: int, concurrency: int, query_ms: int) -> dict:
+    """Compare sync vs async session handlers directly against the database"""
+    query_seconds = query_ms / 1000
+
+    # Warm up both pools so connection setup isn't measured
+    await _run_load(lambda: _sync_handler(0), concurrency, concurrency)
+    await _run_load(lambda: _async_handler(0), concurrency, concurrency)
+
+    results = {
+        "sync": await _run_load(lambda: _sync_handler(query_seconds), total, concurrency),
+        "async": await _run_load(lambda: _async_handler(query_seconds), total, concurrency),
+    }
+    await async_engine.dispose()
+    return results
+
+
+async def benchmark_http(
+    url: str, path: str, email: str, password: str, total: int, concurrency: int
+) -> dict:
+    """Send concurrent authenticated GET requests to a running API"""
+    import httpx
+
+    async with httpx.AsyncClient(base_url=url, timeout=60) as client:
+        login = await client.post("/api/auth/login", data={"username": email, "password": password})
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        async def handler():
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+
+        await _run_load(handler, concurrency, concurrency)
+        return {"http": await _run_load(handler, total, concurrency)}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark concurrent request throughput")
+    parser.add_argument("--requests", type=int, default=200, help="Total requests to issue")
+    parser.add_argument("--concurrency", type=int, default=20, help="Requests in flight")
+    parser.add_argument("--query-ms", type=int, default=20,
+                        help="Simulated query latency for the in-process DB benchmark")
+    parser.add_argument("--url", help="Base URL of a running API (enables HTTP mode)")
+    parser.add_argument("--path", default="/api/assessments/", help="Endpoint to GET in HTTP mode")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="admin123")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    if args.url:
+        print(f"[benchmark] HTTP GET {args.url}{args.path} "
+              f"({args.requests} requests, concurrency {args.concurrency})")
+        results = asyncio.run(benchmark_http(
+            args.url, args.path, args.email, args.password, args.requests, args.concurrency
+        ))
+    else:
+        print(f"[benchmark] In-process DB handlers ({args.requests} requests, "
+              f"concurrency {args.concurrency}, {args.query_ms} ms/query)")
+        results = asyncio.run(benchmark_db(args.requests, args.concurrency, args.query_ms))
+    print("=" * 60)
+
+    for label, result in results.items():
+        _print_result(label, result)
+
+    if "sync" in results and "async" in results:
+        speedup = results["async"]["throughput_rps"] / results["sync"]["throughput_rps"]
+        print(f"  async throughput is {speedup:.1f}x sync")
@@ -0,0 +1,151 @@
+"""PDF render benchmark - render time and peak memory per report size
+
+Renders synthetic reports of increasing size with the warm per-process generator and
+reports the median/p95 render time, the peak Python heap allocated during one render
+(tracemalloc) and the PDF size. The cold start of a fresh render worker (ReportLab import,
+generator setup and first render) is measured separately in a spawned process.
+
+Usage:
+    python -m app.scripts.benchmark_pdf --iterations 50
+    python -m app.scripts.benchmark_pdf --sizes small large --json > pdf-bench.json
+"""
+
+import json
+import multiprocessing
+import statistics
+import sys
+import os
+import time
+import tracemalloc
+from typing import Any, Dict
+
+# Add parent directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Report sizes: (domains, gates per domain)
+SIZES = {
+    "small": (5, 4),
+    "medium": (10, 10),
+    "large": (20, 25),
+}
+
+
+def synthetic_report(domains: int, gates_per_domain: int) -> Dict[str, Any]:
+    """AssessmentReport-shaped dict with the given number of domains and gates"""
+    return {
+        "assessment": {
+            "team_name": "Benchmark Team",
+            "overall_score": 62.5,
+            "completed_at": "2026-01-01T00:00:00",
+        },
+        "maturity_level": {
+            "level": 4,
+            "name": "Managed",
+            "description": "Processes are measured and controlled",
+        },
+        "domain_breakdown": [
+            {
+                "domain": f"Domain {d}",
+                "score": (d * 7) % 100,
+                "maturity_level": d % 5 + 1,
+                "strengths": [],
+                "gaps": [],
+            }
+            for d in range(domains)
+        ],
+        "gate_scores": [
+            {
+                "gate_id": f"{d}-{g}",
+                "gate_name": f"Domain {d} / Gate {g}",
+                "score": (d + g) % 20,
+                "max_score": 20,
+                "percentage": (d + g) % 20 * 5,
+            }
+            for d in range(domains)
+            for g in range(gates_per_domain)
+        ],
+        "top_strengths": [f"Strength {i}: practice is consistently applied" for i in range(10)],
+        "top_gaps": [f"Gap {i}: practice is not yet in place" for i in range(10)],
+        "recommendations": [f"Recommendation {i}: adopt the missing practice" for i in range(10)],
+    }
+
+
+def _cold_start(report_data: Dict[str, Any]) -> float:
+    """Import, generator setup and first render in this (fresh) process, in seconds"""
+    started = time.perf_counter()
+    from app.utils.pdf_generator import get_generator
+
+    get_generator().generate(report_data)
+    return time.perf_counter() - started
+
+
+def benchmark_cold_start() -> float:
+    """Cold start of a spawned render worker, in milliseconds"""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(_cold_start, (synthetic_report(*SIZES["small"]),)) * 1000
+
+
+def benchmark_size(domains: int, gates_per_domain: int, iterations: int) -> Dict[str, Any]:
+    """Render one report size repeatedly with the warm generator"""
+    from app.utils.pdf_generator import get_generator
+
+    generator = get_generator()
+    report_data = synthetic_report(domains, gates_per_domain)
+    pdf_bytes = generator.generate(report_data)  # Warm-up
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        generator.generate(report_data)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+
+    # Separate traced render: tracemalloc slows allocation, so it is kept out of the timings
+    tracemalloc.start()
+    generator.generate(report_data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "domains": domains,
+        "gates": domains * gates_per_domain,
+        "iterations": iterations,
+        "p50_ms": statistics.median(timings) * 1000,
+        "p95_ms": timings[max(int(len(timings) * 0.95) - 1, 0)] * 1000,
+        "peak_mib": peak / (1024 * 1024),
+        "pdf_kib": len(pdf_bytes) / 1024,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark PDF report rendering")
+    parser.add_argument("--iterations", type=int, default=50, help="Renders per report size")
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=list(SIZES))
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    args = parser.parse_args()
+
+    results = {
+        "cold_start_ms": benchmark_cold_start(),
+        "sizes": {
+            name: benchmark_size(*SIZES[name], args.iterations) for name in args.sizes
+        },
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        sys.exit(0)
+
+    print("=" * 60)
+    print(f"[benchmark] PDF render ({args.iterations} renders per size)")
+    print("=" * 60)
+    print(f"  worker cold start {results['cold_start_ms']:8.1f} ms")
+    for name, result in results["sizes"].items():
+        print(
+            f"  {name:<7} {result['gates']:>4} gates | "
+            f"p50 {result['p50_ms']:7.1f} ms | p95 {result['p95_ms']:7.1f} ms | "
+            f"peak {result['peak_mib']:6.2f} MiB | {result['pdf_kib']:6.1f} KiB"
+        )
@@ -0,0 +1,106 @@
+"""Data export memory check - fails if encoding memory grows with the row count
+
+Streams synthetic response rows, shaped like the /api/export/responses query, through the
+same encoder the export endpoints use, in every format, and consumes the body chunk by
+chunk. The peak Python heap (tracemalloc) of a small and a large export is compared; rows
+are generated one partition at a time like a server-side cursor delivers them, so the
+peak of the large export should not exceed the small one's by more than the tolerance.
+The check exits non-zero when it does.
+
+Usage:
+    python -m app.scripts.check_export_memory --rows 200000 --max-growth-mib 1
+"""
+
+import asyncio
+import sys
+import os
+import time
+import tracemalloc
+from datetime import datetime
+from uuid import uuid4
+
+# Add parent directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.config import settings
+from app.core.data_export import encode_rows
+from app.models import AssessmentStatus
+
+COLUMNS = [
+    "assessment_id", "team_name", "organization_id", "framework_id", "status", "completed_at",
+    "domain_id", "domain", "gate_id", "gate", "question_id", "question", "score", "notes",
+    "evidence", "updated_at",
+]
+
+FORMATS = [("csv", False), ("csv", True), ("ndjson", False), ("ndjson", True)]
+
+
+async def _partitions(rows: int, batch_size: int):
+    """Synthetic rows, one cursor-sized partition at a time"""
+    ids = [uuid4() for _ in range(4)]
+    now = datetime.utcnow()
+    for start in range(0, rows, batch_size):
+        yield [
+            (
+                ids[0], f"Team {i // 40}", ids[1], ids[2], AssessmentStatus.COMPLETED, now,
+                ids[3], "Continuous Delivery", uuid4(), "Deployment automation", uuid4(),
+                "Are deployments to production fully automated?", i % 6,
+                "Pipeline deploys on merge" if i % 3 else None,
+                ["https://ci.example.com/pipelines/1"] if i % 2 else None, now,
+            )
+            for i in range(start, min(start + batch_size, rows))
+        ]
+        await asyncio.sleep(0)
+
+
+async def _export(rows: int, export_format: str, compress: bool) -> dict:
+    """Stream one export and measure its peak heap"""
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    size = 0
+    async for chunk in encode_rows(
+        COLUMNS, _partitions(rows, settings.DATA_EXPORT_BATCH_SIZE), export_format, compress
+    ):
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "elapsed_s": elapsed,
+        "size_mib": size / (1024 * 1024),
+        "peak_mib": (peak - baseline) / (1024 * 1024),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check that data export memory stays flat")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows in the large export")
+    parser.add_argument("--small-rows", type=int, default=10_000, help="Rows in the small export")
+    parser.add_argument("--max-growth-mib", type=float, default=1.0,
+                        help="Allowed peak heap growth from the small to the large export")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"[memory] data export, {args.small_rows} vs {args.rows} rows")
+    print("=" * 60)
+
+    failed = False
+    for export_format, compress in FORMATS:
+        small = asyncio.run(_export(args.small_rows, export_format, compress))
+        large = asyncio.run(_export(args.rows, export_format, compress))
+        growth = large["peak_mib"] - small["peak_mib"]
+        name = export_format + (" gzip" if compress else "")
+        print(
+            f"  {name:<11} {large['size_mib']:8.1f} MiB in {large['elapsed_s']:5.1f}s | "
+            f"peak {small['peak_mib']:5.2f} -> {large['peak_mib']:5.2f} MiB"
+        )
+        failed |= growth > args.max_growth_mib
+
+    if failed:
+        print("FAIL: export memory grew with the row count")
+        sys.exit(1)
+    print("OK")
@@ -0,0 +1,131 @@
+"""PDF download memory check - fails if concurrent downloads exceed a memory ceiling
+
+Runs concurrent PDF downloads of distinct large reports through the real render pool and
+the same streaming response the download endpoint returns, consuming each response body
+chunk by chunk. The peak Python heap of this (API) process is tracked with tracemalloc over the
+whole run; workers get the report JSON and render to disk, so no download should hold a
+parsed report or a copy of its PDF here.
+The check exits non-zero when the peak exceeds the ceiling.
+
+Usage:
+    python -m app.scripts.check_pdf_memory --downloads 16 --gates 2000 --max-mib 4
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from uuid import uuid4
+
+# Add parent directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi.responses import StreamingResponse
+
+from app import schemas
+from app.models import AssessmentStatus
+from app.scripts.benchmark_pdf import synthetic_report
+from app.utils.pdf_render_pool import PDFCache, PDFRenderPool, stream_file
+
+DOMAINS = 20
+
+
+def _report(index: int, gates: int) -> str:
+    """Distinct large serialized report, so every download renders its own PDF"""
+    data = synthetic_report(DOMAINS, max(gates // DOMAINS, 1))
+    now = datetime.utcnow()
+    data["assessment"] = {
+        "id": uuid4(),
+        "team_name": f"Memory Check Team {index}",
+        "assessor_id": uuid4(),
+        "framework_id": uuid4(),
+        "status": AssessmentStatus.COMPLETED,
+        "overall_score": 62.5,
+        "maturity_level": 4,
+        "completed_at": now,
+        "created_at": now,
+        "updated_at": now,
+    }
+    return schemas.AssessmentReport.model_validate(data).model_dump_json()
+
+
+async def _download(pool: PDFRenderPool, report_json: str) -> int:
+    """Render (or reuse) a report's PDF and stream it like the download endpoint; returns bytes"""
+    pdf = await pool.open(report_json)
+    response = StreamingResponse(stream_file(pdf), media_type="application/pdf")
+    received = 0
+
+    async def receive():
+        # Like a server whose client stays connected: never reports a disconnect
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+
+    await response({"type": "http", "method": "GET", "headers": []}, receive, send)
+    return received
+
+
+async def check(downloads: int, gates: int, workers: int) -> dict:
+    """Run the concurrent downloads and measure the peak heap of this process"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        pool = PDFRenderPool(
+            cache=PDFCache(cache_dir, max_bytes=1024 ** 3, max_age_seconds=3600),
+            max_workers=workers,
+            max_pending=downloads,
+        )
+        try:
+            # Start and warm the workers outside the measurement
+            await _download(pool, _report(-1, DOMAINS))
+
+            reports = [_report(i, gates) for i in range(downloads)]
+            tracemalloc.start()
+            baseline, _ = tracemalloc.get_traced_memory()
+            started = time.perf_counter()
+            sizes = await asyncio.gather(*(_download(pool, report) for report in reports))
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            pool.shutdown()
+
+    return {
+        "elapsed_s": elapsed,
+        "pdf_mib": sum(sizes) / (1024 * 1024),
+        "largest_pdf_kib": max(sizes) / 1024,
+        "peak_mib": (peak - baseline) / (1024 * 1024),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check peak memory of concurrent PDF downloads")
+    parser.add_argument("--downloads", type=int, default=16, help="Concurrent downloads")
+    parser.add_argument("--gates", type=int, default=2000, help="Gates per report")
+    parser.add_argument("--workers", type=int, default=2, help="Render worker processes")
+    parser.add_argument("--max-mib", type=float, default=4.0,
+                        help="Ceiling for the peak heap growth of this process")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"[memory] {args.downloads} concurrent PDF downloads, {args.gates} gates each")
+    print("=" * 60)
+
+    result = asyncio.run(check(args.downloads, args.gates, args.workers))
+    print(
+        f"  streamed {result['pdf_mib']:.1f} MiB in {result['elapsed_s']:.1f}s "
+        f"(largest PDF {result['largest_pdf_kib']:.0f} KiB)"
+    )
+    print(f"  peak heap growth {result['peak_mib']:.2f} MiB (ceiling {args.max_mib:.2f} MiB)")
+
+    if result["peak_mib"] > args.max_mib:
+        print("FAIL: concurrent downloads exceeded the memory ceiling")
+        sys.exit(1)
+    print("OK")
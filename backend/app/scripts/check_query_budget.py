@@ -0,0 +1,172 @@
+"""Query budget check - fails if API routes issue more SQL statements than their budget
+
+Drives the API in-process (httpx ASGI transport) against the configured database as a
+temporary assessor: creates an assessment on an existing framework, saves responses and
+submits it. Each budgeted request is issued twice and the statements of the second, warm
+one (user, framework index and summary caches populated, as in a busy worker) are counted
+by SQLInstrumentationMiddleware and compared with the route's budget.
+The assessment and the temporary user are deleted afterwards.
+
+Usage:
+    python -m app.scripts.check_query_budget
+    python -m app.scripts.check_query_budget --framework-id <uuid> --verbose
+"""
+
+import asyncio
+import sys
+import os
+import uuid
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+# Add parent directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx
+from sqlalchemy import delete, select
+
+from app.core.security import create_access_token
+from app.core.sql_stats import QueryStats, route_query_stats
+from app.database import SessionLocal
+from app.main import app
+from app.models import FrameworkDomain, FrameworkGate, FrameworkQuestion, User, UserRole
+
+# Statement budget of each route's warm request, keyed as SQLInstrumentationMiddleware
+# reports routes. Each is the count observed against a freshly migrated and seeded database
+# (`alembic upgrade head`, `seed_frameworks`); lower a budget when a route gets cheaper.
+BUDGETS: Dict[str, int] = {
+    "GET /api/frameworks/{framework_id}/structure": 0,  # Pre-serialized structure cache
+    "GET /api/assessments/": 1,
+    "POST /api/assessments/{assessment_id}/responses": 2,  # Locked ownership read + one CTE
+    "GET /api/assessments/{assessment_id}/score": 3,
+    "GET /api/assessments/{assessment_id}/report": 2,
+    "GET /api/analytics/summary": 0,  # Per-user summary cache
+}
+
+
+def _create_user() -> Tuple[UUID, str]:
+    """Temporary assessor; it has no usable password, requests use a minted token"""
+    email = f"query-budget-{uuid.uuid4().hex[:12]}@example.com"
+    with SessionLocal() as db:
+        user = User(
+            email=email, full_name="Query Budget Check", hashed_password="x",
+            role=UserRole.ASSESSOR,
+        )
+        db.add(user)
+        db.commit()
+        return user.id, email
+
+
+def _delete_user(user_id: UUID) -> None:
+    with SessionLocal() as db:
+        db.execute(delete(User).where(User.id == user_id))
+        db.commit()
+
+
+def _default_framework() -> Optional[UUID]:
+    """A framework with at least one question"""
+    with SessionLocal() as db:
+        return db.scalar(
+            select(FrameworkDomain.framework_id)
+            .join(FrameworkGate, FrameworkGate.domain_id == FrameworkDomain.id)
+            .join(FrameworkQuestion, FrameworkQuestion.gate_id == FrameworkGate.id)
+            .limit(1)
+        )
+
+
+async def check(framework_id: UUID, verbose: bool) -> bool:
+    """Run the scenario; True when every budgeted route stayed within its budget"""
+    observed: Dict[str, QueryStats] = {}
+
+    def observe(route: str, stats: QueryStats) -> None:
+        observed[route] = stats  # Last request of each route: the warm one
+
+    user_id, email = _create_user()
+    token = create_access_token({"sub": email})
+    route_query_stats.subscribe(observe)
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://query-budget-check",
+            headers={"Authorization": f"Bearer {token}"},
+        ) as client:
+
+            async def warm(method: str, url: str, **kwargs) -> httpx.Response:
+                """Issue a request twice; the second one is measured"""
+                for _ in range(2):
+                    response = await client.request(method, url, **kwargs)
+                    response.raise_for_status()
+                return response
+
+            structure = (await warm("GET", f"/api/frameworks/{framework_id}/structure")).json()
+            question_ids = [
+                question["id"]
+                for domain in structure["domains"]
+                for gate in domain["gates"]
+                for question in gate["questions"]
+            ]
+
+            response = await client.post(
+                "/api/assessments/",
+                json={"team_name": "Query Budget Check", "framework_id": str(framework_id)},
+            )
+            response.raise_for_status()
+            assessment_id = response.json()["id"]
+            try:
+                await warm("POST", f"/api/assessments/{assessment_id}/responses", json={
+                    "responses": [
+                        {"question_id": question_id, "score": i % 6}
+                        for i, question_id in enumerate(question_ids)
+                    ],
+                })
+                await warm("GET", f"/api/assessments/{assessment_id}/score")
+                (await client.post(f"/api/assessments/{assessment_id}/submit")).raise_for_status()
+                await warm("GET", f"/api/assessments/{assessment_id}/report")
+                await warm("GET", "/api/assessments/")
+                await warm("GET", "/api/analytics/summary")
+            finally:
+                await client.delete(f"/api/assessments/{assessment_id}")
+    finally:
+        route_query_stats.unsubscribe(observe)
+        _delete_user(user_id)
+
+    ok = True
+    for route, budget in BUDGETS.items():
+        stats = observed.get(route)
+        if stats is None:
+            print(f"  MISSING {route}: no request recorded")
+            ok = False
+            continue
+        within = stats.statement_count <= budget
+        ok &= within
+        print(
+            f"  {'ok  ' if within else 'FAIL'} {route}: "
+            f"{stats.statement_count} statements (budget {budget})"
+        )
+        if verbose or not within:
+            for statement, count in stats.statements.most_common():
+                print(f"         {count}x {' '.join(statement.split())[:160]}")
+    return ok
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check per-route SQL statement budgets")
+    parser.add_argument("--framework-id", type=UUID, help="Framework to assess (default: any)")
+    parser.add_argument("--verbose", action="store_true", help="Print every route's statements")
+
+    args = parser.parse_args()
+
+    framework_id = args.framework_id or _default_framework()
+    if framework_id is None:
+        print("No framework with questions found; seed the frameworks first")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"[budget] SQL statements per warm request, framework {framework_id}")
+    print("=" * 60)
+
+    ok = asyncio.run(check(framework_id, args.verbose))
+    print("All routes within budget" if ok else "Some routes exceeded their query budget")
+    sys.exit(0 if ok else 1)
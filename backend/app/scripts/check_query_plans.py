@@ -0,0 +1,244 @@
+"""Query plan check - confirms the hot API queries use indexes on a large dataset
+
+Loads a synthetic dataset (users, frameworks, assessments, domain scores and responses)
+inside a transaction, ANALYZEs it, then runs EXPLAIN on the statements the API issues and
+fails if any of them sequentially scans a table it should reach through an index.
+The transaction is rolled back at the end, so the database is left untouched.
+
+Usage:
+    python -m app.scripts.check_query_plans --assessments 50000 --users 1000 --verbose
+"""
+
+import json
+import sys
+import os
+from typing import Iterator, List, Tuple
+
+# Add parent directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+
+from app.api.analytics import _summary_query
+from app.core.framework_index import framework_fingerprint_query, framework_structure_query
+from app.database import engine
+from app.models import Assessment, DomainScore, GateResponse, User
+
+# Marker used for every synthetic row
+PREFIX = "plan-check"
+
+# Shape of each synthetic framework
+DOMAINS_PER_FRAMEWORK = 5
+GATES_PER_DOMAIN = 2
+QUESTIONS_PER_GATE = 2
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO users (id, email, full_name, hashed_password, role, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), :prefix || '-' || i || '@example.com', 'Plan Check ' || i, 'x',
+           'ASSESSOR'::userrole, true, now(), now()
+    FROM generate_series(1, :users) i
+    """,
+    """
+    INSERT INTO frameworks (id, name, version, created_at, updated_at)
+    SELECT gen_random_uuid(), :prefix || '-' || i, '1.0', now(), now()
+    FROM generate_series(1, :frameworks) i
+    """,
+    """
+    INSERT INTO framework_domains (id, framework_id, name, weight, "order", created_at, updated_at)
+    SELECT gen_random_uuid(), f.id, 'Domain ' || d, 1.0, d, now(), now()
+    FROM frameworks f CROSS JOIN generate_series(1, :domains) d
+    WHERE f.name LIKE :prefix || '-%'
+    """,
+    """
+    INSERT INTO framework_gates (id, domain_id, name, "order", created_at, updated_at)
+    SELECT gen_random_uuid(), fd.id, 'Gate ' || g, g, now(), now()
+    FROM framework_domains fd
+    JOIN frameworks f ON f.id = fd.framework_id
+    CROSS JOIN generate_series(1, :gates) g
+    WHERE f.name LIKE :prefix || '-%'
+    """,
+    """
+    INSERT INTO framework_questions (id, gate_id, text, "order", created_at, updated_at)
+    SELECT gen_random_uuid(), fg.id, 'Question ' || q, q, now(), now()
+    FROM framework_gates fg
+    JOIN framework_domains fd ON fd.id = fg.domain_id
+    JOIN frameworks f ON f.id = fd.framework_id
+    CROSS JOIN generate_series(1, :questions) q
+    WHERE f.name LIKE :prefix || '-%'
+    """,
+    """
+    WITH u AS (
+        SELECT id, row_number() OVER () - 1 AS rn FROM users WHERE email LIKE :prefix || '-%'
+    ), f AS (
+        SELECT id, row_number() OVER () - 1 AS rn FROM frameworks WHERE name LIKE :prefix || '-%'
+    )
+    INSERT INTO assessments
+        (id, assessor_id, framework_id, team_name, status, overall_score, maturity_level,
+         started_at, completed_at, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, f.id, :prefix || '-' || i,
+           CASE WHEN i % 4 = 0 THEN 'IN_PROGRESS' ELSE 'COMPLETED' END::assessmentstatus,
+           CASE WHEN i % 4 = 0 THEN NULL ELSE random() * 100 END,
+           CASE WHEN i % 4 = 0 THEN NULL ELSE 1 + (random() * 4)::int END,
+           now() - (i % 730) * interval '1 day',
+           CASE WHEN i % 4 = 0 THEN NULL ELSE now() - (i % 730) * interval '1 day' END,
+           now() - (i % 730) * interval '1 day', now()
+    FROM generate_series(1, :assessments) i
+    JOIN u ON u.rn = i % :users
+    JOIN f ON f.rn = i % :frameworks
+    """,
+    """
+    INSERT INTO domain_scores
+        (id, assessment_id, domain_id, score, maturity_level, created_at, updated_at)
+    SELECT gen_random_uuid(), a.id, fd.id, random() * 100, 1 + (random() * 4)::int, now(), now()
+    FROM assessments a
+    JOIN framework_domains fd ON fd.framework_id = a.framework_id
+    WHERE a.team_name LIKE :prefix || '-%' AND a.status = 'COMPLETED'
+    """,
+    """
+    INSERT INTO gate_responses (id, assessment_id, question_id, score, created_at, updated_at)
+    SELECT gen_random_uuid(), a.id, fq.id, (random() * 5)::int, now(), now()
+    FROM assessments a
+    JOIN framework_domains fd ON fd.framework_id = a.framework_id
+    JOIN framework_gates fg ON fg.domain_id = fd.id
+    JOIN framework_questions fq ON fq.gate_id = fg.id
+    WHERE a.team_name LIKE :prefix || '-%'
+    """,
+]
+
+ANALYZED_TABLES = [
+    "users", "frameworks", "framework_domains", "framework_gates", "framework_questions",
+    "assessments", "domain_scores", "gate_responses",
+]
+
+
+def seed(conn: Connection, users: int, frameworks: int, assessments: int) -> None:
+    """Insert the synthetic dataset and refresh planner statistics"""
+    params = {
+        "prefix": PREFIX,
+        "users": users,
+        "frameworks": frameworks,
+        "assessments": assessments,
+        "domains": DOMAINS_PER_FRAMEWORK,
+        "gates": GATES_PER_DOMAIN,
+        "questions": QUESTIONS_PER_GATE,
+    }
+    for statement in SEED_STATEMENTS:
+        conn.execute(text(statement), params)
+    for table in ANALYZED_TABLES:
+        conn.execute(text(f"ANALYZE {table}"))
+
+
+def build_checks(conn: Connection) -> List[Tuple[str, object, List[str]]]:
+    """(label, statement, tables that must be reached through an index) for each API query"""
+    user_id, email = conn.execute(
+        text("SELECT id, email FROM users WHERE email LIKE :p ORDER BY email LIMIT 1"),
+        {"p": f"{PREFIX}-%"},
+    ).one()
+    assessment_id, framework_id = conn.execute(
+        text("SELECT id, framework_id FROM assessments WHERE assessor_id = :u LIMIT 1"),
+        {"u": user_id},
+    ).one()
+
+    return [
+        ("auth: user by email",
+         select(User).where(User.email == email),
+         ["users"]),
+        ("assessments: list",
+         select(Assessment)
+         .where(Assessment.assessor_id == user_id)
+         .order_by(Assessment.created_at.desc(), Assessment.id.desc())
+         .limit(101),
+         ["assessments"]),
+        ("assessments: responses",
+         select(GateResponse).where(GateResponse.assessment_id == assessment_id),
+         ["gate_responses"]),
+        ("assessments: domain scores",
+         select(DomainScore).where(DomainScore.assessment_id == assessment_id),
+         ["domain_scores"]),
+        ("analytics: summary",
+         _summary_query(user_id),
+         ["assessments", "domain_scores"]),
+        ("frameworks: structure",
+         framework_structure_query(framework_id),
+         ["framework_domains", "framework_gates", "framework_questions"]),
+        ("frameworks: index fingerprint",
+         framework_fingerprint_query(framework_id),
+         ["frameworks", "framework_domains", "framework_gates", "framework_questions"]),
+    ]
+
+
+def _plan_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def explain(conn: Connection, statement) -> dict:
+    """EXPLAIN a SQLAlchemy statement and return the root plan node"""
+    # Inline the parameters so the planner sees the same values the API would bind
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def check_plans(conn: Connection, verbose: bool = False) -> bool:
+    """Run every check and print its result; returns True if all pass"""
+    all_ok = True
+
+    for label, statement, indexed_tables in build_checks(conn):
+        root = explain(conn, statement)
+        scans = [
+            (node["Relation Name"], node["Node Type"])
+            for node in _plan_nodes(root)
+            if "Relation Name" in node
+        ]
+        seq_scanned = sorted({
+            table for table, node_type in scans
+            if table in indexed_tables and node_type == "Seq Scan"
+        })
+        ok = not seq_scanned
+        all_ok = all_ok and ok
+
+        print(f"  [{'OK' if ok else 'FAIL'}] {label}")
+        if seq_scanned:
+            print(f"         sequential scan on: {', '.join(seq_scanned)}")
+        if verbose or not ok:
+            for table, node_type in scans:
+                print(f"         {node_type:<18} {table}")
+
+    return all_ok
+
+
+def main(users: int, frameworks: int, assessments: int, verbose: bool) -> bool:
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            print(f"[plans] Seeding {users} users, {frameworks} frameworks, "
+                  f"{assessments} assessments (rolled back afterwards)...")
+            seed(conn, users, frameworks, assessments)
+            print("[plans] Checking query plans...")
+            return check_plans(conn, verbose)
+        finally:
+            transaction.rollback()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check that hot API queries use indexes")
+    parser.add_argument("--users", type=int, default=1000, help="Synthetic assessors")
+    parser.add_argument("--frameworks", type=int, default=500, help="Synthetic frameworks")
+    parser.add_argument("--assessments", type=int, default=50000, help="Synthetic assessments")
+    parser.add_argument("--verbose", action="store_true", help="Print every scan node")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    ok = main(args.users, args.frameworks, args.assessments, args.verbose)
+    print("=" * 60)
+    print("All query plans use indexes" if ok else "Some queries fall back to sequential scans")
+    sys.exit(0 if ok else 1)
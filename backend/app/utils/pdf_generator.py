@@ -1,8 +1,11 @@
 """PDF Report Generator for DevOps Maturity Assessments"""
 
+import threading
 from datetime import datetime
+from functools import cache
 from io import BytesIO
-from typing import Dict, List, Any
+from typing import Any, BinaryIO, Dict, Iterator, List, Union
+from xml.sax.saxutils import escape
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -37,84 +40,19 @@ class PDFReportGenerator:
         5: colors.HexColor('#16a34a'),  # Green - Optimizing
     }
 
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Create custom paragraph styles."""
-        self.styles.add(ParagraphStyle(
-            name='ReportTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=self.COLORS['primary'],
-            spaceAfter=6,
-            alignment=TA_CENTER,
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='ReportSubtitle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=self.COLORS['muted'],
-            alignment=TA_CENTER,
-            spaceAfter=20,
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=self.COLORS['primary'],
-            spaceBefore=16,
-            spaceAfter=8,
-            borderColor=self.COLORS['border'],
-            borderWidth=1,
-            borderPadding=4,
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='DomainHeader',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            textColor=colors.black,
-            spaceBefore=8,
-            spaceAfter=4,
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='StrengthItem',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=self.COLORS['success'],
-            leftIndent=12,
-            spaceBefore=2,
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='GapItem',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=self.COLORS['warning'],
-            leftIndent=12,
-            spaceBefore=2,
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='RecommendationItem',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.black,
-            leftIndent=20,
-            spaceBefore=4,
-        ))
+    # Layout shared by every report
+    PAGE_MARGINS = {
+        'rightMargin': 0.75 * inch,
+        'leftMargin': 0.75 * inch,
+        'topMargin': 0.75 * inch,
+        'bottomMargin': 0.75 * inch,
+    }
 
-        self.styles.add(ParagraphStyle(
-            name='SmallText',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            textColor=self.COLORS['muted'],
-        ))
+    def __init__(self):
+        # Styles and table styles are built once per process and shared; flowables keep
+        # layout state, so they are created per report
+        self.styles = _stylesheet()
+        self.table_styles = _table_styles()
 
     def generate(self, report_data: Dict[str, Any]) -> bytes:
         """
@@ -127,14 +65,16 @@ class PDFReportGenerator:
             PDF file as bytes
         """
         buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
+        self.write(report_data, buffer)
+        return buffer.getvalue()
+
+    def write(self, report_data: Dict[str, Any], output: Union[str, BinaryIO]) -> None:
+        """
+        Render a report into a file path or writable binary file object.
+
+        Rendering to a path skips the in-memory buffer and the copy `generate` returns.
+        """
+        doc = SimpleDocTemplate(output, pagesize=letter, **self.PAGE_MARGINS)
 
         story = []
 
@@ -149,7 +89,6 @@ class PDFReportGenerator:
         story.extend(self._build_footer(report_data))
 
         doc.build(story)
-        return buffer.getvalue()
 
     def _build_header(self, report_data: Dict) -> List:
         """Build report header section."""
@@ -194,31 +133,16 @@ class PDFReportGenerator:
         elements.append(Paragraph('Executive Summary', self.styles['SectionHeader']))
 
         # Score table
-        score_color = self.MATURITY_COLORS.get(level, self.COLORS['muted'])
-
         score_data = [
             [
-                Paragraph(f'<b>{overall_score:.1f}</b>',
-                         ParagraphStyle('ScoreNum', parent=self.styles['Normal'],
-                                       fontSize=36, textColor=score_color, alignment=TA_CENTER)),
+                Paragraph(f'<b>{overall_score:.1f}</b>', _score_style(level)),
                 Paragraph(f'<b>Level {level}: {level_name}</b><br/><font size="10">{level_desc}</font>',
-                         ParagraphStyle('LevelDesc', parent=self.styles['Normal'],
-                                       fontSize=14, alignment=TA_LEFT)),
+                         self.styles['LevelDesc']),
             ]
         ]
 
         score_table = Table(score_data, colWidths=[1.5*inch, 4.5*inch])
-        score_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-            ('ALIGN', (1, 0), (1, 0), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 0), (-1, -1), self.COLORS['background']),
-            ('BOX', (0, 0), (-1, -1), 1, self.COLORS['border']),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ]))
+        score_table.setStyle(self.table_styles['score'])
 
         elements.append(score_table)
         elements.append(Spacer(1, 12))
@@ -256,26 +180,7 @@ class PDFReportGenerator:
             ])
 
         domain_table = Table(table_data, colWidths=[2.5*inch, 1*inch, 1*inch, 2*inch])
-        domain_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.COLORS['primary']),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, self.COLORS['border']),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-        ]))
+        domain_table.setStyle(self.table_styles['domain'])
 
         elements.append(domain_table)
         elements.append(Spacer(1, 12))
@@ -310,26 +215,7 @@ class PDFReportGenerator:
             ])
 
         gate_table = Table(table_data, colWidths=[3.5*inch, 1*inch, 1*inch, 1*inch])
-        gate_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.COLORS['primary']),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('TOPPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, self.COLORS['border']),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 1), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 4),
-        ]))
+        gate_table.setStyle(self.table_styles['gate'])
 
         elements.append(gate_table)
         elements.append(Spacer(1, 12))
@@ -405,3 +291,433 @@ class PDFReportGenerator:
         ))
 
         return elements
+
+
+class _LazyStory:
+    """
+    Story for doc.build() that pulls sections from an iterator as the build consumes them.
+
+    build() only reads and edits the front of its story (popping drawn flowables, pushing
+    split remainders back), so only the section being laid out is held in memory rather than
+    every flowable of the document.
+    """
+
+    def __init__(self, sections: Iterator[List]):
+        self._sections = sections
+        self._flowables: List = []
+
+    def _fill(self, count: int) -> None:
+        while len(self._flowables) < count:
+            section = next(self._sections, None)
+            if section is None:
+                return
+            self._flowables.extend(section)
+
+    def __len__(self) -> int:
+        self._fill(1)
+        return len(self._flowables)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._fill(index.stop or 0)
+        else:
+            self._fill(index + 1)
+        return self._flowables[index]
+
+    def __setitem__(self, index, value) -> None:
+        self._flowables[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._flowables[index]
+
+    def insert(self, index: int, flowable) -> None:
+        self._flowables.insert(index, flowable)
+
+
+class OrganizationPDFReportGenerator(PDFReportGenerator):
+    """Generates the consolidated PDF report of an organization's teams."""
+
+    # Light maturity level colors for heat table cells
+    HEAT_COLORS = {
+        1: colors.HexColor('#fee2e2'),  # Red-100
+        2: colors.HexColor('#ffedd5'),  # Orange-100
+        3: colors.HexColor('#fef9c3'),  # Yellow-100
+        4: colors.HexColor('#dbeafe'),  # Blue-100
+        5: colors.HexColor('#dcfce7'),  # Green-100
+    }
+
+    # Table rows per flowable, so a long table is laid out (and released) a page at a time
+    ROWS_PER_TABLE = 35
+
+    def write(self, report_data: Dict[str, Any], output: Union[str, BinaryIO]) -> None:
+        """
+        Render an OrganizationReport into a file path or writable binary file object.
+
+        Sections are generated while the document is laid out, one team or table chunk at a
+        time, so the story never holds every team's flowables at once.
+        """
+        doc = SimpleDocTemplate(output, pagesize=letter, pageCompression=1, **self.PAGE_MARGINS)
+        title = report_data.get('organization_name', '')  # Drawn as plain text
+        doc.build(
+            _LazyStory(self._sections(report_data)),
+            onFirstPage=lambda canvas, doc: self._draw_page_footer(canvas, doc, title),
+            onLaterPages=lambda canvas, doc: self._draw_page_footer(canvas, doc, title),
+        )
+
+    def _sections(self, report_data: Dict) -> Iterator[List]:
+        """Document sections in order, built on demand."""
+        yield self._build_org_header(report_data)
+        yield self._build_org_summary(report_data)
+        yield from self._build_domain_heat(report_data)
+        yield from self._build_gate_comparison(report_data)
+        yield from self._build_team_summaries(report_data)
+        yield self._build_footer(report_data)
+
+    def _draw_page_footer(self, canvas, doc, title: str) -> None:
+        """Draw the organization name and page number at the bottom of each page."""
+        canvas.saveState()
+        canvas.setFont('Helvetica', 8)
+        canvas.setFillColor(self.COLORS['muted'])
+        canvas.drawString(doc.leftMargin, 0.5 * inch, title)
+        canvas.drawRightString(
+            doc.pagesize[0] - doc.rightMargin, 0.5 * inch, f'Page {doc.page}'
+        )
+        canvas.restoreState()
+
+    def _chunks(self, rows: List) -> Iterator[List]:
+        for start in range(0, len(rows), self.ROWS_PER_TABLE):
+            yield rows[start:start + self.ROWS_PER_TABLE]
+
+    def _build_org_header(self, report_data: Dict) -> List:
+        """Build report header section."""
+        framework = escape(
+            f"{report_data.get('framework_name', '')} {report_data.get('framework_version', '')}"
+        )
+        return [
+            Paragraph('Organization Maturity Report', self.styles['ReportTitle']),
+            Paragraph(escape(report_data.get('organization_name', '')),
+                      self.styles['ReportSubtitle']),
+            Paragraph(
+                f"Framework: {framework} | {datetime.utcnow().strftime('%B %d, %Y')}",
+                self.styles['SmallText'],
+            ),
+            Spacer(1, 12),
+            HRFlowable(width="100%", thickness=1, color=self.COLORS['border']),
+            Spacer(1, 12),
+        ]
+
+    def _build_org_summary(self, report_data: Dict) -> List:
+        """Build summary section: average score, maturity distribution and domain ranges."""
+        maturity_level = report_data.get('maturity_level', {})
+        elements = self._build_executive_summary({
+            'assessment': {'overall_score': report_data.get('average_score', 0)},
+            'maturity_level': maturity_level,
+        })
+
+        team_count = report_data.get('team_count', 0)
+        distribution = report_data.get('maturity_distribution', [0] * 5)
+        elements.append(Paragraph(
+            f'Average of the latest completed assessment of {team_count} teams.',
+            self.styles['SmallText'],
+        ))
+        elements.append(Spacer(1, 8))
+
+        table_data = [
+            ['Level'] + [f'Level {level}' for level in range(1, 6)],
+            ['Teams'] + [str(count) for count in distribution],
+        ]
+        table = Table(table_data, colWidths=[1*inch] + [1.1*inch] * 5)
+        table.setStyle(self.table_styles['gate'])
+        elements.append(table)
+        elements.append(Spacer(1, 12))
+
+        domains = report_data.get('domains', [])
+        if domains:
+            elements.append(Paragraph('Domain Scores Across Teams', self.styles['SectionHeader']))
+            table_data = [['Domain', 'Average', 'Lowest', 'Highest']]
+            for domain in domains:
+                table_data.append([
+                    domain.get('domain', 'Unknown'),
+                    f"{domain.get('average_score', 0):.1f}%",
+                    f"{domain.get('min_score', 0):.1f}%",
+                    f"{domain.get('max_score', 0):.1f}%",
+                ])
+            table = Table(table_data, colWidths=[3*inch, 1.2*inch, 1.2*inch, 1.2*inch])
+            table.setStyle(self.table_styles['domain'])
+            elements.append(table)
+            elements.append(Spacer(1, 12))
+
+        return elements
+
+    def _build_domain_heat(self, report_data: Dict) -> Iterator[List]:
+        """Build domain heat table: one row per team, cells colored by maturity level."""
+        domains = report_data.get('domains', [])
+        teams = report_data.get('teams', [])
+        if not domains or not teams:
+            return
+
+        yield [Paragraph('Domain Heat Map', self.styles['SectionHeader'])]
+
+        header = ['Team'] + [
+            Paragraph(f"<b>{escape(domain.get('domain', ''))}</b>", _heat_header_style())
+            for domain in domains
+        ] + ['Overall']
+        domain_width = 4.5 * inch / len(domains)
+        col_widths = [1.6*inch] + [domain_width] * len(domains) + [0.9*inch]
+
+        for chunk in self._chunks(teams):
+            table_data = [header]
+            cell_styles = []
+            for row, team in enumerate(chunk, 1):
+                cells = []
+                for column, (score, level) in enumerate(
+                    zip(team.get('domain_scores', []), team.get('domain_levels', [])), 1
+                ):
+                    cells.append('-' if score is None else f'{score:.0f}')
+                    if level in self.HEAT_COLORS:
+                        cell_styles.append(
+                            ('BACKGROUND', (column, row), (column, row), self.HEAT_COLORS[level])
+                        )
+                table_data.append(
+                    [team.get('team_name', '')] + cells + [f"{team.get('overall_score', 0):.1f}"]
+                )
+
+            table = Table(table_data, colWidths=col_widths, repeatRows=1)
+            table.setStyle(self.table_styles['gate'])
+            table.setStyle(TableStyle(cell_styles))
+            yield [table, Spacer(1, 12)]
+
+    def _build_gate_comparison(self, report_data: Dict) -> Iterator[List]:
+        """Build gate comparison: score ranges across teams per gate."""
+        gates = report_data.get('gates', [])
+        if not gates:
+            return
+
+        yield [Paragraph('Gate Comparison', self.styles['SectionHeader'])]
+
+        header = ['Gate', 'Domain', 'Average', 'Lowest', 'Highest', 'Under 50%']
+        for chunk in self._chunks(gates):
+            table_data = [header]
+            for gate in chunk:
+                table_data.append([
+                    gate.get('gate_name', 'Unknown'),
+                    gate.get('domain', ''),
+                    f"{gate.get('average_percentage', 0):.0f}%",
+                    f"{gate.get('min_percentage', 0):.0f}%",
+                    f"{gate.get('max_percentage', 0):.0f}%",
+                    f"{gate.get('teams_below_half', 0)}/{gate.get('teams', 0)}",
+                ])
+            table = Table(
+                table_data,
+                colWidths=[2.2*inch, 1.4*inch, 0.8*inch, 0.7*inch, 0.7*inch, 0.9*inch],
+                repeatRows=1,
+            )
+            table.setStyle(self.table_styles['gate'])
+            yield [table, Spacer(1, 12)]
+
+    def _build_team_summaries(self, report_data: Dict) -> Iterator[List]:
+        """Build one summary block per team."""
+        teams = report_data.get('teams', [])
+        if not teams:
+            return
+
+        yield [Paragraph('Team Summaries', self.styles['SectionHeader'])]
+
+        for team in teams:
+            level = team.get('maturity_level', 1)
+            elements = [
+                Paragraph(
+                    f"{escape(team.get('team_name', 'Unknown Team'))} - "
+                    f"{team.get('overall_score', 0):.1f} (Level {level})",
+                    self.styles['DomainHeader'],
+                ),
+            ]
+            for strength in team.get('strengths', []):
+                elements.append(Paragraph(f'✓ {escape(strength)}', self.styles['StrengthItem']))
+            for gap in team.get('gaps', []):
+                elements.append(Paragraph(f'⚠ {escape(gap)}', self.styles['GapItem']))
+            elements.append(Spacer(1, 6))
+            yield [KeepTogether(elements)]
+
+
+_local = threading.local()
+
+
+# Generator class by report kind
+GENERATORS = {
+    'assessment': PDFReportGenerator,
+    'organization': OrganizationPDFReportGenerator,
+}
+
+
+def get_generator(kind: str = 'assessment') -> PDFReportGenerator:
+    """Warm generator of the current thread (flowables are stateful while a build runs)"""
+    generators = getattr(_local, 'generators', None)
+    if generators is None:
+        generators = _local.generators = {}
+    generator = generators.get(kind)
+    if generator is None:
+        generator = generators[kind] = GENERATORS[kind]()
+    return generator
+
+
+@cache
+def _stylesheet():
+    """Sample stylesheet extended with the report's paragraph styles, built once per process"""
+    palette = PDFReportGenerator.COLORS
+    styles = getSampleStyleSheet()
+
+    styles.add(ParagraphStyle(
+        name='ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=palette['primary'],
+        spaceAfter=6,
+        alignment=TA_CENTER,
+    ))
+
+    styles.add(ParagraphStyle(
+        name='ReportSubtitle',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=palette['muted'],
+        alignment=TA_CENTER,
+        spaceAfter=20,
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=palette['primary'],
+        spaceBefore=16,
+        spaceAfter=8,
+        borderColor=palette['border'],
+        borderWidth=1,
+        borderPadding=4,
+    ))
+
+    styles.add(ParagraphStyle(
+        name='DomainHeader',
+        parent=styles['Heading3'],
+        fontSize=12,
+        textColor=colors.black,
+        spaceBefore=8,
+        spaceAfter=4,
+    ))
+
+    styles.add(ParagraphStyle(
+        name='StrengthItem',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=palette['success'],
+        leftIndent=12,
+        spaceBefore=2,
+    ))
+
+    styles.add(ParagraphStyle(
+        name='GapItem',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=palette['warning'],
+        leftIndent=12,
+        spaceBefore=2,
+    ))
+
+    styles.add(ParagraphStyle(
+        name='RecommendationItem',
+        parent=styles['Normal'],
+        fontSize=10,
+        textColor=colors.black,
+        leftIndent=20,
+        spaceBefore=4,
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SmallText',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=palette['muted'],
+    ))
+
+    styles.add(ParagraphStyle(
+        name='LevelDesc',
+        parent=styles['Normal'],
+        fontSize=14,
+        alignment=TA_LEFT,
+    ))
+
+    return styles
+
+
+@cache
+def _heat_header_style() -> ParagraphStyle:
+    """Heat table domain header cells (white on the header background)"""
+    return ParagraphStyle(
+        'HeatHeader',
+        parent=_stylesheet()['Normal'],
+        fontSize=8,
+        leading=10,
+        textColor=colors.white,
+        alignment=TA_CENTER,
+    )
+
+
+@cache
+def _score_style(level: int) -> ParagraphStyle:
+    """Overall score style, colored by maturity level"""
+    return ParagraphStyle(
+        'ScoreNum',
+        parent=_stylesheet()['Normal'],
+        fontSize=36,
+        textColor=PDFReportGenerator.MATURITY_COLORS.get(
+            level, PDFReportGenerator.COLORS['muted']
+        ),
+        alignment=TA_CENTER,
+    )
+
+
+def _data_table_style(row_padding: int) -> TableStyle:
+    """Header-row table style shared by the domain and gate tables"""
+    palette = PDFReportGenerator.COLORS
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), palette['primary']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('TOPPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+        ('GRID', (0, 0), (-1, -1), 0.5, palette['border']),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 1), (-1, -1), row_padding),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), row_padding),
+    ])
+
+
+@cache
+def _table_styles() -> Dict[str, TableStyle]:
+    """Table styles by table, built once per process"""
+    palette = PDFReportGenerator.COLORS
+    return {
+        'score': TableStyle([
+            ('ALIGN', (0, 0), (0, 0), 'CENTER'),
+            ('ALIGN', (1, 0), (1, 0), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BACKGROUND', (0, 0), (-1, -1), palette['background']),
+            ('BOX', (0, 0), (-1, -1), 1, palette['border']),
+            ('LEFTPADDING', (0, 0), (-1, -1), 12),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+            ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ]),
+        'domain': _data_table_style(row_padding=6),
+        'gate': _data_table_style(row_padding=4),
+    }
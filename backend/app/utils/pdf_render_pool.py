@@ -0,0 +1,264 @@
+"""Out-of-process PDF rendering with an on-disk result cache"""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional
+
+from app import schemas
+from app.config import settings
+from app.core import metrics
+
+# Read size when streaming a cached PDF to a client
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Scratch files older than this are left over from a crashed or abandoned render
+TEMP_FILE_MAX_AGE_SECONDS = 3600
+
+
+def _warm_worker() -> None:
+    """Import ReportLab and render a throwaway report so a worker's first real render is warm"""
+    from app.utils.pdf_generator import get_generator
+
+    get_generator().generate({})
+
+
+def _render_pdf(report_json: str, path: str, kind: str) -> None:
+    """Render a serialized report to a file in a worker process with its reusable generator"""
+    from app.utils.pdf_generator import get_generator
+
+    get_generator(kind).write(json.loads(report_json), path)
+
+
+def stream_file(pdf: BinaryIO) -> Iterator[bytes]:
+    """Chunks of an open file for a streaming response, closing it when done"""
+    with pdf:
+        while chunk := pdf.read(STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+def content_hash(report_json: str) -> str:
+    """Content hash of a serialized report, used as the PDF cache key"""
+    return hashlib.sha256(report_json.encode("utf-8")).hexdigest()
+
+
+def report_content_hash(report: schemas.AssessmentReport) -> str:
+    """Content hash of a report payload, used as the PDF cache key"""
+    return content_hash(report.model_dump_json())
+
+
+class PDFCache:
+    """
+    Directory of rendered PDFs keyed by report content hash.
+
+    Files older than `max_age_seconds` (by write time, st_mtime) are dropped, then the least
+    recently used files (by last hit, st_atime) are evicted until the directory fits in
+    `max_bytes`. Stale scratch files of unfinished renders are swept along the way.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, max_age_seconds: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached file for a key, or None on a miss"""
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        if time.time() - stat.st_mtime > self.max_age_seconds:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+                self.evictions += 1
+            return None
+
+        # Bump access time for LRU ordering, keeping the write time for age checks
+        os.utime(path, (time.time(), stat.st_mtime))
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def temp_path(self, key: str) -> Path:
+        """Unique scratch file in the cache directory to render into before `commit`"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self._path(key).with_suffix(f".{os.getpid()}.{uuid.uuid4().hex}.tmp")
+
+    def commit(self, key: str, tmp_path: Path) -> Path:
+        """Atomically move a rendered scratch file into place and enforce size/age limits"""
+        path = self._path(key)
+        os.replace(tmp_path, path)
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Drop expired files, then least recently used files over the size limit"""
+        now = time.time()
+        for path in self.directory.glob("*.tmp"):
+            try:
+                if now - path.stat().st_mtime > TEMP_FILE_MAX_AGE_SECONDS:
+                    path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
+
+        entries = []
+        for path in self.directory.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total = sum(size for _, _, size, _ in entries)
+        evicted = 0
+
+        for _, mtime, size, path in entries:
+            expired = now - mtime > self.max_age_seconds
+            if path == keep or (not expired and total <= self.max_bytes):
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self.evictions += evicted
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class PDFRenderPool:
+    """Bounded process pool that renders reports and caches the resulting files"""
+
+    def __init__(self, cache: PDFCache, max_workers: int, max_pending: int):
+        self.cache = cache
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Caps renders queued on the pool; further misses wait here instead
+        self._slots = asyncio.Semaphore(max_pending)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: never fork a process holding an event loop and DB connections
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return self._executor
+
+    async def render(
+        self, report_json: str, key: Optional[str] = None, kind: str = "assessment"
+    ) -> Path:
+        """
+        Get the PDF file for a serialized report, rendering it in the pool on a cache miss.
+
+        `kind` selects the generator: "assessment" for an AssessmentReport, "organization"
+        for an OrganizationReport. `key` may be passed when the report's content hash is
+        already known. The JSON is handed to the worker as-is, so this process never holds
+        a parsed copy of the report.
+        """
+        key = key or content_hash(report_json)
+
+        # stat and utime are disk I/O; keep them off the event loop like the rest of the cache
+        path = await asyncio.to_thread(self.cache.get, key)
+        if path is not None:
+            return path
+
+        # Concurrent requests for the same report share one render. It runs as its own task,
+        # so a caller that is cancelled (client gone) stops waiting without cancelling the
+        # render for the others
+        pending = self._in_flight.get(key)
+        if pending is None:
+            pending = asyncio.create_task(self._render(report_json, key, kind))
+            self._in_flight[key] = pending
+            pending.add_done_callback(lambda task: self._finish(key, task))
+        return await asyncio.shield(pending)
+
+    async def open(
+        self, report_json: str, key: Optional[str] = None, kind: str = "assessment"
+    ) -> BinaryIO:
+        """
+        Render (or reuse) a report's cached PDF and open it.
+
+        The open handle keeps the file readable even if the cache evicts it before it is sent.
+        """
+        for attempt in range(2):
+            path = await self.render(report_json, key=key, kind=kind)
+            try:
+                return await asyncio.to_thread(open, path, "rb")
+            except FileNotFoundError:
+                if attempt:
+                    raise  # Evicted twice between render and open
+
+    async def _render(self, report_json: str, key: str, kind: str) -> Path:
+        # The worker writes the PDF straight to disk, so its bytes never pass through (or are
+        # copied in) this process; the response then streams the file in chunks
+        tmp_path = self.cache.temp_path(key)
+        try:
+            async with self._slots:
+                with metrics.pdf_render_duration_seconds.time():
+                    rendering = self._get_executor().submit(
+                        _render_pdf, report_json, str(tmp_path), kind
+                    )
+                    try:
+                        await asyncio.wrap_future(rendering)
+                    except asyncio.CancelledError:
+                        # A running worker is not stopped and writes the file after the
+                        # cleanup below; remove it once the worker is done
+                        rendering.add_done_callback(lambda _: tmp_path.unlink(missing_ok=True))
+                        raise
+            return await asyncio.to_thread(self.cache.commit, key, tmp_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        del self._in_flight[key]
+        if not task.cancelled():
+            # Mark retrieved: a failure is raised to its waiters, if any are left
+            task.exception()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+pdf_cache = PDFCache(
+    directory=settings.PDF_CACHE_DIR,
+    max_bytes=settings.PDF_CACHE_MAX_BYTES,
+    max_age_seconds=settings.PDF_CACHE_MAX_AGE_SECONDS,
+)
+
+pdf_render_pool = PDFRenderPool(
+    cache=pdf_cache,
+    max_workers=settings.PDF_RENDER_WORKERS,
+    max_pending=settings.PDF_RENDER_MAX_PENDING,
+)
+
+metrics.pdf_cache_events_total.set_function(
+    lambda: {(event,): count for event, count in pdf_cache.stats().items()}
+)